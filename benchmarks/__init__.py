@@ -0,0 +1,6 @@
+"""Food Review API benchmark suite.
+
+Synthetic reviews datasets are generated at several sizes, and the time and memory
+used to load them, and the latency of the API endpoints serving them, are recorded
+as JSON results which can be compared against a baseline run.
+"""
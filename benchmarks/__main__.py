@@ -0,0 +1,225 @@
+"""Food Review API benchmark suite entrypoint.
+
+Usage:
+    python -m benchmarks generate --rows 100000 --output data/reviews_100k.csv
+    python -m benchmarks run --sizes 10000 100000 --output results.json
+    python -m benchmarks run --baseline baseline.json
+    python -m benchmarks compare results.json baseline.json
+    python -m benchmarks replay recordings/requests.jsonl --concurrency 20
+"""
+
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks.compare import compare_results, format_comparisons
+from benchmarks.compression import benchmark_compression
+from benchmarks.endpoints import benchmark_endpoints
+from benchmarks.generator import write_reviews_csv
+from benchmarks.instrumentation import benchmark_metrics_overhead
+from benchmarks.load import benchmark_load
+from benchmarks.replay import format_report, read_recording, replay
+from food_review_api.api import build_service_app
+from food_review_api.core.config import Configuration
+from food_review_api.products import product_repository
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_DATA_DIR = Path(".benchmarks/data")
+DEFAULT_OUTPUT = Path(".benchmarks/results.json")
+
+logger = logging.getLogger("benchmarks")
+
+
+def parse_args(argv: list[str] | None = None) -> Namespace:
+    """Parse the command line arguments of the benchmark suite.
+
+    Args:
+        argv: The command line arguments, `sys.argv` if not provided.
+
+    Returns:
+        Namespace: The parsed arguments.
+    """
+    parser = ArgumentParser(
+        prog="benchmarks", description="Food Review API benchmark suite."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser(
+        "generate", help="Generate a synthetic reviews CSV file."
+    )
+    generate_parser.add_argument("--rows", type=int, required=True)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("--output", type=Path, required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="Run the load and endpoint benchmarks on synthetic datasets."
+    )
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    run_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--requests", type=int, default=200)
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument("--load-workers", type=int, default=1)
+    run_parser.add_argument("--skip-load", action="store_true")
+    run_parser.add_argument("--skip-endpoints", action="store_true")
+    run_parser.add_argument("--skip-compression", action="store_true")
+    run_parser.add_argument("--baseline", type=Path)
+    run_parser.add_argument("--threshold", type=float, default=0.2)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare benchmark results against a baseline."
+    )
+    compare_parser.add_argument("results", type=Path)
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+
+    replay_parser = commands.add_parser(
+        "replay", help="Replay requests recorded by the recording middleware."
+    )
+    replay_parser.add_argument("recording", type=Path)
+    replay_parser.add_argument(
+        "--url",
+        help="URL of a running API, e.g. http://localhost:8000. The API is run "
+        "in-process with the configured database if not set.",
+    )
+    replay_parser.add_argument("--concurrency", type=int, default=10)
+    replay_parser.add_argument(
+        "--rate",
+        type=float,
+        help="Requests per second, the recorded times between requests if not set.",
+    )
+    replay_parser.add_argument("--speedup", type=float, default=1.0)
+    replay_parser.add_argument("--output", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Benchmark suite main entrypoint.
+
+    Returns:
+        int: The exit status, 1 if results regressed against the baseline.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    # Every benchmarked request would be logged otherwise.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.command == "generate":
+        write_reviews_csv(args.output, args.rows, seed=args.seed)
+        logger.info("Generated %d reviews in %s.", args.rows, args.output)
+        return 0
+    if args.command == "replay":
+        report = run_replay(args)
+        print(format_report(report))
+        if args.output is not None:
+            args.output.write_text(json.dumps(report, indent=2))
+        return 0
+    if args.command == "run":
+        results = run_benchmarks(args)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        logger.info("Wrote benchmark results to %s.", args.output)
+        if args.baseline is None:
+            return 0
+        baseline = json.loads(args.baseline.read_text())
+    else:
+        results = json.loads(args.results.read_text())
+        baseline = json.loads(args.baseline.read_text())
+    comparisons = compare_results(results, baseline, threshold=args.threshold)
+    print(format_comparisons(comparisons))
+    return int(any(comparison["regression"] for comparison in comparisons))
+
+
+def run_benchmarks(args: Namespace) -> dict[str, Any]:
+    """Run the benchmarks on a synthetic dataset of each size.
+
+    Datasets are generated in the data directory, and reused by later runs with the
+    same size and seed. The overhead of the request metrics instrumentation is
+    measured once, independently of the datasets.
+
+    Returns:
+        dict[str, Any]: The run metadata, the instrumentation overhead and the
+        results of each dataset.
+    """
+    datasets = []
+    for rows in args.sizes:
+        filename = args.data_dir / f"reviews_{rows}_{args.seed}.csv"
+        if not filename.exists():
+            logger.info("Generating %d reviews in %s.", rows, filename)
+            write_reviews_csv(filename, rows, seed=args.seed)
+        dataset: dict[str, Any] = {"rows": rows, "seed": args.seed}
+        if not args.skip_load:
+            logger.info("Benchmarking load of %d reviews.", rows)
+            dataset["load"] = benchmark_load(filename, load_workers=args.load_workers)
+        if not args.skip_endpoints:
+            logger.info("Benchmarking endpoints serving %d reviews.", rows)
+            dataset["endpoints"] = benchmark_endpoints(
+                filename, requests=args.requests, warmup=args.warmup
+            ) + benchmark_endpoints(
+                filename,
+                requests=args.requests,
+                warmup=args.warmup,
+                cache_modes=(False,),
+                text_compression=True,
+            )
+        if not args.skip_compression:
+            logger.info("Benchmarking response compression of %d reviews.", rows)
+            dataset["compression"] = benchmark_compression(
+                filename, requests=args.requests, warmup=args.warmup
+            )
+        datasets.append(dataset)
+    logger.info("Benchmarking request instrumentation overhead.")
+    return {
+        "metadata": run_metadata(),
+        "instrumentation": benchmark_metrics_overhead(),
+        "datasets": datasets,
+    }
+
+
+def run_replay(args: Namespace) -> dict[str, Any]:
+    """Replay a recording against a running API, or the API run in-process.
+
+    Returns:
+        dict[str, Any]: The replay report.
+    """
+    requests = read_recording(args.recording)
+    app = build_service_app()
+    if args.url is None:
+        product_repository.load(Configuration().database)
+    logger.info("Replaying %d requests from %s.", len(requests), args.recording)
+    return replay(
+        requests,
+        app,
+        base_url=args.url,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        speedup=args.speedup,
+    )
+
+
+def run_metadata() -> dict[str, Any]:
+    """Get the environment of a benchmark run, to tell runs apart."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
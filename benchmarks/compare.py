@@ -0,0 +1,92 @@
+"""Food Review API benchmark results comparison."""
+
+from typing import Any
+
+LOAD_METRICS = ["wall_time", "index_build_time", "peak_rss_bytes"]
+ENDPOINT_METRICS = ["p50_ms", "p95_ms"]
+COMPRESSION_METRICS = ["response_bytes", "cpu_ms"]
+
+
+def compare_results(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.2
+) -> list[dict[str, Any]]:
+    """Compare benchmark results against a baseline run.
+
+    Measurements are matched by dataset size, and load case or endpoint and cache
+    mode. Measurements missing from either run are not compared.
+
+    Args:
+        results: The benchmark results.
+        baseline: The baseline benchmark results.
+        threshold: The relative increase of a metric over its baseline value
+            reported as a regression, e.g. 0.2 for 20%.
+
+    Returns:
+        list[dict[str, Any]]: The benchmark, metric, baseline and current values,
+        ratio, and whether it regressed, of each compared metric.
+    """
+    baseline_values = _metric_values(baseline)
+    comparisons = []
+    for key, value in _metric_values(results).items():
+        if key not in baseline_values:
+            continue
+        baseline_value = baseline_values[key]
+        ratio = value / baseline_value if baseline_value else float("inf")
+        benchmark, metric = key
+        comparisons.append(
+            {
+                "benchmark": benchmark,
+                "metric": metric,
+                "baseline": baseline_value,
+                "current": value,
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: list[dict[str, Any]]) -> str:
+    """Format comparisons as a plain text table, one metric per line."""
+    lines = [f"{'benchmark':<48} {'metric':<16} {'baseline':>14} {'current':>14} ratio"]
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison["regression"] else ""
+        lines.append(
+            f"{comparison['benchmark']:<48} {comparison['metric']:<16} "
+            f"{comparison['baseline']:>14.4g} {comparison['current']:>14.4g} "
+            f"{comparison['ratio']:.2f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _metric_values(results: dict[str, Any]) -> dict[tuple[str, str], float]:
+    """Get the compared metrics of benchmark results, keyed by benchmark and metric."""
+    values = {}
+    if "instrumentation" in results:
+        values["instrumentation/metrics_middleware", "overhead_us"] = results[
+            "instrumentation"
+        ]["metrics_middleware_overhead_us"]
+    for dataset in results["datasets"]:
+        rows = dataset["rows"]
+        for load in dataset.get("load", []):
+            for metric in LOAD_METRICS:
+                # Results of older runs may lack newer metrics.
+                if metric in load:
+                    values[f"{rows}/load/{load['case']}", metric] = load[metric]
+        for endpoint in dataset.get("endpoints", []):
+            mode = "cached" if endpoint["cached"] else "uncached"
+            if endpoint.get("text_compression"):
+                mode += "_text_compression"
+            for metric in ENDPOINT_METRICS:
+                values[f"{rows}/{endpoint['endpoint']}/{mode}", metric] = endpoint[
+                    metric
+                ]
+        for endpoint in dataset.get("compression", []):
+            mode = "cached" if endpoint["cached"] else "uncached"
+            benchmark = (
+                f"{rows}/compression/{endpoint['endpoint']}/{endpoint['encoding']}/"
+                f"{mode}"
+            )
+            for metric in COMPRESSION_METRICS:
+                values[benchmark, metric] = endpoint[metric]
+    return values
@@ -0,0 +1,125 @@
+"""Food Review API response compression benchmark."""
+
+import asyncio
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any
+
+import numpy as np
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.endpoints import EndpointCase, endpoint_cases, latency_stats
+from food_review_api.api import build_service_app
+from food_review_api.api.cache import response_cache
+from food_review_api.api.compression import ENCODINGS
+from food_review_api.core.config import (
+    CompressionConfig,
+    DatabaseConfig,
+    ResponseCacheConfig,
+)
+from food_review_api.products import product_repository
+
+COMPRESSED_ENDPOINTS = [
+    "most_reviewed",
+    "reviews_top_product",
+    "latest_reviews",
+    "batch_reviews",
+    "user_reviews",
+]
+
+
+def benchmark_compression(
+    filename: str | Path,
+    requests: int = 100,
+    warmup: int = 10,
+    cache_modes: tuple[bool, ...] = (True, False),
+) -> list[dict[str, Any]]:
+    """Measure the bytes on the wire and CPU time of compressed responses.
+
+    The endpoints with the largest responses, and the list of products, are
+    requested uncompressed and with each supported encoding. With the response
+    cache enabled, responses are served compressed from the cache, otherwise they
+    are compressed on every request by the compression middleware.
+
+    Args:
+        filename: The path to the reviews CSV file.
+        requests: The number of measured requests per endpoint and encoding.
+        warmup: The number of requests sent before measuring.
+        cache_modes: Whether the response cache is enabled, for each measured mode.
+
+    Returns:
+        list[dict[str, Any]]: The response size, CPU time per request and latency
+        statistics of each endpoint, encoding and mode.
+    """
+    snapshot = product_repository.load(
+        DatabaseConfig(filename=str(filename), load_workers=1)
+    )
+    app = build_service_app()
+    cases = [
+        case for case in endpoint_cases(snapshot) if case.name in COMPRESSED_ENDPOINTS
+    ]
+    cases.append(EndpointCase("products", "/api/v1/products"))
+    results = []
+    try:
+        for cached in cache_modes:
+            response_cache.configure(
+                ResponseCacheConfig(enabled=cached), compression=CompressionConfig()
+            )
+            for case in cases:
+                for encoding in ["identity", *ENCODINGS]:
+                    response_bytes, cpu_time, latencies = asyncio.run(
+                        _measure(app, case, encoding, requests, warmup)
+                    )
+                    results.append(
+                        {
+                            "endpoint": case.name,
+                            "cached": cached,
+                            "encoding": encoding,
+                            "response_bytes": response_bytes,
+                            "cpu_ms": cpu_time / requests * 1000,
+                            **latency_stats(latencies),
+                        }
+                    )
+    finally:
+        product_repository.clear()
+        response_cache.configure(ResponseCacheConfig())
+    return results
+
+
+async def _measure(
+    app: FastAPI, case: EndpointCase, encoding: str, requests: int, warmup: int
+) -> tuple[int, float, np.ndarray]:
+    """Send the request of an endpoint case accepting an encoding.
+
+    Returns:
+        tuple[int, float, np.ndarray]: The size of the response body as sent, the
+        CPU time spent by the process on the measured requests, including the
+        client reading the raw response, and the latency of each request.
+    """
+    latencies = np.empty(requests)
+    headers = {"accept-encoding": encoding}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://benchmark"
+    ) as client:
+        for index in range(-warmup, requests):
+            if index == 0:
+                cpu_started = process_time()
+            started = perf_counter()
+            # The raw body is read, so the client does not spend CPU time
+            # decompressing it.
+            async with client.stream(
+                case.method,
+                case.path,
+                params=case.params,
+                json=case.json,
+                headers=headers,
+            ) as response:
+                response.raise_for_status()
+                async for _ in response.aiter_raw():
+                    pass
+            elapsed = perf_counter() - started
+            if index >= 0:
+                latencies[index] = elapsed
+        cpu_time = process_time() - cpu_started
+    return response.num_bytes_downloaded, cpu_time, latencies
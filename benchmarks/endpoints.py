@@ -0,0 +1,196 @@
+"""Food Review API endpoints latency benchmark."""
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from food_review_api.api import build_service_app
+from food_review_api.api.cache import response_cache
+from food_review_api.core.config import DatabaseConfig, ResponseCacheConfig
+from food_review_api.products import product_repository
+from food_review_api.products.snapshot import ProductSnapshot
+
+BATCH_SIZE = 100
+SEARCH_QUERY = "coffee flavor"
+
+
+@dataclass(frozen=True)
+class EndpointCase:
+    """Request sent repeatedly to measure the latency of an endpoint."""
+
+    name: str
+    path: str
+    method: str = "GET"
+    params: dict[str, Any] = field(default_factory=dict)
+    json: dict[str, Any] | None = None
+
+
+def endpoint_cases(snapshot: ProductSnapshot) -> list[EndpointCase]:
+    """Get the benchmarked requests, for products and users of a snapshot.
+
+    Requests are sent for the most reviewed product and user, and for a product
+    with the median number of reviews, so both the tail and typical requests of a
+    skewed dataset are measured.
+
+    Args:
+        snapshot: The loaded products snapshot.
+
+    Returns:
+        list[EndpointCase]: The benchmarked requests.
+    """
+    store = snapshot.store
+    by_review_count = np.argsort(store.review_counts, kind="stable")
+    top_product = store.product_ids.tolist(by_review_count[-1:])[0]
+    median_product = store.product_ids.tolist(
+        by_review_count[len(by_review_count) // 2 :][:1]
+    )[0]
+    batch_products = store.product_ids.tolist(
+        np.linspace(0, store.product_count - 1, BATCH_SIZE).astype(np.int64)
+    )
+    top_user = snapshot.reviewers.top_reviewers(1)[0][0]
+    return [
+        EndpointCase("health", "/health"),
+        EndpointCase(
+            "most_reviewed", "/api/v1/products/most_reviewed", params={"n": 10}
+        ),
+        EndpointCase(
+            "reviews_top_product",
+            "/api/v1/reviews",
+            params={"product_id": top_product, "limit": 100},
+        ),
+        EndpointCase(
+            "reviews_median_product",
+            "/api/v1/reviews",
+            params={"product_id": median_product},
+        ),
+        EndpointCase(
+            "reviews_top_product_most_helpful",
+            "/api/v1/reviews",
+            params={
+                "product_id": top_product,
+                "sort": "-helpfulness",
+                "max_score": 2,
+                "limit": 100,
+            },
+        ),
+        EndpointCase("latest_reviews", "/api/v1/reviews/latest", params={"limit": 100}),
+        EndpointCase("product_stats", f"/api/v1/products/{median_product}/stats"),
+        EndpointCase(
+            "batch_stats",
+            "/api/v1/products/batch",
+            method="POST",
+            json={"product_ids": batch_products, "include": "stats"},
+        ),
+        EndpointCase(
+            "batch_reviews",
+            "/api/v1/products/batch",
+            method="POST",
+            json={"product_ids": batch_products, "include": "reviews", "limit": 10},
+        ),
+        EndpointCase("search", "/api/v1/search", params={"q": SEARCH_QUERY}),
+        EndpointCase(
+            "user_reviews", f"/api/v1/users/{top_user}/reviews", params={"limit": 100}
+        ),
+        EndpointCase("top_reviewers", "/api/v1/users/top_reviewers", params={"k": 10}),
+    ]
+
+
+def benchmark_endpoints(
+    filename: str | Path,
+    requests: int = 200,
+    warmup: int = 20,
+    cache_modes: tuple[bool, ...] = (True, False),
+    text_compression: bool = False,
+) -> list[dict[str, Any]]:
+    """Measure the latency of the API endpoints serving a reviews CSV file.
+
+    The reviews are loaded into the product repository, and requests are sent one
+    at a time to the ASGI app in-process, so the measured latency is the time
+    spent in the app, without network or server overhead. Each endpoint is measured
+    with the response cache enabled, where all but the first request are cache
+    hits, and disabled, where every response is rendered.
+
+    Args:
+        filename: The path to the reviews CSV file.
+        requests: The number of measured requests per endpoint.
+        warmup: The number of requests sent before measuring.
+        cache_modes: Whether the response cache is enabled, for each measured mode.
+        text_compression: Whether the review texts are compressed, to measure the
+            cost of decompressing them.
+
+    Returns:
+        list[dict[str, Any]]: The latency statistics of each endpoint and mode.
+    """
+    snapshot = product_repository.load(
+        DatabaseConfig(
+            filename=str(filename), load_workers=1, text_compression=text_compression
+        )
+    )
+    app = build_service_app()
+    results = []
+    try:
+        for cached in cache_modes:
+            response_cache.configure(ResponseCacheConfig(enabled=cached))
+            for case in endpoint_cases(snapshot):
+                latencies = asyncio.run(_measure(app, case, requests, warmup))
+                results.append(
+                    {
+                        "endpoint": case.name,
+                        "cached": cached,
+                        "text_compression": text_compression,
+                        **latency_stats(latencies),
+                    }
+                )
+    finally:
+        product_repository.clear()
+        response_cache.configure(ResponseCacheConfig())
+    return results
+
+
+def latency_stats(latencies: np.ndarray) -> dict[str, float]:
+    """Summarize request latencies.
+
+    Args:
+        latencies: The latency of each request, in seconds.
+
+    Returns:
+        dict[str, float]: The number of requests, mean, median, 95th and 99th
+        percentile and maximum latency in milliseconds, and requests per second.
+    """
+    milliseconds = latencies * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99]).tolist()
+    return {
+        "requests": len(latencies),
+        "mean_ms": float(milliseconds.mean()),
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "max_ms": float(milliseconds.max()),
+        "requests_per_second": len(latencies) / float(latencies.sum()),
+    }
+
+
+async def _measure(
+    app: FastAPI, case: EndpointCase, requests: int, warmup: int
+) -> np.ndarray:
+    """Send the request of an endpoint case, returning the measured latencies."""
+    latencies = np.empty(requests)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://benchmark"
+    ) as client:
+        for index in range(-warmup, requests):
+            started = perf_counter()
+            response = await client.request(
+                case.method, case.path, params=case.params, json=case.json
+            )
+            elapsed = perf_counter() - started
+            response.raise_for_status()
+            if index >= 0:
+                latencies[index] = elapsed
+    return latencies
@@ -0,0 +1,175 @@
+"""Food Review API synthetic reviews dataset generator."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from food_review_api.products.repository import REVIEW_DTYPES
+
+CSV_COLUMNS = [
+    "Id",
+    "ProductId",
+    "UserId",
+    "ProfileName",
+    "HelpfulnessNumerator",
+    "HelpfulnessDenominator",
+    "Score",
+    "Time",
+    "Summary",
+    "Text",
+]
+# Shape of the Amazon fine food reviews dataset: about 8 reviews per product and 2
+# per user, with a long tail of products and users with a single review, and the
+# most reviewed ones with a few hundred reviews per 500k reviews.
+REVIEWS_PER_PRODUCT = 8
+REVIEWS_PER_USER = 2
+PRODUCT_POPULARITY_SIGMA = 1.5
+USER_POPULARITY_SIGMA = 1.0
+SCORE_PROBABILITIES = [0.09, 0.05, 0.08, 0.14, 0.64]
+TIME_RANGE = (946_684_800, 1_351_728_000)
+DAY = 86_400
+TEXT_WORDS = (55, 0.8)
+SUMMARY_WORDS = (3, 0.6)
+FOOD_WORDS = [
+    "coffee",
+    "tea",
+    "chocolate",
+    "taste",
+    "flavor",
+    "dog",
+    "food",
+    "sweet",
+    "snack",
+    "organic",
+    "gluten",
+    "free",
+    "stale",
+    "price",
+    "amazon",
+    "<br />",
+]
+VOCABULARY_SIZE = 5_000
+CHUNK_SIZE = 100_000
+
+
+def generate_reviews(
+    row_count: int, seed: int = 0, chunk_size: int = CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Generate synthetic reviews, in chunks.
+
+    The popularity of products and users follows a log-normal distribution, so a
+    few products and users have many reviews and most have one or two. Scores, votes
+    and text lengths are drawn to resemble the real dataset, and words follow a
+    Zipf distribution over a vocabulary including common food review words.
+
+    Args:
+        row_count: The number of reviews to generate.
+        seed: The random generator seed, the same seed generates the same reviews.
+        chunk_size: The number of reviews of each chunk.
+
+    Yields:
+        A pandas DataFrame of reviews, with `Review` fields as columns.
+    """
+    rng = np.random.default_rng(seed)
+    product_count = max(row_count // REVIEWS_PER_PRODUCT, 1)
+    user_count = max(row_count // REVIEWS_PER_USER, 1)
+    # Popular products and users are spread over the identifiers space.
+    product_ids = np.array(
+        [f"B{code:09d}" for code in rng.permutation(product_count)], dtype=object
+    )
+    user_ids = np.array(
+        [f"A{code:012X}" for code in rng.permutation(user_count)], dtype=object
+    )
+    product_weights = _lognormal_weights(rng, product_count, PRODUCT_POPULARITY_SIGMA)
+    user_weights = _lognormal_weights(rng, user_count, USER_POPULARITY_SIGMA)
+    vocabulary = FOOD_WORDS + _random_words(rng, VOCABULARY_SIZE - len(FOOD_WORDS))
+    word_weights = _zipf_weights(len(vocabulary), 1.0)
+
+    for start in range(0, row_count, chunk_size):
+        size = min(chunk_size, row_count - start)
+        users = rng.choice(user_count, size, p=user_weights)
+        denominators = rng.geometric(0.45, size) - 1
+        reviews = pd.DataFrame(
+            {
+                "id": np.arange(start + 1, start + size + 1),
+                "product_id": product_ids[
+                    rng.choice(product_count, size, p=product_weights)
+                ],
+                "user_id": user_ids[users],
+                "profile_name": [f"Reviewer {user}" for user in users.tolist()],
+                "helpfulness_numerator": rng.binomial(denominators, 0.7),
+                "helpfulness_denominator": denominators,
+                "score": rng.choice(5, size, p=SCORE_PROBABILITIES) + 1,
+                "time": rng.integers(*TIME_RANGE, size) // DAY * DAY,
+                "summary": _random_texts(
+                    rng, size, vocabulary, word_weights, *SUMMARY_WORDS
+                ),
+                "text": _random_texts(rng, size, vocabulary, word_weights, *TEXT_WORDS),
+            }
+        )
+        yield reviews.astype(REVIEW_DTYPES)
+
+
+def write_reviews_csv(filename: str | Path, row_count: int, seed: int = 0) -> Path:
+    """Write a synthetic reviews CSV file, in the format of the real dataset.
+
+    Args:
+        filename: The path to the CSV file, overwritten if it exists.
+        row_count: The number of reviews to generate.
+        seed: The random generator seed.
+
+    Returns:
+        Path: The path to the CSV file.
+    """
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as file:
+        for index, reviews in enumerate(generate_reviews(row_count, seed=seed)):
+            reviews.to_csv(
+                file, header=CSV_COLUMNS if index == 0 else False, index=False
+            )
+    return path
+
+
+def _zipf_weights(count: int, skew: float) -> np.ndarray:
+    """Get the probabilities of a Zipf distribution over `count` ranks."""
+    weights = 1 / np.arange(1, count + 1) ** skew
+    return weights / weights.sum()
+
+
+def _lognormal_weights(
+    rng: np.random.Generator, count: int, sigma: float
+) -> np.ndarray:
+    """Get random probabilities of `count` items, log-normally distributed."""
+    weights = rng.lognormal(0, sigma, count)
+    return weights / weights.sum()
+
+
+def _random_words(rng: np.random.Generator, count: int) -> list[str]:
+    """Generate distinct random lowercase words."""
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    words: dict[str, None] = {}
+    while len(words) < count:
+        length = rng.integers(2, 11)
+        words.setdefault("".join(rng.choice(letters, length)))
+    return list(words)
+
+
+def _random_texts(
+    rng: np.random.Generator,
+    count: int,
+    vocabulary: list[str],
+    word_weights: np.ndarray,
+    median_words: int,
+    sigma: float,
+) -> list[str]:
+    """Generate texts of log-normally distributed numbers of words."""
+    lengths = np.maximum(rng.lognormal(np.log(median_words), sigma, count), 1)
+    ends = np.cumsum(lengths.astype(np.int64)).tolist()
+    words = np.array(vocabulary, dtype=object)[
+        rng.choice(len(vocabulary), ends[-1], p=word_weights)
+    ].tolist()
+    starts = [0, *ends[:-1]]
+    return [" ".join(words[start:end]) for start, end in zip(starts, ends)]
@@ -0,0 +1,65 @@
+"""Food Review API request instrumentation overhead benchmark."""
+
+import asyncio
+from time import perf_counter
+from typing import Any
+
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from food_review_api.api.metrics import MetricsMiddleware
+from food_review_api.core.metrics import MetricsRegistry
+
+ROUTE = Route("/api/v1/products/{product_id}/stats", endpoint=lambda: None)
+BODY = b"x" * 1000
+
+
+async def _endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    """Respond to a request without doing any work, as a routed endpoint."""
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: dict[str, Any]) -> None:
+    pass
+
+
+def benchmark_metrics_overhead(requests: int = 100_000) -> dict[str, Any]:
+    """Measure the time the metrics middleware adds to each request.
+
+    Requests are sent directly to an ASGI endpoint doing no work, with and without
+    the metrics middleware, so the difference is the instrumentation overhead.
+
+    Args:
+        requests: The number of requests sent in each case.
+
+    Returns:
+        dict[str, Any]: The number of requests and the time per request without
+        and with the middleware, and their difference, in microseconds.
+    """
+    middleware = MetricsMiddleware(_endpoint, MetricsRegistry())
+
+    async def time_requests(app) -> float:
+        started = perf_counter()
+        for _ in range(requests):
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": "/api/v1/products/B001LG945O/stats",
+            }
+            await app(scope, _receive, _send)
+        return (perf_counter() - started) / requests * 1e6
+
+    bare = asyncio.run(time_requests(_endpoint))
+    instrumented = asyncio.run(time_requests(middleware))
+    return {
+        "requests": requests,
+        "bare_us": bare,
+        "instrumented_us": instrumented,
+        "metrics_middleware_overhead_us": instrumented - bare,
+    }
@@ -0,0 +1,91 @@
+"""Food Review API reviews loading benchmark."""
+
+import multiprocessing
+import resource
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from food_review_api.core.config import DatabaseConfig
+from food_review_api.products.repository import ProductRepository
+from food_review_api.products.storage import store_snapshot_path
+
+LOAD_CASES = {
+    "csv": {"snapshot_cache": False},
+    "csv_and_snapshot_write": {"snapshot_cache": True},
+    "snapshot": {"snapshot_cache": True},
+    "csv_text_compression": {"snapshot_cache": False, "text_compression": True},
+}
+
+
+def benchmark_load(
+    filename: str | Path,
+    chunk_size: int = 10_000,
+    load_workers: int | None = 1,
+) -> list[dict[str, Any]]:
+    """Measure the wall time and peak memory of loading a reviews CSV file.
+
+    The file is loaded from CSV without snapshot cache, from CSV writing the store
+    snapshot, from the store snapshot, and from CSV compressing the review texts.
+    Each load runs in a new process, so its peak resident set size is not inflated
+    by previous loads.
+
+    Args:
+        filename: The path to the reviews CSV file.
+        chunk_size: The number of CSV rows parsed per chunk.
+        load_workers: The number of processes parsing CSV files.
+
+    Returns:
+        list[dict[str, Any]]: The measurements of each load case.
+    """
+    db = DatabaseConfig(
+        filename=str(filename), chunk_size=chunk_size, load_workers=load_workers
+    )
+    shutil.rmtree(store_snapshot_path(db), ignore_errors=True)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    try:
+        for case, options in LOAD_CASES.items():
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                measurement = executor.submit(
+                    measure_load, db.model_copy(update=options)
+                ).result()
+            results.append({"case": case, **measurement})
+    finally:
+        shutil.rmtree(store_snapshot_path(db), ignore_errors=True)
+    return results
+
+
+def measure_load(db: DatabaseConfig) -> dict[str, Any]:
+    """Load a database into a new repository, measuring time and memory.
+
+    Args:
+        db: The configuration of the database to load.
+
+    Returns:
+        dict[str, Any]: The number of loaded reviews and products, the load wall
+        time and the search index build time in seconds, and the peak resident set
+        size of the process before and after loading, in bytes.
+    """
+    repository = ProductRepository()
+    baseline_rss = _peak_rss_bytes()
+    started = perf_counter()
+    repository.load(db)
+    wall_time = perf_counter() - started
+    return {
+        "review_count": repository.review_count,
+        "product_count": repository.product_count,
+        "wall_time": wall_time,
+        "index_build_time": repository.snapshot.search_index.build_time,
+        "baseline_peak_rss_bytes": baseline_rss,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "store_bytes": repository.store.nbytes,
+    }
+
+
+def _peak_rss_bytes() -> int:
+    """Get the peak resident set size of the current process."""
+    # Linux reports `ru_maxrss` in KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
@@ -0,0 +1,214 @@
+"""Food Review API recorded traffic replay driver."""
+
+import asyncio
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient, Limits
+from starlette.routing import compile_path
+
+from benchmarks.endpoints import latency_stats
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    """Request recorded by the traffic recording middleware."""
+
+    timestamp: float
+    method: str
+    path: str
+    query: str = ""
+    body: str | None = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL path and query string of the request."""
+        return f"{self.path}?{self.query}" if self.query else self.path
+
+
+def read_recording(filename: str | Path) -> list[RecordedRequest]:
+    """Read the requests of a recording, by ascending time.
+
+    Args:
+        filename: The path to the JSON lines file written by the recording
+            middleware.
+
+    Returns:
+        list[RecordedRequest]: The recorded requests.
+    """
+    requests = []
+    with Path(filename).open() as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                requests.append(
+                    RecordedRequest(
+                        timestamp=record["timestamp"],
+                        method=record["method"],
+                        path=record["path"],
+                        query=record.get("query", ""),
+                        body=record.get("body"),
+                    )
+                )
+    return sorted(requests, key=lambda request: request.timestamp)
+
+
+class RouteTemplates:
+    """Matcher of request paths to the path templates of the routes of an app."""
+
+    def __init__(self, app: FastAPI) -> None:
+        """Compile the path templates of the routes in the OpenAPI schema of an app.
+
+        Args:
+            app: The API app.
+        """
+        templates = [
+            (method.upper(), path, compile_path(path)[0])
+            for path, operations in app.openapi().get("paths", {}).items()
+            for method in operations
+        ]
+        # Static paths, e.g. `/products/most_reviewed`, take precedence over
+        # templates matching them, e.g. `/products/{product_id}`.
+        self._templates = sorted(templates, key=lambda template: template[1].count("{"))
+
+    def match(self, method: str, path: str) -> str:
+        """Get the route of a request, e.g. `GET /api/v1/users/{user_id}/reviews`.
+
+        Requests not matching any route are grouped by their path.
+        """
+        for template_method, template, regex in self._templates:
+            if template_method == method and regex.match(path):
+                return f"{method} {template}"
+        return f"{method} {path}"
+
+
+def replay(
+    requests: list[RecordedRequest],
+    app: FastAPI,
+    base_url: str | None = None,
+    concurrency: int = 10,
+    rate: float | None = None,
+    speedup: float = 1.0,
+) -> dict[str, Any]:
+    """Replay recorded requests, reporting latency and throughput per route.
+
+    Requests are sent on a schedule, at a fixed rate, or following the recorded
+    times between requests, sped up by a factor. At most `concurrency` requests
+    are in flight at once, so requests may be sent after their scheduled time when
+    the API is saturated.
+
+    Args:
+        requests: The recorded requests, by ascending time.
+        app: The API app, which the requests are sent to in-process if `base_url` is
+            None, and whose route templates group the results.
+        base_url: The URL of a running API to send the requests to, e.g.
+            `http://localhost:8000`.
+        concurrency: The maximum number of requests in flight.
+        rate: The number of requests sent per second, the recorded times between
+            requests if None.
+        speedup: The factor dividing the recorded times between requests.
+
+    Returns:
+        dict[str, Any]: The total number of requests, errors, wall time and
+        throughput of the replay, and the latency statistics and number of errors of
+        each route.
+    """
+    if not requests:
+        return {
+            "requests": 0,
+            "errors": 0,
+            "wall_time": 0.0,
+            "requests_per_second": 0.0,
+            "routes": {},
+        }
+    if rate is not None:
+        offsets = np.arange(len(requests)) / rate
+    else:
+        timestamps = np.array([request.timestamp for request in requests])
+        offsets = (timestamps - timestamps[0]) / speedup
+    return asyncio.run(_replay(requests, offsets, app, base_url, concurrency))
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format a replay report as a plain text table, one route per line."""
+    lines = [
+        f"{report['requests']} requests, {report['errors']} errors in "
+        f"{report['wall_time']:.2f}s ({report['requests_per_second']:.1f} req/s)",
+        f"{'route':<48} {'requests':>8} {'errors':>6} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}",
+    ]
+    for route, stats in report["routes"].items():
+        lines.append(
+            f"{route:<48} {stats['requests']:>8} {stats['errors']:>6} "
+            f"{stats['throughput']:>8.1f} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+async def _replay(
+    requests: list[RecordedRequest],
+    offsets: np.ndarray,
+    app: FastAPI,
+    base_url: str | None,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Send the requests at their scheduled offsets, measuring their latency."""
+    transport = ASGITransport(app=app) if base_url is None else None
+    limits = Limits(max_connections=concurrency)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    slots = asyncio.Semaphore(concurrency)
+    routes = RouteTemplates(app)
+
+    async with AsyncClient(
+        transport=transport, base_url=base_url or "http://replay", limits=limits
+    ) as client:
+
+        async def send(request: RecordedRequest) -> None:
+            route = routes.match(request.method, request.path)
+            headers = {"content-type": "application/json"} if request.body else None
+            sent = perf_counter()
+            try:
+                response = await client.request(
+                    request.method, request.url, content=request.body, headers=headers
+                )
+                failed = response.status_code >= 500
+            except Exception:
+                failed = True
+            finally:
+                slots.release()
+            latencies[route].append(perf_counter() - sent)
+            errors[route] += failed
+
+        started = perf_counter()
+        tasks = []
+        for request, offset in zip(requests, offsets.tolist()):
+            delay = started + offset - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            tasks.append(asyncio.create_task(send(request)))
+        await asyncio.gather(*tasks)
+        wall_time = perf_counter() - started
+
+    route_stats = {}
+    for route in sorted(latencies):
+        stats = latency_stats(np.array(latencies[route]))
+        stats["errors"] = errors[route]
+        stats["throughput"] = stats["requests"] / wall_time
+        route_stats[route] = stats
+    total = sum(len(route_latencies) for route_latencies in latencies.values())
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "wall_time": wall_time,
+        "requests_per_second": total / wall_time,
+        "routes": route_stats,
+    }
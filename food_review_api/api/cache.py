@@ -0,0 +1,246 @@
+"""Food Review API serialized responses cache definition."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from threading import Lock
+
+from fastapi import Request, Response, status
+
+from food_review_api.api.compression import (
+    ENCODINGS,
+    encoded_etag,
+    negotiate_encoding,
+    precompress,
+)
+from food_review_api.core.config.cache import ResponseCacheConfig
+from food_review_api.core.config.compression import CompressionConfig
+from food_review_api.products.snapshot import ProductSnapshot
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized JSON response body, its entity tag, and its compressed bodies.
+
+    The compressed bodies are added as requests accept their encoding, see
+    `ResponseCache.encode`. The encodings which do not make the body smaller are
+    kept in `incompressible`, so that they are not tried again.
+    """
+
+    body: bytes
+    etag: str
+    encodings: dict[str, bytes] = field(default_factory=dict)
+    incompressible: set[str] = field(default_factory=set)
+
+    @property
+    def nbytes(self) -> int:
+        """Get size of the cached response."""
+        return (
+            len(self.body)
+            + len(self.etag)
+            + sum(len(body) for body in self.encodings.values())
+        )
+
+
+class ResponseCache:
+    """Least recently used cache of serialized JSON responses.
+
+    Responses only change when a new products snapshot is published, so they are
+    cached per snapshot generation, and the whole cache is dropped when a response
+    of a new generation is requested. The cache is bounded by the total size of the
+    cached bodies. Responses are cached compressed, so that they are not
+    compressed again on every request, with each encoding the first time a request
+    accepts it.
+    """
+
+    def __init__(
+        self,
+        config: ResponseCacheConfig | None = None,
+        compression: CompressionConfig | None = None,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._generation: int | None = None
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.configure(config or ResponseCacheConfig(), compression)
+
+    def configure(
+        self,
+        config: ResponseCacheConfig,
+        compression: CompressionConfig | None = None,
+    ) -> None:
+        """Apply cache and response compression configuration, clearing the cache."""
+        self.enabled = config.enabled
+        self.max_bytes = config.max_bytes
+        self.compression = compression or CompressionConfig()
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self.nbytes = 0
+
+    async def get(
+        self,
+        snapshot: ProductSnapshot,
+        key: Hashable,
+        render: Callable[[], bytes],
+        accept_encoding: str | None = None,
+    ) -> CachedResponse:
+        """Get a cached response, rendering and caching it on a miss.
+
+        The response is compressed with the encoding negotiated from
+        `accept_encoding`, if it is not cached with it yet.
+
+        Args:
+            snapshot: The products snapshot the response is rendered from.
+            key: The key identifying the response within the snapshot.
+            render: The function serializing the response body.
+            accept_encoding: The value of the request `Accept-Encoding` header.
+
+        Returns:
+            CachedResponse: The serialized response and its entity tag.
+        """
+        if self.enabled:
+            with self._lock:
+                cached = None
+                if self._generation == snapshot.generation:
+                    cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if cached is None:
+                cached = self.render(snapshot, render)
+                if cached.nbytes <= self.max_bytes:
+                    self._put(snapshot.generation, key, cached)
+            await self.encode(cached, accept_encoding, key)
+            return cached
+        # Responses rendered on every request are compressed by the middleware.
+        return self.render(snapshot, render)
+
+    def render(
+        self, snapshot: ProductSnapshot, render: Callable[[], bytes]
+    ) -> CachedResponse:
+        """Render a response, without caching nor compressing it.
+
+        Args:
+            snapshot: The products snapshot the response is rendered from.
+            render: The function serializing the response body.
+
+        Returns:
+            CachedResponse: The serialized response and its entity tag.
+        """
+        body = render()
+        version = snapshot.metadata.version if snapshot.metadata else "0"
+        digest = blake2b(body, digest_size=16).hexdigest()
+        return CachedResponse(body=body, etag=f'"{version}-{digest}"')
+
+    async def encode(
+        self,
+        cached: CachedResponse,
+        accept_encoding: str | None,
+        key: Hashable | None = None,
+    ) -> None:
+        """Compress a response with the encoding a request accepts, if not yet done.
+
+        Args:
+            cached: The response, e.g. a response memoized in the products snapshot.
+            accept_encoding: The value of the request `Accept-Encoding` header.
+            key: The key of the response in the cache, whose size then includes
+                the compressed body while the response is cached.
+        """
+        encoding = negotiate_encoding(accept_encoding)
+        if (
+            encoding is None
+            or encoding in cached.encodings
+            or encoding in cached.incompressible
+        ):
+            return
+        compressed = await precompress(cached.body, encoding, self.compression)
+        with self._lock:
+            if compressed is None:
+                cached.incompressible.add(encoding)
+            # Another request may have compressed it meanwhile.
+            elif encoding not in cached.encodings:
+                cached.encodings[encoding] = compressed
+                if key is not None and self._entries.get(key) is cached:
+                    self.nbytes += len(compressed)
+                    self._evict()
+
+    def _put(self, generation: int, key: Hashable, cached: CachedResponse) -> None:
+        """Add a response to the cache, evicting least recently used ones.
+
+        Responses of an older generation than the cached ones, rendered by requests
+        which started before a reload was published, are not cached, as they would
+        evict the responses of the published snapshot.
+        """
+        with self._lock:
+            if self._generation is not None and generation < self._generation:
+                return
+            if self._generation != generation:
+                self._entries.clear()
+                self._generation = generation
+                self.nbytes = 0
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = cached
+            self.nbytes += cached.nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used responses until the cache fits its budget."""
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+
+def cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Build a JSON response from a cached response.
+
+    The body is sent compressed when the response was cached compressed with an
+    encoding the request accepts, with the entity tag of that encoding, see
+    `encoded_etag`. Returns a `304 Not Modified` response without body when the
+    request `If-None-Match` header matches the entity tag of the body with any
+    encoding. Responses vary with the `Accept-Encoding` header either way.
+
+    Args:
+        request: The incoming request.
+        cached: The cached response.
+
+    Returns:
+        Response: The response to the client.
+    """
+    encoding = negotiate_encoding(
+        request.headers.get("accept-encoding"), tuple(cached.encodings)
+    )
+    etag = cached.etag if encoding is None else encoded_etag(cached.etag, encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        current_etags = {cached.etag}
+        current_etags.update(encoded_etag(cached.etag, coding) for coding in ENCODINGS)
+        if not etags.isdisjoint(current_etags) or "*" in etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding is None:
+        return Response(
+            content=cached.body, media_type="application/json", headers=headers
+        )
+    headers["Content-Encoding"] = encoding
+    return Response(
+        content=cached.encodings[encoding],
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,209 @@
+"""Food Review API response compression definition."""
+
+import gzip
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from food_review_api.core.config.compression import CompressionConfig
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional dependency.
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+# Supported encodings, by order of preference.
+ENCODINGS = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "text/")
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a response body.
+
+    Args:
+        body: The response body.
+        encoding: The content encoding, `gzip` or `br`.
+        level: The gzip level or brotli quality.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Get the entity tag of a response body compressed with an encoding.
+
+    Compressed bodies differ from the uncompressed one, so they get their own
+    entity tag, the uncompressed one suffixed with the encoding, e.g. `"7-ab-gzip"`.
+
+    Args:
+        etag: The entity tag of the uncompressed body.
+        encoding: The content encoding, `gzip` or `br`.
+
+    Returns:
+        str: The entity tag of the compressed body.
+    """
+    return etag.removesuffix('"') + f'-{encoding}"'
+
+
+def negotiate_encoding(
+    accept_encoding: str | None, encodings: tuple[str, ...] = ENCODINGS
+) -> str | None:
+    """Choose the content encoding of a response from an `Accept-Encoding` header.
+
+    Args:
+        accept_encoding: The value of the request `Accept-Encoding` header.
+        encodings: The encodings the response can be sent with, by order of
+            preference.
+
+    Returns:
+        str | None: The accepted encoding with the highest quality value, the
+        preferred one among equals, or None to send the response uncompressed.
+    """
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    chosen, chosen_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > chosen_quality:
+            chosen, chosen_quality = encoding, quality
+    return chosen
+
+
+async def compress_off_loop(
+    body: bytes, encoding: str, level: int, config: CompressionConfig
+) -> bytes:
+    """Compress a response body without blocking the event loop on large bodies.
+
+    Bodies of at least `offload_size` bytes are compressed in a worker thread, so
+    other requests are served meanwhile, and smaller ones on the event loop.
+
+    Args:
+        body: The response body.
+        encoding: The content encoding, `gzip` or `br`.
+        level: The gzip level or brotli quality.
+        config: The response compression configuration.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if len(body) < config.offload_size:
+        return compress(body, encoding, level)
+    return await run_in_threadpool(compress, body, encoding, level)
+
+
+async def precompress(
+    body: bytes, encoding: str, config: CompressionConfig
+) -> bytes | None:
+    """Compress a response body with an encoding, to be cached.
+
+    Cached responses are compressed once and served many times, so they use the
+    higher gzip level and brotli quality of the configuration.
+
+    Args:
+        body: The response body.
+        encoding: The content encoding, `gzip` or `br`.
+        config: The response compression configuration.
+
+    Returns:
+        bytes | None: The compressed body, or None if the body is too small to be
+        compressed, or compressing it does not make it smaller.
+    """
+    if not config.enabled or len(body) < config.minimum_size:
+        return None
+    level = config.gzip_level if encoding == GZIP else config.brotli_quality
+    compressed = await compress_off_loop(body, encoding, level, config)
+    return compressed if len(compressed) < len(body) else None
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses for clients accepting it.
+
+    JSON and text responses of at least `minimum_size` and at most
+    `max_dynamic_size` bytes are compressed with the encoding negotiated from the
+    request `Accept-Encoding` header, at the dynamic gzip level or brotli quality,
+    as they are compressed on every request, in a worker thread from
+    `offload_size` bytes. Responses which already have a
+    content encoding, e.g. cached responses stored compressed, and streamed
+    responses are sent as they are.
+    """
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            config: The response compression configuration.
+        """
+        self.app = app
+        self.config = config
+        self.levels = {
+            GZIP: config.dynamic_gzip_level,
+            BROTLI: config.dynamic_brotli_quality,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, compressing its response if accepted."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        start: Message | None = None
+
+        async def send_compressing(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            # Only the first body message is compressed, later ones are streamed.
+            response_start, start = start, None
+            headers = MutableHeaders(raw=list(response_start["headers"]))
+            body = message.get("body", b"")
+            if "content-encoding" in headers or not headers.get(
+                "content-type", ""
+            ).startswith(COMPRESSIBLE_MEDIA_TYPES):
+                await send(response_start)
+                await send(message)
+                return
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            config = self.config
+            if (
+                encoding is not None
+                and not message.get("more_body", False)
+                and config.minimum_size <= len(body) <= config.max_dynamic_size
+            ):
+                body = await compress_off_loop(
+                    body, encoding, self.levels[encoding], config
+                )
+                headers["content-encoding"] = encoding
+                if "etag" in headers:
+                    headers["etag"] = encoded_etag(headers["etag"], encoding)
+                headers["content-length"] = str(len(body))
+                message = {**message, "body": body}
+            await send({**response_start, "headers": headers.raw})
+            await send(message)
+
+        await self.app(scope, receive, send_compressing)
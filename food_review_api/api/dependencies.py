@@ -1,18 +1,51 @@
 """Food Review API dependencies function definitions."""
 
-from food_review_api.core.config import Configuration
+from typing import Annotated
+
+from fastapi import Depends
+
+from food_review_api.api.cache import ResponseCache, response_cache
+from food_review_api.core.config import Configuration, get_configuration
+from food_review_api.core.metrics import MetricsRegistry, metrics_registry
+from food_review_api.products.exceptions import ProductsNotLoadedError
 from food_review_api.products.repository import ProductRepository, product_repository
 
 
 def fetch_configuration() -> Configuration:
     """Getter for application configuration.
 
+    The configuration is cached for the whole process, and only parsed again when
+    the configuration file changes.
+
     Returns:
         Configuration: The application configuration.
     """
-    return Configuration()
+    return get_configuration()
 
 
 def get_product_repository() -> ProductRepository:
     """Getter for product repository singleton."""
     return product_repository
+
+
+def require_loaded_products(
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+) -> None:
+    """Dependency rejecting requests for products until they are loaded.
+
+    Raises:
+        ProductsNotLoadedError: If the products are not loaded yet, e.g. while they
+            are loaded in the background.
+    """
+    if product_repository.snapshot.metadata is None:
+        raise ProductsNotLoadedError("Products not loaded")
+
+
+def get_response_cache() -> ResponseCache:
+    """Getter for serialized responses cache singleton."""
+    return response_cache
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Getter for HTTP request metrics registry singleton."""
+    return metrics_registry
@@ -5,8 +5,15 @@ from logging import getLogger
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
+from food_review_api.api.pagination import InvalidCursorError
+from food_review_api.api.projection import InvalidFieldsError
 from food_review_api.api.schemas.errors import HTTPErrorResponse
-from food_review_api.products import ProductNotFoundInRepositoryError
+from food_review_api.api.server import ReloadUnavailableError
+from food_review_api.products import (
+    ProductNotFoundInRepositoryError,
+    ProductsNotLoadedError,
+    UserNotFoundInRepositoryError,
+)
 
 logger = getLogger(__name__)
 
@@ -23,6 +30,17 @@ def add_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         ProductNotFoundInRepositoryError, product_not_found_exception_handler
     )
+    app.add_exception_handler(
+        UserNotFoundInRepositoryError, user_not_found_exception_handler
+    )
+    app.add_exception_handler(InvalidCursorError, invalid_cursor_exception_handler)
+    app.add_exception_handler(InvalidFieldsError, invalid_fields_exception_handler)
+    app.add_exception_handler(
+        ReloadUnavailableError, reload_unavailable_exception_handler
+    )
+    app.add_exception_handler(
+        ProductsNotLoadedError, products_not_loaded_exception_handler
+    )
 
 
 def product_not_found_exception_handler(
@@ -44,3 +62,107 @@ def product_not_found_exception_handler(
         status_code=status.HTTP_404_NOT_FOUND,
         content=HTTPErrorResponse(detail=msg).model_dump(),
     )
+
+
+def user_not_found_exception_handler(
+    request: Request, exc: UserNotFoundInRepositoryError
+) -> JSONResponse:
+    """Error handler for UserNotFoundInRepositoryError exception.
+
+    Args:
+        request: The incoming request.
+        exc: The exception instance.
+
+    Returns:
+        JSONResponse: The response to the client.
+    """
+    user_id = exc.args[0]
+    msg = f"User with key '{user_id}' has no reviews loaded in the service."
+    logger.exception(msg)
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content=HTTPErrorResponse(detail=msg).model_dump(),
+    )
+
+
+def invalid_cursor_exception_handler(
+    request: Request, exc: InvalidCursorError
+) -> JSONResponse:
+    """Error handler for InvalidCursorError exception.
+
+    Args:
+        request: The incoming request.
+        exc: The exception instance.
+
+    Returns:
+        JSONResponse: The response to the client.
+    """
+    msg = f"Invalid pagination cursor '{exc.args[0]}'."
+    logger.warning(msg)
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content=HTTPErrorResponse(detail=msg).model_dump(),
+    )
+
+
+def invalid_fields_exception_handler(
+    request: Request, exc: InvalidFieldsError
+) -> JSONResponse:
+    """Error handler for InvalidFieldsError exception.
+
+    Args:
+        request: The incoming request.
+        exc: The exception instance.
+
+    Returns:
+        JSONResponse: The response to the client.
+    """
+    msg = f"Unknown review fields {exc.args[0]}."
+    logger.warning(msg)
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content=HTTPErrorResponse(detail=msg).model_dump(),
+    )
+
+
+def reload_unavailable_exception_handler(
+    request: Request, exc: ReloadUnavailableError
+) -> JSONResponse:
+    """Error handler for ReloadUnavailableError exception.
+
+    Args:
+        request: The incoming request.
+        exc: The exception instance.
+
+    Returns:
+        JSONResponse: The response to the client.
+    """
+    msg = (
+        "Products can not be reloaded while served by several workers, restart "
+        "the service to reload them."
+    )
+    logger.warning(msg)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=HTTPErrorResponse(detail=msg).model_dump(),
+    )
+
+
+def products_not_loaded_exception_handler(
+    request: Request, exc: ProductsNotLoadedError
+) -> JSONResponse:
+    """Error handler for ProductsNotLoadedError exception.
+
+    Args:
+        request: The incoming request.
+        exc: The exception instance.
+
+    Returns:
+        JSONResponse: The response to the client.
+    """
+    msg = "Products are not loaded yet, see `/ready` for the load progress."
+    logger.warning(msg)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=HTTPErrorResponse(detail=msg).model_dump(),
+    )
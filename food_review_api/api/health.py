@@ -1,8 +1,14 @@
 """Food Review API health router definition."""
 
-from fastapi import APIRouter, status
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response, status
 from pydantic import BaseModel
 
+from food_review_api.api.dependencies import get_product_repository
+from food_review_api.products.progress import LoadPhase
+from food_review_api.products.repository import ProductRepository
+
 router = APIRouter(tags=["Health"])
 
 
@@ -12,6 +18,22 @@ class HealthCheck(BaseModel):
     status: str = "OK"
 
 
+class ReadinessCheck(BaseModel):
+    """Response model to validate and return when performing a readiness check."""
+
+    ready: bool
+    phase: LoadPhase
+    rows_parsed: int
+    bytes_parsed: int
+    total_bytes: int
+    elapsed_seconds: float | None = None
+    eta_seconds: float | None = None
+    error: str | None = None
+    generation: int
+    products: int
+    reviews: int
+
+
 @router.get(
     "/health",
     summary="Perform a Health Check",
@@ -29,3 +51,49 @@ def get_health() -> HealthCheck:
         HealthCheck: Returns a JSON response with the health status
     """
     return HealthCheck(status="OK")
+
+
+@router.get(
+    "/ready",
+    summary="Perform a Readiness Check",
+    response_description=(
+        "Return HTTP Status Code 200 (OK) once the products are loaded, 503 "
+        "(Service Unavailable) meanwhile"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ReadinessCheck,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessCheck}},
+)
+def get_readiness(
+    response: Response,
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+) -> ReadinessCheck:
+    """Perform a Readiness Check.
+
+    The service is ready once a products snapshot has been published. Until then,
+    e.g. while the reviews are loaded in the background on startup, it responds
+    with a 503 status and the progress of the load, so orchestrators only route
+    traffic to it when ready, while `/health` keeps reporting it alive.
+
+    Returns:
+        ReadinessCheck: Returns a JSON response with the readiness status and the
+        progress of the current or last load.
+    """
+    snapshot = product_repository.snapshot
+    progress = product_repository.progress
+    ready = snapshot.metadata is not None
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessCheck(
+        ready=ready,
+        phase=progress.phase,
+        rows_parsed=progress.rows_parsed,
+        bytes_parsed=progress.bytes_parsed,
+        total_bytes=progress.total_bytes,
+        elapsed_seconds=progress.elapsed,
+        eta_seconds=progress.eta,
+        error=progress.error,
+        generation=snapshot.generation,
+        products=snapshot.store.product_count,
+        reviews=snapshot.store.review_count,
+    )
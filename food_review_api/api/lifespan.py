@@ -1,5 +1,6 @@
 """Food Review API lifespan definition."""
 
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
 from logging import getLogger
 
@@ -7,6 +8,7 @@ from fastapi import FastAPI
 
 from food_review_api.core.config.configuration import Configuration
 from food_review_api.products.repository import product_repository
+from food_review_api.products.snapshot import ProductSnapshot
 from food_review_api.utils.logging import configure_logging
 
 logger = getLogger(__name__)
@@ -30,7 +32,16 @@ def startup_event():
         config.version,
         config.environment,
     )
-    load_reviews(config)
+    if product_repository.snapshot.metadata is not None:
+        logger.info(
+            "Serving %d preloaded reviews and %d products.",
+            product_repository.review_count,
+            product_repository.product_count,
+        )
+    elif config.database.background_load:
+        load_reviews_in_background(config)
+    else:
+        load_reviews(config)
 
 
 def load_reviews(config: Configuration):
@@ -41,11 +52,41 @@ def load_reviews(config: Configuration):
     configuration option, and adds them to the product repository.
     """
     logger.info("Loading reviews from a csv.")
-    product_repository.load(config.database)
+    _log_loaded(product_repository.load(config.database))
+
+
+def load_reviews_in_background(config: Configuration) -> Future[ProductSnapshot]:
+    """Load reviews from a CSV file in the background.
+
+    The reviews are loaded by the reload worker of the product repository, so the
+    API accepts requests, e.g. to the `/health` liveness probe, while they load.
+    The `/ready` endpoint reports the load progress until they are loaded.
+
+    Returns:
+        Future[ProductSnapshot]: The future of the loaded snapshot.
+    """
+    logger.info("Loading reviews from a csv in the background.")
+    future = product_repository.reload(config.database)
+    future.add_done_callback(_log_background_load)
+    return future
+
+
+def _log_background_load(future: Future[ProductSnapshot]) -> None:
+    """Log the outcome of a background load of the reviews."""
+    error = future.exception()
+    if error is None:
+        _log_loaded(future.result())
+    else:
+        logger.error("Failed to load reviews.", exc_info=error)
+
+
+def _log_loaded(snapshot: ProductSnapshot) -> None:
+    """Log the size of a loaded products snapshot."""
     logger.info(
-        "Loaded %d reviews and %d products.",
-        product_repository.review_count,
-        product_repository.product_count,
+        "Loaded %d reviews and %d products (%.1f MiB).",
+        snapshot.store.review_count,
+        snapshot.store.product_count,
+        snapshot.store.nbytes / 2**20,
     )
 
 
@@ -2,9 +2,11 @@
 
 from fastapi import FastAPI
 
+from food_review_api.api.cache import response_cache
 from food_review_api.api.exceptions import add_exception_handlers
 from food_review_api.api.health import router as health_router
 from food_review_api.api.lifespan import lifespan
+from food_review_api.api.metrics import router as metrics_router
 from food_review_api.api.middelwares import add_middlewares
 from food_review_api.api.v1.router import router as v1_router
 from food_review_api.core.config.configuration import Configuration
@@ -21,7 +23,10 @@ def build_service_app() -> FastAPI:
         lifespan=lifespan,
     )
     app.include_router(router=health_router)
+    if config.metrics.enabled:
+        app.include_router(router=metrics_router)
     app.include_router(router=v1_router, prefix="/api/v1")
     add_exception_handlers(app=app)
     add_middlewares(app=app, config=config)
+    response_cache.configure(config.response_cache, compression=config.compression)
     return app
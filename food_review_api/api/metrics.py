@@ -0,0 +1,188 @@
+"""Food Review API metrics middleware and router definition."""
+
+from time import perf_counter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from food_review_api.api.cache import ResponseCache
+from food_review_api.api.dependencies import (
+    get_metrics_registry,
+    get_product_repository,
+    get_response_cache,
+)
+from food_review_api.core.metrics import MetricsRegistry
+from food_review_api.products.repository import ProductRepository
+from food_review_api.products.store import CompressedStringColumn
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "unmatched"
+
+router = APIRouter(tags=["Metrics"])
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the latency and response size of each request.
+
+    Requests are labelled with the path template of the route serving them, e.g.
+    `/api/v1/products/{product_id}/stats`, so the number of label values is bounded
+    by the number of routes. Requests not matching any route are labelled
+    `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            registry: The registry the requests are recorded in.
+        """
+        self.app = app
+        self.registry = registry
+        self._templates: dict[int, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, recording its metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_measuring(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry = self.registry
+        registry.in_flight += 1
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_measuring)
+        finally:
+            duration = perf_counter() - started
+            registry.in_flight -= 1
+            registry.observe_request(
+                scope["method"], self._route_template(scope), status, duration, size
+            )
+
+    def _route_template(self, scope: Scope) -> str:
+        """Get the full path template of the route which served a request."""
+        route = scope.get("route")
+        if route is None:
+            return UNMATCHED_ROUTE
+        template = self._templates.get(id(route))
+        if template is None:
+            template = self._templates[id(route)] = _full_path_template(
+                route, scope["path"]
+            )
+        return template
+
+
+def _full_path_template(route, path: str) -> str:
+    """Get the path template of a route, including the prefix of its router.
+
+    Depending on the FastAPI version, the path of a route of an included router
+    may not include the router prefix, which is then taken from a matching path.
+    Routes declared with an empty path, e.g. `/api/v1/reviews`, match the empty
+    suffix of the path, so the whole path is their prefix.
+    """
+    for start in range(len(path) + 1):
+        if (start == len(path) or path[start] == "/") and route.path_regex.fullmatch(
+            path[start:]
+        ):
+            return path[:start] + route.path_format
+    return route.path_format
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(
+    metrics_registry: Annotated[MetricsRegistry, Depends(get_metrics_registry)],
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+) -> Response:
+    """Get the service metrics in the Prometheus text exposition format.
+
+    Besides the HTTP request metrics of the worker process serving the request,
+    the loaded products and the response cache of the process are described, all
+    labelled with the process ID of the worker.
+
+    Returns:
+        Response: The metrics exposition.
+    """
+    snapshot = product_repository.snapshot
+    gauges = [
+        ("food_review_api_products", "Loaded products.", snapshot.store.product_count),
+        ("food_review_api_reviews", "Loaded reviews.", snapshot.store.review_count),
+        (
+            "food_review_api_snapshot_generation",
+            "Generation of the published products snapshot.",
+            snapshot.generation,
+        ),
+        (
+            "food_review_api_last_load_duration_seconds",
+            "Duration of the last products load.",
+            product_repository.last_load_duration or 0.0,
+        ),
+        (
+            "food_review_api_store_bytes",
+            "Memory used by the loaded reviews store.",
+            snapshot.store.nbytes,
+        ),
+        (
+            "food_review_api_response_cache_bytes",
+            "Size of the cached responses.",
+            response_cache.nbytes,
+        ),
+    ]
+    counters = [
+        (
+            "food_review_api_response_cache_hits_total",
+            "Responses served from the response cache.",
+            response_cache.hits,
+        ),
+        (
+            "food_review_api_response_cache_misses_total",
+            "Responses rendered on a response cache miss.",
+            response_cache.misses,
+        ),
+    ]
+    compressed = [
+        column
+        for column in snapshot.store.columns.values()
+        if isinstance(column, CompressedStringColumn)
+    ]
+    if compressed:
+        counters += [
+            (
+                "food_review_api_text_block_cache_hits_total",
+                "Compressed text blocks read from the decompressed blocks cache.",
+                sum(column.cache_hits for column in compressed),
+            ),
+            (
+                "food_review_api_text_block_cache_misses_total",
+                "Compressed text blocks decompressed on a cache miss.",
+                sum(column.cache_misses for column in compressed),
+            ),
+            (
+                "food_review_api_text_decompression_seconds_total",
+                "Time spent decompressing text blocks.",
+                sum(column.decompression_time for column in compressed),
+            ),
+        ]
+        gauges.append(
+            (
+                "food_review_api_text_block_cache_bytes",
+                "Size of the decompressed text blocks in cache.",
+                sum(column.cache_nbytes for column in compressed),
+            )
+        )
+    return Response(
+        content=metrics_registry.render(gauges, counters),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -3,7 +3,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from food_review_api.api.compression import CompressionMiddleware
+from food_review_api.api.metrics import MetricsMiddleware
+from food_review_api.api.profiling import ProfilingMiddleware
+from food_review_api.api.recording import RecordingMiddleware
 from food_review_api.core.config.configuration import Configuration
+from food_review_api.core.metrics import metrics_registry
 
 
 def add_cors_middleware(app: FastAPI, config: Configuration) -> None:
@@ -22,5 +27,54 @@ def add_cors_middleware(app: FastAPI, config: Configuration) -> None:
         )
 
 
+def add_compression_middleware(app: FastAPI, config: Configuration) -> None:
+    """
+    Add response compression middleware to the FastAPI application, when enabled.
+
+    Responses are compressed with gzip, or brotli if installed, for clients
+    accepting it. It is added before the other middlewares, so the metrics report
+    the compressed response sizes.
+    """
+    if config.compression.enabled:
+        app.add_middleware(CompressionMiddleware, config=config.compression)
+
+
+def add_recording_middleware(app: FastAPI, config: Configuration) -> None:
+    """
+    Add traffic recording middleware to the FastAPI application, when enabled.
+
+    A sample of the requests is appended to a JSON lines file, to be replayed with
+    `python -m benchmarks replay`.
+    """
+    if config.recording.enabled:
+        app.add_middleware(RecordingMiddleware, config=config.recording)
+
+
+def add_profiling_middleware(app: FastAPI, config: Configuration) -> None:
+    """
+    Add request profiling middleware to the FastAPI application, when enabled.
+
+    Requests with the profiling header, or sampled, are profiled. The middleware is
+    not added at all when profiling is disabled, so it costs nothing.
+    """
+    if config.profiling.enabled:
+        app.add_middleware(ProfilingMiddleware, config=config.profiling)
+
+
+def add_metrics_middleware(app: FastAPI, config: Configuration) -> None:
+    """
+    Add request metrics middleware to the FastAPI application, when enabled.
+
+    The latency and response size of each request are recorded per route, and
+    served by the `/metrics` endpoint.
+    """
+    if config.metrics.enabled:
+        app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+
+
 def add_middlewares(app: FastAPI, config: Configuration):
     add_cors_middleware(app, config)
+    add_compression_middleware(app, config)
+    add_recording_middleware(app, config)
+    add_profiling_middleware(app, config)
+    add_metrics_middleware(app, config)
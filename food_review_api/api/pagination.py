@@ -0,0 +1,44 @@
+"""Food Review API pagination cursor functions definitions."""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+
+
+class InvalidCursorError(ValueError):
+    """Exception thrown when a pagination cursor can not be decoded."""
+
+
+def encode_cursor(key: str, offset: int) -> str:
+    """Encode an opaque pagination cursor.
+
+    Args:
+        key: The key of the paginated collection, e.g. the product identifier.
+        offset: The offset of the first item of the next page.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    return urlsafe_b64encode(f"{offset}:{key}".encode()).decode()
+
+
+def decode_cursor(cursor: str, key: str) -> int:
+    """Decode an opaque pagination cursor.
+
+    Args:
+        cursor: The cursor returned with the previous page.
+        key: The key of the paginated collection, e.g. the product identifier.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another key.
+
+    Returns:
+        int: The offset of the first item of the page.
+    """
+    try:
+        offset, cursor_key = urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        offset = int(offset)
+    except (DecodeError, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(cursor)
+    if cursor_key != key or offset < 0:
+        raise InvalidCursorError(cursor)
+    return offset
@@ -0,0 +1,171 @@
+"""Food Review API request profiling middleware definition."""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+from pathlib import Path
+from time import time_ns
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from food_review_api.core.config.profiling import ProfilingConfig
+
+INLINE_PROFILE = "inline"
+INLINE_PREFIX = b"inline:"
+PROFILE_FILE_HEADER = b"x-profile-file"
+PROFILED_STATUS_HEADER = b"x-profiled-status"
+UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests with the deterministic `cProfile` profiler.
+
+    A request is profiled when the configured header is set to the configured
+    secret, or when it is drawn at the configured sample rate. Its profile is saved
+    to a `pstats` file in the profiles directory, named in the `X-Profile-File`
+    response header, or returned instead of the response when the header is set to
+    `inline:` followed by the secret. Profiles are saved and formatted in the
+    thread pool, and only the newest `max_files` profile files are kept.
+
+    The profiler records every function running on the event loop thread while the
+    request is served, including other requests served concurrently, but not sync
+    endpoints run in the thread pool. A single request is profiled at a time.
+    """
+
+    def __init__(self, app: ASGIApp, config: ProfilingConfig) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            config: The request profiling configuration.
+        """
+        self.app = app
+        self.config = config
+        self._secret = (
+            config.secret.get_secret_value().encode() if config.secret else None
+        )
+        self.header = (
+            config.header.lower().encode()
+            if config.header and self._secret is not None
+            else None
+        )
+        self._profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, profiling it if requested or sampled."""
+        mode = self._profile_mode(scope) if scope["type"] == "http" else None
+        if mode is None or self._profiling:
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler, e.g. of a debugger, is already active.
+            await self.app(scope, receive, send)
+            return
+        self._profiling = True
+        try:
+            if mode == INLINE_PROFILE:
+                await self._profile_inline(profiler, scope, receive, send)
+            else:
+                await self._profile_to_file(profiler, scope, receive, send)
+        finally:
+            self._profiling = False
+
+    def _profile_mode(self, scope: Scope) -> str | None:
+        """Get whether a request is profiled inline, to a file, or not at all."""
+        if self.header is not None:
+            for name, value in scope["headers"]:
+                if name == self.header:
+                    inline = value.startswith(INLINE_PREFIX)
+                    if inline:
+                        value = value[len(INLINE_PREFIX) :]
+                    if hmac.compare_digest(value, self._secret):
+                        return INLINE_PROFILE if inline else "file"
+                    break
+        if self.config.sample_rate and random.random() < self.config.sample_rate:
+            return "file"
+        return None
+
+    async def _profile_to_file(
+        self, profiler: cProfile.Profile, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Serve a request with the profiler enabled, saving its profile to a file."""
+        path = Path(self.config.directory) / profile_filename(scope)
+
+        async def send_with_filename(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    *message.get("headers", []),
+                    (PROFILE_FILE_HEADER, path.name.encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_filename)
+        finally:
+            profiler.disable()
+            await run_in_threadpool(self._save_profile, profiler, path)
+
+    def _save_profile(self, profiler: cProfile.Profile, path: Path) -> None:
+        """Save a profile to a file, removing the oldest files beyond `max_files`."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+        # Profile file names start with their time, so they sort oldest first.
+        profile_paths = sorted(path.parent.glob("*.prof"))
+        for stale_path in profile_paths[: -self.config.max_files]:
+            stale_path.unlink(missing_ok=True)
+
+    async def _profile_inline(
+        self, profiler: cProfile.Profile, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Serve a request with the profiler enabled, responding with its profile."""
+        status = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.disable()
+        body = await run_in_threadpool(self._format_profile, profiler)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (PROFILED_STATUS_HEADER, str(status).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _format_profile(self, profiler: cProfile.Profile) -> bytes:
+        """Format the functions of a profile taking the most time, as text."""
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.sort_stats(self.config.sort).print_stats(self.config.limit)
+        return report.getvalue().encode()
+
+
+def profile_filename(scope: Scope) -> str:
+    """Get a unique name for the profile file of a request.
+
+    The name holds the time, process, method and path of the request, e.g.
+    `1729240000123456789-4242-GET-api_v1_reviews.prof`.
+    """
+    path = UNSAFE_FILENAME_CHARACTERS.sub("_", scope["path"].strip("/")) or "root"
+    return f"{time_ns()}-{os.getpid()}-{scope['method']}-{path[:100]}.prof"
@@ -0,0 +1,60 @@
+"""Food Review API review field projection functions definitions."""
+
+from typing import Annotated
+
+from fastapi import Query
+
+from food_review_api.products.schemas import Review
+
+REVIEW_FIELDS = tuple(Review.model_fields)
+
+
+class InvalidFieldsError(ValueError):
+    """Exception thrown when a field projection names unknown review fields."""
+
+
+def parse_fields(fields: list[str]) -> tuple[str, ...] | None:
+    """Parse a projection of the review fields.
+
+    Args:
+        fields: The requested field names, each of them possibly a comma-separated
+            list of names, e.g. `["score,time", "summary"]`.
+
+    Raises:
+        InvalidFieldsError: If a name is not a `Review` field.
+
+    Returns:
+        tuple[str, ...] | None: The requested fields, without duplicates and in
+        `Review` field order, so equal projections are equal keys, or None to
+        return all the fields, when none or all of them are requested.
+    """
+    names = {name.strip() for item in fields for name in item.split(",")}
+    names.discard("")
+    unknown = names.difference(REVIEW_FIELDS)
+    if unknown:
+        raise InvalidFieldsError(sorted(unknown))
+    if not names or len(names) == len(REVIEW_FIELDS):
+        return None
+    return tuple(name for name in REVIEW_FIELDS if name in names)
+
+
+def get_review_fields(
+    fields: Annotated[
+        list[str],
+        Query(
+            description=(
+                "Review fields to return, comma-separated or repeated, all if not "
+                "set. Only the requested fields are read and serialized, so "
+                "leaving out `text` makes responses much smaller and faster."
+            ),
+            json_schema_extra={"items": {"type": "string", "enum": REVIEW_FIELDS}},
+            examples=[["score", "time", "summary"]],
+        ),
+    ] = [],
+) -> tuple[str, ...] | None:
+    """Get the review fields projection of a request.
+
+    Raises:
+        InvalidFieldsError: If a requested name is not a `Review` field.
+    """
+    return parse_fields(fields)
@@ -0,0 +1,115 @@
+"""Food Review API traffic recording middleware definition."""
+
+import json
+import os
+import random
+from pathlib import Path
+from threading import Lock
+from time import perf_counter, time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from food_review_api.core.config.recording import RecordingConfig
+
+MAX_RECORDED_BODY_BYTES = 2**16
+
+
+class RequestRecorder:
+    """Appender of recorded requests to a JSON lines file.
+
+    Each request is written as one line with a single `write` call on a file opened
+    in append mode, so the lines of several worker processes recording to the same
+    file are not interleaved. The file is opened on the first recorded request,
+    i.e. in the worker process.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Initialize recorder of a JSON lines file.
+
+        Args:
+            filename: The path of the file, created with its parent directories.
+        """
+        self.filename = filename
+        self._fd: int | None = None
+        self._lock = Lock()
+
+    def record(self, request: dict[str, Any]) -> None:
+        """Append a recorded request to the file."""
+        line = json.dumps(request, separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            if self._fd is None:
+                Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(
+                    self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                )
+            os.write(self._fd, line)
+
+
+class RecordingMiddleware:
+    """ASGI middleware recording a sample of the HTTP requests.
+
+    The method, path, query string, body of small requests, start time, duration
+    and response status of each sampled request are recorded, so the traffic can
+    be replayed later against the API.
+    """
+
+    def __init__(self, app: ASGIApp, config: RecordingConfig) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            config: The traffic recording configuration.
+        """
+        self.app = app
+        self.sample_rate = config.sample_rate
+        self.recorder = RequestRecorder(config.filename)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, recording it if it is sampled."""
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        body = bytearray()
+        status = 500
+
+        async def receive_recording() -> Message:
+            message = await receive()
+            if (
+                message["type"] == "http.request"
+                and len(body) <= MAX_RECORDED_BODY_BYTES
+            ):
+                chunk = message.get("body", b"")
+                body.extend(chunk[: MAX_RECORDED_BODY_BYTES + 1 - len(body)])
+            return message
+
+        async def send_recording(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started_at = time()
+        started = perf_counter()
+        try:
+            await self.app(scope, receive_recording, send_recording)
+        finally:
+            self.recorder.record(
+                {
+                    "timestamp": started_at,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "query": scope["query_string"].decode("latin-1"),
+                    "body": _recorded_body(body),
+                    "status": status,
+                    "duration_ms": (perf_counter() - started) * 1000,
+                }
+            )
+
+
+def _recorded_body(body: bytearray) -> str | None:
+    """Get the recorded text of a request body, None if empty or too large."""
+    if not body or len(body) > MAX_RECORDED_BODY_BYTES:
+        return None
+    return body.decode("utf-8", errors="replace")
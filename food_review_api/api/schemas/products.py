@@ -1,8 +1,13 @@
 """Food Review API products schema definitions."""
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 from food_review_api.core.config.database import DatabaseConfig
+from food_review_api.products.schemas.review import Review
+
+MAX_BATCH_PRODUCTS = 500
 
 
 class ProductsListResponse(BaseModel):
@@ -18,7 +23,64 @@ class ProductReviewsCountResponse(BaseModel):
     number_of_reviews: int
 
 
+class ProductStatsResponse(BaseModel):
+    """Product Stats API response model."""
+
+    product_id: str
+    number_of_reviews: int
+    mean_score: float
+    median_score: float
+    score_histogram: list[int] = Field(
+        description="Number of reviews with a score of 1, 2, 3, 4 and 5"
+    )
+    helpfulness_ratio: float | None = Field(
+        description="Helpful votes over all helpfulness votes, null without votes"
+    )
+    distinct_reviewers: int
+    first_review_time: int = Field(description="Timestamp of the first review")
+    last_review_time: int = Field(description="Timestamp of the last review")
+
+
 class ProductsMetadataResponse(BaseModel):
     """Products Metadata API response model."""
 
     products: DatabaseConfig
+    generation: int = Field(description="Generation of the published products snapshot")
+    reloading: bool = Field(
+        description="Whether a new products snapshot is being built"
+    )
+
+
+class ProductsBatchRequest(BaseModel):
+    """Products Batch API request model."""
+
+    product_ids: list[str] = Field(min_length=1, max_length=MAX_BATCH_PRODUCTS)
+    include: Literal["reviews", "stats"] = Field(
+        default="reviews", description="Whether to return reviews or statistics"
+    )
+    limit: int | None = Field(
+        default=None,
+        gt=0,
+        le=1000,
+        description="Maximum number of reviews of each product, all if null",
+    )
+
+
+class ProductBatchResult(BaseModel):
+    """Product result of the Products Batch API response model."""
+
+    product_id: str
+    number_of_reviews: int = Field(description="Total number of reviews")
+    reviews: list[Review] | None = None
+    stats: ProductStatsResponse | None = None
+
+
+class ProductsBatchResponse(BaseModel):
+    """Products Batch API response model."""
+
+    products: list[ProductBatchResult] = Field(
+        description="Results of the loaded products, in request order"
+    )
+    missing_product_ids: list[str] = Field(
+        description="Requested product identifiers which are not loaded"
+    )
@@ -1,11 +1,38 @@
 """Food Review API reviews schema definitions."""
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 from food_review_api.products.schemas.review import Review
 
+ReviewSort = Literal["time", "-time", "score", "-score", "helpfulness", "-helpfulness"]
+
 
 class ReviewsResponse(BaseModel):
     """Reviews API response model."""
 
     reviews: list[Review]
+    number_of_reviews: int = Field(
+        description=(
+            "Total number of reviews of the product matching the filters, across "
+            "all pages"
+        )
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to fetch the next page, null on the last page",
+    )
+
+
+class LatestReviewsResponse(BaseModel):
+    """Latest reviews API response model."""
+
+    reviews: list[Review] = Field(description="Reviews by descending time")
+    number_of_reviews: int = Field(
+        description="Total number of reviews in the time range, across all pages"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to fetch the next page, null on the last page",
+    )
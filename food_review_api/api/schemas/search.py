@@ -0,0 +1,25 @@
+"""Food Review API search schema definitions."""
+
+from pydantic import BaseModel, Field
+
+from food_review_api.products.schemas.review import Review
+
+
+class SearchResult(BaseModel):
+    """Search result API response model."""
+
+    review: Review
+    score: float = Field(description="BM25 relevance score of the review")
+
+
+class SearchResponse(BaseModel):
+    """Search API response model."""
+
+    results: list[SearchResult]
+    number_of_results: int = Field(
+        description="Total number of matching reviews, across all pages"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to fetch the next page, null on the last page",
+    )
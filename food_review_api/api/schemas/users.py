@@ -0,0 +1,28 @@
+"""Food Review API users schema definitions."""
+
+from pydantic import BaseModel, Field
+
+from food_review_api.products.schemas.review import Review
+
+
+class ReviewerCountResponse(BaseModel):
+    """Reviewer Reviews Count API response model."""
+
+    user_id: str
+    profile_name: str | None = Field(description="Profile name of the latest review")
+    number_of_reviews: int
+
+
+class UserReviewsResponse(BaseModel):
+    """User Reviews API response model."""
+
+    user_id: str
+    profile_name: str | None = Field(description="Profile name of the latest review")
+    reviews: list[Review] = Field(description="Reviews by ascending time")
+    number_of_reviews: int = Field(
+        description="Total number of reviews of the user, across all pages"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to fetch the next page, null on the last page",
+    )
@@ -0,0 +1,170 @@
+"""Food Review API pre-forking server definition."""
+
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from logging import getLogger
+
+import uvicorn
+from fastapi import FastAPI
+
+from food_review_api.core.config.server import ServerConfig
+
+logger = getLogger(__name__)
+
+SUPERVISION_INTERVAL = 0.1
+
+
+class ReloadUnavailableError(RuntimeError):
+    """Exception thrown when products are reloaded by one of several workers."""
+
+
+def create_server_socket(config: ServerConfig) -> socket.socket:
+    """Create the listening socket shared by every worker.
+
+    Args:
+        config: The server configuration, with the address to listen on.
+
+    Returns:
+        socket.socket: The bound and listening socket.
+    """
+    family = socket.AF_INET6 if ":" in config.host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((config.host, config.port))
+    sock.listen(socket.SOMAXCONN)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    """Pre-forking server supervisor.
+
+    The supervisor forks the configured number of uvicorn worker processes, which
+    all accept connections on the same listening socket. Anything loaded in the
+    supervisor process before `run` is called, e.g. the product repository, is
+    shared copy-on-write by the workers instead of being loaded by each of them.
+
+    The app of each worker gets the number of workers in `app.state.workers`.
+    Reloading the products in one worker would leave the others serving the
+    previous snapshot, and would copy the reloaded snapshot in the worker instead
+    of sharing it, so the reload route is disabled with more than one worker, and
+    products are reloaded by restarting the service.
+
+    Workers exiting unexpectedly are restarted, and on `SIGTERM` or `SIGINT` the
+    workers are asked to shut down gracefully, and killed if still running after
+    the graceful shutdown timeout.
+    """
+
+    def __init__(self, config: ServerConfig, app_factory: Callable[[], FastAPI]):
+        """Initialize supervisor without workers.
+
+        Args:
+            config: The server configuration.
+            app_factory: The function building the app served by each worker.
+        """
+        self.config = config
+        self.app_factory = app_factory
+        self.workers: dict[int, int] = {}
+        self._started_at: dict[int, float] = {}
+        self._pending_restarts: dict[int, float] = {}
+        self._stop_deadline: float | None = None
+
+    @property
+    def stopping(self) -> bool:
+        """Check if the supervisor is shutting down."""
+        return self._stop_deadline is not None
+
+    def run(self, sock: socket.socket) -> None:
+        """Run workers serving on a socket until the supervisor is stopped.
+
+        Args:
+            sock: The listening socket shared by the workers.
+        """
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for slot in range(self.config.workers):
+            self._spawn(slot, sock)
+
+        while self.workers or (self._pending_restarts and not self.stopping):
+            self._reap()
+            now = time.monotonic()
+            if self.stopping and now >= self._stop_deadline:
+                self._signal_workers(signal.SIGKILL)
+            for slot, restart_at in list(self._pending_restarts.items()):
+                if not self.stopping and now >= restart_at:
+                    del self._pending_restarts[slot]
+                    self._spawn(slot, sock)
+            time.sleep(SUPERVISION_INTERVAL)
+        logger.info("All workers exited.")
+
+    def stop(self, signum: int = signal.SIGTERM, frame=None) -> None:
+        """Ask workers to shut down gracefully, and stop restarting them."""
+        if not self.stopping:
+            logger.info("Shutting down %d workers.", len(self.workers))
+            self._stop_deadline = (
+                time.monotonic() + self.config.timeout_graceful_shutdown
+            )
+        self._signal_workers(signal.SIGTERM)
+
+    def _spawn(self, slot: int, sock: socket.socket) -> None:
+        """Fork a worker process for a worker slot."""
+        self._started_at[slot] = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._serve(sock)
+                exit_code = 0
+            except BaseException:
+                logger.exception("Worker crashed.")
+            finally:
+                os._exit(exit_code)
+        logger.info("Started worker %d (pid %d).", slot, pid)
+        self.workers[pid] = slot
+
+    def _serve(self, sock: socket.socket) -> None:
+        """Serve the app on the shared socket, in a worker process."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        app = self.app_factory()
+        app.state.workers = self.config.workers
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                log_level=self.config.log_level,
+                access_log=True,
+                timeout_graceful_shutdown=self.config.timeout_graceful_shutdown,
+            )
+        )
+        server.run(sockets=[sock])
+
+    def _reap(self) -> None:
+        """Collect exited workers, scheduling their restart if not stopping."""
+        while self.workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            slot = self.workers.pop(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                logger.info("Worker %d (pid %d) exited.", slot, pid)
+                continue
+            logger.warning(
+                "Worker %d (pid %d) exited with code %d, restarting it.",
+                slot,
+                pid,
+                exit_code,
+            )
+            restart_at = self._started_at[slot] + self.config.restart_delay
+            self._pending_restarts[slot] = restart_at
+
+    def _signal_workers(self, signum: int) -> None:
+        """Send a signal to every running worker."""
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
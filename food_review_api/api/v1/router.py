@@ -1,9 +1,21 @@
 """Food Review API v1 router definition."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from food_review_api.api.v1.routes import products, reviews
+from food_review_api.api.dependencies import require_loaded_products
+from food_review_api.api.v1.routes import products, reviews, search, users
 
+# Products routes require the products to be loaded, but for the reload route,
+# so they declare the dependency route by route.
+loaded = [Depends(require_loaded_products)]
 router = APIRouter()
 router.include_router(router=products.router, prefix="/products", tags=["Products"])
-router.include_router(router=reviews.router, prefix="/reviews", tags=["Reviews"])
+router.include_router(
+    router=reviews.router, prefix="/reviews", tags=["Reviews"], dependencies=loaded
+)
+router.include_router(
+    router=search.router, prefix="/search", tags=["Search"], dependencies=loaded
+)
+router.include_router(
+    router=users.router, prefix="/users", tags=["Users"], dependencies=loaded
+)
@@ -1,26 +1,48 @@
 """Food Review API products router definition."""
 
 from logging import getLogger
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 
-from food_review_api.api.dependencies import fetch_configuration, get_product_repository
+from food_review_api.api.cache import ResponseCache, cached_json_response
+from food_review_api.api.dependencies import (
+    fetch_configuration,
+    get_product_repository,
+    get_response_cache,
+    require_loaded_products,
+)
+from food_review_api.api.server import ReloadUnavailableError
 from food_review_api.api.schemas.products import (
+    ProductBatchResult,
     ProductReviewsCountResponse,
+    ProductsBatchRequest,
+    ProductsBatchResponse,
     ProductsListResponse,
     ProductsMetadataResponse,
+    ProductStatsResponse,
 )
 from food_review_api.core.config.configuration import Configuration
-from food_review_api.products.repository import ProductRepository, product_repository
+from food_review_api.products.repository import ProductRepository
 
 logger = getLogger(__name__)
 router = APIRouter()
+review_counts_adapter = TypeAdapter(list[ProductReviewsCountResponse])
+stats_adapter = TypeAdapter(ProductStatsResponse)
+products_list_adapter = TypeAdapter(ProductsListResponse)
+batch_adapter = TypeAdapter(ProductsBatchResponse)
 
 
-@router.get("", response_model=ProductsListResponse)
+@router.get(
+    "",
+    response_model=ProductsListResponse,
+    dependencies=[Depends(require_loaded_products)],
+)
 async def get_products(
+    request: Request,
     product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
 ):
     """Get a list of all products available in the service.
 
@@ -30,15 +52,32 @@ async def get_products(
         ProductsListResponse: A response containing a list of all products available in
         the service.
     """
-    return ProductsListResponse(
-        available_products=product_repository.available_products
+    snapshot = product_repository.snapshot
+
+    def serialize_products() -> bytes:
+        return products_list_adapter.dump_json(
+            ProductsListResponse(available_products=snapshot.store.product_ids.tolist())
+        )
+
+    cached = await response_cache.get(
+        snapshot,
+        ("products",),
+        serialize_products,
+        request.headers.get("accept-encoding"),
     )
+    return cached_json_response(request, cached)
 
 
-@router.get("/most_reviewed", response_model=list[ProductReviewsCountResponse])
+@router.get(
+    "/most_reviewed",
+    response_model=list[ProductReviewsCountResponse],
+    dependencies=[Depends(require_loaded_products)],
+)
 async def get_most_reviewed_products(
+    request: Request,
     n: Annotated[int, Query(gt=0)],
     product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
 ):
     """Get the most reviewed products.
 
@@ -52,19 +91,21 @@ async def get_most_reviewed_products(
         objects, each containing the `product_id` and `number_of_reviews` for the
         top `n` products.
     """
-    top_reviewed_products = await product_repository.most_commented_products(n=n)
-    return [
-        ProductReviewsCountResponse(
-            product_id=product_id, number_of_reviews=number_of_reviews
-        )
-        for product_id, number_of_reviews in top_reviewed_products.items()
-    ]
+    return await review_counts_response(
+        request, product_repository, response_cache, "most_reviewed", n
+    )
 
 
-@router.get("/least_reviewed", response_model=list[ProductReviewsCountResponse])
+@router.get(
+    "/least_reviewed",
+    response_model=list[ProductReviewsCountResponse],
+    dependencies=[Depends(require_loaded_products)],
+)
 async def get_least_reviewed_products(
+    request: Request,
     n: Annotated[int, Query(gt=0)],
     product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
 ):
     """Get the least reviewed products.
 
@@ -78,29 +119,176 @@ async def get_least_reviewed_products(
         objects, each containing the `product_id` and `number_of_reviews` for the
         bottom `n` products.
     """
-    least_reviewed_products = await product_repository.least_commented_products(n=n)
-    return [
-        ProductReviewsCountResponse(
-            product_id=product_id, number_of_reviews=number_of_reviews
+    return await review_counts_response(
+        request, product_repository, response_cache, "least_reviewed", n
+    )
+
+
+async def review_counts_response(
+    request: Request,
+    product_repository: ProductRepository,
+    response_cache: ResponseCache,
+    ranking: Literal["most_reviewed", "least_reviewed"],
+    n: int,
+) -> Response:
+    """Build the response of a review counts ranking.
+
+    The serialized and compressed ranking is memoized in the products snapshot, so
+    it is computed once per dataset generation and value of `n`.
+
+    Args:
+        request: The incoming request.
+        product_repository: The product repository.
+        response_cache: The response cache rendering the ranking.
+        ranking: The name of the ranking, `most_reviewed` or `least_reviewed`.
+        n: The number of distinct review counts to include.
+
+    Returns:
+        Response: The JSON response with the serialized ranking.
+    """
+    snapshot = product_repository.snapshot
+    n = min(n, snapshot.ranking.tier_count)
+
+    def serialize_ranking() -> bytes:
+        review_counts = getattr(snapshot.ranking, ranking)(n)
+        return review_counts_adapter.dump_json(
+            [
+                ProductReviewsCountResponse(
+                    product_id=product_id, number_of_reviews=number_of_reviews
+                )
+                for product_id, number_of_reviews in review_counts
+            ]
+        )
+
+    cached = snapshot.memoize(
+        (ranking, n), lambda: response_cache.render(snapshot, serialize_ranking)
+    )
+    await response_cache.encode(cached, request.headers.get("accept-encoding"))
+    return cached_json_response(request, cached)
+
+
+@router.get(
+    "/{product_id}/stats",
+    response_model=ProductStatsResponse,
+    dependencies=[Depends(require_loaded_products)],
+    responses={304: {"description": "Stats not modified since `If-None-Match`"}},
+)
+async def get_product_stats(
+    request: Request,
+    product_id: str,
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+) -> Response:
+    """Get aggregate statistics of the reviews of a product.
+
+    Statistics are precomputed for every product when the products are loaded,
+    e.g. the mean score or the score histogram, so clients do not need to fetch
+    all the reviews of a product to compute them.
+
+    Args:
+        product_id (str): The `product_id` to get the statistics for.
+
+    Returns:
+        ProductStatsResponse: A response containing the product review statistics.
+    """
+    snapshot = product_repository.snapshot
+
+    def render_stats() -> bytes:
+        return stats_adapter.dump_json(
+            ProductStatsResponse(
+                product_id=product_id, **snapshot.get_stats(product_id)
+            )
         )
-        for product_id, number_of_reviews in least_reviewed_products.items()
-    ]
 
+    cached = await response_cache.get(
+        snapshot,
+        key=("stats", product_id),
+        render=render_stats,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return cached_json_response(request, cached)
+
+
+@router.post(
+    "/batch",
+    response_model=ProductsBatchResponse,
+    dependencies=[Depends(require_loaded_products)],
+)
+async def get_products_batch(
+    batch: ProductsBatchRequest,
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+) -> Response:
+    """Get the reviews or statistics of several products at once.
+
+    The reviews, or statistics, of all the requested products are gathered from
+    the products snapshot in a single pass. Products which are not loaded do not
+    fail the request, but are listed in `missing_product_ids`.
+
+    Args:
+        batch (ProductsBatchRequest): The product identifiers, whether to include
+            their reviews or statistics, and the maximum reviews per product.
+
+    Returns:
+        ProductsBatchResponse: A response containing the results of the loaded
+        products, and the identifiers of the missing ones.
+    """
+    snapshot = product_repository.snapshot
+    product_ids = list(dict.fromkeys(batch.product_ids))
+    excluded = "reviews" if batch.include == "stats" else "stats"
+    if batch.include == "stats":
+        stats, missing = snapshot.get_many_stats(product_ids)
+        products = [
+            ProductBatchResult(
+                product_id=product_id,
+                number_of_reviews=product_stats["number_of_reviews"],
+                stats=ProductStatsResponse(product_id=product_id, **product_stats),
+            )
+            for product_id, product_stats in stats
+        ]
+    else:
+        reviews, missing = snapshot.get_many_reviews(product_ids, limit=batch.limit)
+        products = [
+            ProductBatchResult(
+                product_id=product_id,
+                number_of_reviews=number_of_reviews,
+                reviews=product_reviews,
+            )
+            for product_id, product_reviews, number_of_reviews in reviews
+        ]
+    content = batch_adapter.dump_json(
+        ProductsBatchResponse(products=products, missing_product_ids=missing),
+        exclude={"products": {"__all__": {excluded}}},
+    )
+    return Response(content=content, media_type="application/json")
 
-@router.get(path="/reload", response_model=ProductsMetadataResponse)
+
+@router.get(
+    path="/reload",
+    response_model=ProductsMetadataResponse,
+    responses={409: {"description": "Products served by several workers"}},
+)
 def reload_products_from_registry(
-    background_tasks: BackgroundTasks,
+    request: Request,
     config: Annotated[Configuration, Depends(fetch_configuration)],
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
 ):
     """Trigger reloading of products from product registry.
 
-    This endpoint triggers a background task to reload products from the product registry.
+    This endpoint triggers a reload of products from the product registry in a
+    background worker. The new products snapshot is published atomically once it
+    is fully built, and reload requests received while a reload is in flight are
+    merged into it.
 
-    Returns a JSON response with the current products metadata.
+    Returns a JSON response with the current products metadata and snapshot
+    generation, or a 409 Conflict when served by several forked workers, as the
+    reload would only reach the worker serving the request.
     """
+    if getattr(request.app.state, "workers", 1) > 1:
+        raise ReloadUnavailableError()
     logger.info("Triggering product reloading from product registry.")
-    background_tasks.add_task(
-        product_repository.load,
-        db=config.database,
+    product_repository.reload(config.database)
+    return ProductsMetadataResponse(
+        products=config.database,
+        generation=product_repository.generation,
+        reloading=product_repository.is_reloading,
     )
-    return ProductsMetadataResponse(products=config.database)
@@ -3,28 +3,198 @@
 from logging import getLogger
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 
-from food_review_api.api.dependencies import get_product_repository
-from food_review_api.api.schemas.reviews import ReviewsResponse
+from food_review_api.api.cache import ResponseCache, cached_json_response
+from food_review_api.api.dependencies import get_product_repository, get_response_cache
+from food_review_api.api.pagination import decode_cursor, encode_cursor
+from food_review_api.api.projection import get_review_fields
+from food_review_api.api.schemas.reviews import (
+    LatestReviewsResponse,
+    ReviewSort,
+    ReviewsResponse,
+)
 from food_review_api.products.repository import ProductRepository
 
 logger = getLogger(__name__)
 router = APIRouter()
+reviews_response_adapter = TypeAdapter(ReviewsResponse)
+latest_reviews_response_adapter = TypeAdapter(LatestReviewsResponse)
 
 
-@router.get("", response_model=ReviewsResponse)
+@router.get(
+    "",
+    response_model=ReviewsResponse,
+    responses={304: {"description": "Reviews not modified since `If-None-Match`"}},
+)
 async def get_product_reviews(
+    request: Request,
     product_id: str,
     reviews_repository: Annotated[ProductRepository, Depends(get_product_repository)],
-):
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    limit: Annotated[int | None, Query(gt=0, le=1000)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query()] = None,
+    since: Annotated[int | None, Query()] = None,
+    until: Annotated[int | None, Query()] = None,
+    sort: Annotated[
+        ReviewSort,
+        Query(
+            description=(
+                "Sort key, prefixed with `-` for descending order, e.g. "
+                "`-helpfulness` for the most helpful reviews first"
+            )
+        ),
+    ] = "time",
+    min_score: Annotated[int | None, Query(ge=0, le=5)] = None,
+    max_score: Annotated[int | None, Query(ge=0, le=5)] = None,
+    fields: Annotated[tuple[str, ...] | None, Depends(get_review_fields)] = None,
+) -> Response:
     """Get the reviews for a given product.
 
+    Reviews are returned by ascending time, or sorted by `sort`: by `time`, `score`
+    or `helpfulness`, ranked by the lower bound of the Wilson interval of the
+    helpful votes, ascending or descending with a `-` prefix, ties by time. Each
+    order is a permutation of the reviews precomputed when the products are
+    loaded, so a page is a slice of it. When `since` or `until` are set, only the
+    reviews in that time range are returned, and when `min_score` or `max_score`
+    are set, only the reviews in that score range. When `limit` is set, a page of at
+    most `limit` reviews is returned, starting at `offset` or at the position
+    encoded in `cursor`, together with the `next_cursor` to fetch the following page.
+
+    Responses are served from a cache of serialized responses, and carry an `ETag`
+    header, so clients sending it back in `If-None-Match` get a `304 Not Modified`
+    until the reviews change.
+
     Args:
         product_id (str): The `product_id` to get the reviews for.
+        limit (int, optional): The maximum number of reviews to return.
+        offset (int, optional): The number of reviews to skip.
+        cursor (str, optional): The `next_cursor` returned with the previous page,
+            takes precedence over `offset`.
+        since (int, optional): The earliest review time, inclusive.
+        until (int, optional): The latest review time, inclusive.
+        sort (str, optional): The sort key, prefixed with `-` for descending order.
+        min_score (int, optional): The lowest review score, inclusive.
+        max_score (int, optional): The highest review score, inclusive.
+        fields (list[str], optional): The review fields to return, all if not set.
 
     Returns:
         ReviewsResponse: A response containing the list of reviews for the given product.
     """
     logger.debug(f"Received request with product_id: {product_id}")
-    return ReviewsResponse(reviews=reviews_repository.get(product_id).reviews)
+    cursor_key = product_id
+    if since is not None or until is not None:
+        cursor_key = f"{product_id}:{since}:{until}"
+    if sort != "time" or min_score is not None or max_score is not None:
+        cursor_key = f"{cursor_key}:{sort}:{min_score}:{max_score}"
+    if cursor is not None:
+        offset = decode_cursor(cursor, key=cursor_key)
+    snapshot = reviews_repository.snapshot
+
+    def render_reviews() -> bytes:
+        reviews, number_of_reviews = snapshot.get_reviews(
+            product_id,
+            offset=offset,
+            limit=limit,
+            since=since,
+            until=until,
+            fields=fields,
+            sort=sort,
+            min_score=min_score,
+            max_score=max_score,
+        )
+        next_offset = offset + len(reviews)
+        next_cursor = None
+        if limit is not None and next_offset < number_of_reviews:
+            next_cursor = encode_cursor(cursor_key, next_offset)
+        return reviews_response_adapter.dump_json(
+            ReviewsResponse(
+                reviews=reviews,
+                number_of_reviews=number_of_reviews,
+                next_cursor=next_cursor,
+            )
+        )
+
+    cached = await response_cache.get(
+        snapshot,
+        key=(
+            "reviews",
+            product_id,
+            offset,
+            limit,
+            since,
+            until,
+            sort,
+            min_score,
+            max_score,
+            fields,
+        ),
+        render=render_reviews,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return cached_json_response(request, cached)
+
+
+@router.get(
+    "/latest",
+    response_model=LatestReviewsResponse,
+    responses={304: {"description": "Reviews not modified since `If-None-Match`"}},
+)
+async def get_latest_reviews(
+    request: Request,
+    reviews_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    limit: Annotated[int, Query(gt=0, le=1000)] = 10,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query()] = None,
+    since: Annotated[int | None, Query()] = None,
+    until: Annotated[int | None, Query()] = None,
+    fields: Annotated[tuple[str, ...] | None, Depends(get_review_fields)] = None,
+) -> Response:
+    """Get the latest reviews across all products.
+
+    Reviews are returned by descending time from an index of all the reviews by
+    time, so a page is a binary search and a slice of the index.
+
+    Args:
+        limit (int, optional): The maximum number of reviews to return.
+        offset (int, optional): The number of latest reviews to skip.
+        cursor (str, optional): The `next_cursor` returned with the previous page,
+            takes precedence over `offset`.
+        since (int, optional): The earliest review time, inclusive.
+        until (int, optional): The latest review time, inclusive.
+        fields (list[str], optional): The review fields to return, all if not set.
+
+    Returns:
+        LatestReviewsResponse: A response containing the latest reviews.
+    """
+    cursor_key = f"latest:{since}:{until}"
+    if cursor is not None:
+        offset = decode_cursor(cursor, key=cursor_key)
+    snapshot = reviews_repository.snapshot
+
+    def render_reviews() -> bytes:
+        reviews, number_of_reviews = snapshot.get_latest_reviews(
+            limit, offset=offset, since=since, until=until, fields=fields
+        )
+        next_offset = offset + len(reviews)
+        next_cursor = None
+        if next_offset < number_of_reviews:
+            next_cursor = encode_cursor(cursor_key, next_offset)
+        return latest_reviews_response_adapter.dump_json(
+            LatestReviewsResponse(
+                reviews=reviews,
+                number_of_reviews=number_of_reviews,
+                next_cursor=next_cursor,
+            )
+        )
+
+    cached = await response_cache.get(
+        snapshot,
+        key=("latest_reviews", offset, limit, since, until, fields),
+        render=render_reviews,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return cached_json_response(request, cached)
@@ -0,0 +1,86 @@
+"""Food Review API search router definition."""
+
+from logging import getLogger
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+
+from food_review_api.api.cache import ResponseCache, cached_json_response
+from food_review_api.api.dependencies import get_product_repository, get_response_cache
+from food_review_api.api.pagination import decode_cursor, encode_cursor
+from food_review_api.api.projection import get_review_fields
+from food_review_api.api.schemas.search import SearchResponse, SearchResult
+from food_review_api.products.repository import ProductRepository
+
+logger = getLogger(__name__)
+router = APIRouter()
+search_response_adapter = TypeAdapter(SearchResponse)
+
+
+@router.get(
+    "",
+    response_model=SearchResponse,
+    responses={304: {"description": "Results not modified since `If-None-Match`"}},
+)
+async def search_reviews(
+    request: Request,
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    reviews_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    product_id: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(gt=0, le=100)] = 10,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query()] = None,
+    fields: Annotated[tuple[str, ...] | None, Depends(get_review_fields)] = None,
+) -> Response:
+    """Search reviews by keywords in their summary and text.
+
+    Reviews matching any of the words of `q` are returned by descending relevance,
+    scored with BM25 over an inverted index built when the products are loaded.
+    Results are paginated like the reviews of a product.
+
+    Args:
+        q (str): The keywords to search for.
+        product_id (str, optional): The product to search the reviews of.
+        limit (int, optional): The maximum number of results to return.
+        offset (int, optional): The number of best results to skip.
+        cursor (str, optional): The `next_cursor` returned with the previous page,
+            takes precedence over `offset`.
+        fields (list[str], optional): The review fields to return, all if not set.
+
+    Returns:
+        SearchResponse: A response containing the best matching reviews.
+    """
+    logger.debug(f"Received search request with q: {q}, product_id: {product_id}")
+    cursor_key = f"{product_id or ''}:{q}"
+    if cursor is not None:
+        offset = decode_cursor(cursor, key=cursor_key)
+    snapshot = reviews_repository.snapshot
+
+    def render_results() -> bytes:
+        matches, number_of_results = snapshot.search(
+            q, limit=limit, offset=offset, product_id=product_id, fields=fields
+        )
+        next_offset = offset + len(matches)
+        next_cursor = None
+        if next_offset < number_of_results:
+            next_cursor = encode_cursor(cursor_key, next_offset)
+        return search_response_adapter.dump_json(
+            SearchResponse(
+                results=[
+                    SearchResult(review=review, score=score)
+                    for review, score in matches
+                ],
+                number_of_results=number_of_results,
+                next_cursor=next_cursor,
+            )
+        )
+
+    cached = await response_cache.get(
+        snapshot,
+        key=("search", q, product_id, offset, limit, fields),
+        render=render_results,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return cached_json_response(request, cached)
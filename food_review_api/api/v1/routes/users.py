@@ -0,0 +1,126 @@
+"""Food Review API users router definition."""
+
+from logging import getLogger
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+
+from food_review_api.api.cache import ResponseCache, cached_json_response
+from food_review_api.api.dependencies import get_product_repository, get_response_cache
+from food_review_api.api.pagination import decode_cursor, encode_cursor
+from food_review_api.api.projection import get_review_fields
+from food_review_api.api.schemas.users import ReviewerCountResponse, UserReviewsResponse
+from food_review_api.products.repository import ProductRepository
+
+logger = getLogger(__name__)
+router = APIRouter()
+reviewer_counts_adapter = TypeAdapter(list[ReviewerCountResponse])
+user_reviews_adapter = TypeAdapter(UserReviewsResponse)
+
+
+@router.get("/top_reviewers", response_model=list[ReviewerCountResponse])
+async def get_top_reviewers(
+    request: Request,
+    k: Annotated[int, Query(gt=0, le=1000)],
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+) -> Response:
+    """Get the users with most reviews.
+
+    This endpoint returns the `k` users with most reviews, by descending number of
+    reviews, from a ranking precomputed when the products are loaded.
+
+    Args:
+        k (int): The number of users to return.
+
+    Returns:
+        list[ReviewerCountResponse]: A list of `ReviewerCountResponse` objects, each
+        containing the `user_id`, `profile_name` and `number_of_reviews` of a user.
+    """
+    snapshot = product_repository.snapshot
+
+    def serialize_top_reviewers() -> bytes:
+        return reviewer_counts_adapter.dump_json(
+            [
+                ReviewerCountResponse(
+                    user_id=user_id,
+                    profile_name=profile_name,
+                    number_of_reviews=number_of_reviews,
+                )
+                for user_id, profile_name, number_of_reviews in (
+                    snapshot.reviewers.top_reviewers(k)
+                )
+            ]
+        )
+
+    cached = snapshot.memoize(
+        ("top_reviewers", k),
+        lambda: response_cache.render(snapshot, serialize_top_reviewers),
+    )
+    await response_cache.encode(cached, request.headers.get("accept-encoding"))
+    return cached_json_response(request, cached)
+
+
+@router.get(
+    "/{user_id}/reviews",
+    response_model=UserReviewsResponse,
+    responses={304: {"description": "Reviews not modified since `If-None-Match`"}},
+)
+async def get_user_reviews(
+    request: Request,
+    user_id: str,
+    product_repository: Annotated[ProductRepository, Depends(get_product_repository)],
+    response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    limit: Annotated[int | None, Query(gt=0, le=1000)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query()] = None,
+    fields: Annotated[tuple[str, ...] | None, Depends(get_review_fields)] = None,
+) -> Response:
+    """Get the reviews written by a user.
+
+    Reviews are returned by ascending time, from an index of the reviews by user
+    built when the products are loaded, and paginated like the reviews of a
+    product.
+
+    Args:
+        user_id (str): The `user_id` to get the reviews for.
+        limit (int, optional): The maximum number of reviews to return.
+        offset (int, optional): The number of reviews to skip.
+        cursor (str, optional): The `next_cursor` returned with the previous page,
+            takes precedence over `offset`.
+        fields (list[str], optional): The review fields to return, all if not set.
+
+    Returns:
+        UserReviewsResponse: A response containing the reviews of the user.
+    """
+    logger.debug(f"Received request with user_id: {user_id}")
+    if cursor is not None:
+        offset = decode_cursor(cursor, key=user_id)
+    snapshot = product_repository.snapshot
+
+    def render_reviews() -> bytes:
+        profile_name, reviews, number_of_reviews = snapshot.get_user_reviews(
+            user_id, offset=offset, limit=limit, fields=fields
+        )
+        next_offset = offset + len(reviews)
+        next_cursor = None
+        if limit is not None and next_offset < number_of_reviews:
+            next_cursor = encode_cursor(user_id, next_offset)
+        return user_reviews_adapter.dump_json(
+            UserReviewsResponse(
+                user_id=user_id,
+                profile_name=profile_name,
+                reviews=reviews,
+                number_of_reviews=number_of_reviews,
+                next_cursor=next_cursor,
+            )
+        )
+
+    cached = await response_cache.get(
+        snapshot,
+        key=("user_reviews", user_id, offset, limit, fields),
+        render=render_reviews,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return cached_json_response(request, cached)
@@ -1,13 +1,31 @@
 """Food Review API configuration package entrypoint."""
 
 from food_review_api.core.config.api import ApiConfig
-from food_review_api.core.config.configuration import Configuration
+from food_review_api.core.config.cache import ResponseCacheConfig
+from food_review_api.core.config.compression import CompressionConfig
+from food_review_api.core.config.configuration import (
+    Configuration,
+    clear_configuration_cache,
+    get_configuration,
+)
 from food_review_api.core.config.database import DatabaseConfig
 from food_review_api.core.config.logging import LoggingConfig
+from food_review_api.core.config.metrics import MetricsConfig
+from food_review_api.core.config.profiling import ProfilingConfig
+from food_review_api.core.config.recording import RecordingConfig
+from food_review_api.core.config.server import ServerConfig
 
 __all__ = [
     "ApiConfig",
+    "CompressionConfig",
     "Configuration",
     "DatabaseConfig",
     "LoggingConfig",
+    "MetricsConfig",
+    "ProfilingConfig",
+    "RecordingConfig",
+    "ResponseCacheConfig",
+    "ServerConfig",
+    "clear_configuration_cache",
+    "get_configuration",
 ]
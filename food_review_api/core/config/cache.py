@@ -0,0 +1,14 @@
+"""Food Review API response cache configuration class definition."""
+
+from pydantic import BaseModel, Field
+
+
+class ResponseCacheConfig(BaseModel):
+    """Response cache configuration model."""
+
+    enabled: bool = True
+    max_bytes: int = Field(
+        default=64 * 2**20,
+        ge=0,
+        description="Maximum size in bytes of the cached response bodies.",
+    )
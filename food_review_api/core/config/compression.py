@@ -0,0 +1,64 @@
+"""Food Review API response compression configuration class definition."""
+
+from pydantic import BaseModel, Field
+
+
+class CompressionConfig(BaseModel):
+    """Response compression configuration model."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether responses are compressed for clients accepting it.",
+    )
+    minimum_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Smallest response body compressed, in bytes.",
+    )
+    gzip_level: int = Field(
+        default=6,
+        ge=1,
+        le=9,
+        description=(
+            "Gzip level of the cached responses, compressed once and served many times."
+        ),
+    )
+    brotli_quality: int = Field(
+        default=6,
+        ge=0,
+        le=11,
+        description=(
+            "Brotli quality of the cached responses, if the `brotli` package is "
+            "installed."
+        ),
+    )
+    dynamic_gzip_level: int = Field(
+        default=1,
+        ge=1,
+        le=9,
+        description="Gzip level of the responses compressed on every request.",
+    )
+    dynamic_brotli_quality: int = Field(
+        default=1,
+        ge=0,
+        le=11,
+        description="Brotli quality of the responses compressed on every request.",
+    )
+    max_dynamic_size: int = Field(
+        default=2**20,
+        ge=0,
+        description=(
+            "Largest response body compressed on a request, in bytes, to bound "
+            "the CPU time spent per request. Larger bodies are sent uncompressed, "
+            "unless cached already compressed."
+        ),
+    )
+    offload_size: int = Field(
+        default=16 * 2**10,
+        ge=0,
+        description=(
+            "Smallest response body compressed in a worker thread rather than on "
+            "the event loop, in bytes. Smaller bodies are compressed faster than "
+            "they would be handed over to a thread."
+        ),
+    )
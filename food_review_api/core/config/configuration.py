@@ -1,15 +1,27 @@
 """Food Review API configuration class definition."""
 
 import os
+from functools import cache
 from importlib.metadata import version as package_version
+from pathlib import Path
+from threading import Lock
 from typing import ClassVar, Self
 
 from pydantic import Field
 
 from food_review_api.core.config.__base import BaseConfiguration
+from food_review_api.core.config.__config_service_source import (
+    ConfigServiceSettingsSource,
+)
 from food_review_api.core.config.api import ApiConfig
+from food_review_api.core.config.cache import ResponseCacheConfig
+from food_review_api.core.config.compression import CompressionConfig
 from food_review_api.core.config.database import DatabaseConfig
 from food_review_api.core.config.logging import LoggingConfig
+from food_review_api.core.config.metrics import MetricsConfig
+from food_review_api.core.config.profiling import ProfilingConfig
+from food_review_api.core.config.recording import RecordingConfig
+from food_review_api.core.config.server import ServerConfig
 
 ENVIRONMENT = os.environ.get("MYT_ENVIRONMENT", "local")
 SERVICE_NAME = os.environ.get("SERVICE_NAME", "food-review-api")
@@ -42,8 +54,98 @@ class Configuration(BaseConfiguration):
         title="Database configuration",
         description=("Database configuration options, file with the reviews."),
     )
+    response_cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        title="Response cache configuration",
+        description="Cache of serialized responses options, enabled flag and size.",
+    )
+    compression: CompressionConfig = Field(
+        default_factory=CompressionConfig,
+        title="Response compression configuration",
+        description="Gzip and brotli compression options of the responses.",
+    )
+    server: ServerConfig = Field(
+        default_factory=ServerConfig,
+        title="Server configuration",
+        description="Server options, address to listen on and number of workers.",
+    )
+    metrics: MetricsConfig = Field(
+        default_factory=MetricsConfig,
+        title="Metrics configuration",
+        description="Request metrics options, served on `/metrics` when enabled.",
+    )
+    profiling: ProfilingConfig = Field(
+        default_factory=ProfilingConfig,
+        title="Request profiling configuration",
+        description="Profiling of requests asking for it or sampled, off by default.",
+    )
+    recording: RecordingConfig = Field(
+        default_factory=RecordingConfig,
+        title="Traffic recording configuration",
+        description="Recording of sampled requests to a JSON lines file, off by default.",
+    )
 
     @property
     def version(self: Self) -> str:
         """Get food review API package version."""
-        return package_version("food_review_api")
+        return _food_review_api_version()
+
+
+@cache
+def _food_review_api_version() -> str:
+    """Get food review API package version, read once per process."""
+    return package_version("food_review_api")
+
+
+_configuration_lock = Lock()
+_configuration_cache: tuple[tuple, Configuration] | None = None
+
+
+def _configuration_cache_key() -> tuple:
+    """Get the key identifying the sources of the cached configuration.
+
+    The key changes whenever the local configuration file is modified, so edits to
+    it are picked up without restarting the service.
+    """
+    config_file = Path(
+        Configuration.config_file_local
+        or ConfigServiceSettingsSource.DEFAULT_CONFIG_FILE_LOCAL
+    )
+    try:
+        stat = config_file.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
+    return (
+        str(config_file),
+        file_key,
+        Configuration.environment,
+        Configuration.service_name,
+    )
+
+
+def get_configuration() -> Configuration:
+    """Get the process-wide cached application configuration.
+
+    The configuration is parsed on first use and then cached, and rebuilt only when
+    the local configuration file changes or `clear_configuration_cache` is called.
+
+    Returns:
+        Configuration: The application configuration.
+    """
+    global _configuration_cache
+    key = _configuration_cache_key()
+    cached = _configuration_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with _configuration_lock:
+        config = Configuration()
+        _configuration_cache = (key, config)
+    return config
+
+
+def clear_configuration_cache() -> None:
+    """Invalidate the cached configuration, so the next use parses it again."""
+    global _configuration_cache
+    with _configuration_lock:
+        _configuration_cache = None
@@ -1,15 +1,104 @@
 """Food Review API database configuration class definition."""
 
+from glob import glob
+
 from pydantic import BaseModel, Field, field_validator
 
 
 class DatabaseConfig(BaseModel):
     """Database configuration model."""
 
-    filename: str = Field(frozen=True)
+    filename: str | list[str] = Field(
+        frozen=True,
+        description="Path or glob pattern of the reviews CSV files, or a list of them.",
+    )
     version: str = "1"
+    chunk_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="Number of CSV rows parsed and ingested per chunk.",
+    )
+    max_rows: int | None = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of rows to ingest per CSV file, all if not set.",
+    )
+    load_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Number of processes parsing CSV files in parallel, one per CPU core if "
+            "not set."
+        ),
+    )
+    snapshot_cache: bool = Field(
+        default=False,
+        description=(
+            "Whether to keep a binary snapshot of the loaded reviews next to the CSV "
+            "file, memory-mapped on later loads instead of parsing the CSV file."
+        ),
+    )
+    text_compression: bool = Field(
+        default=False,
+        description=(
+            "Whether to keep the review summaries and texts in zlib compressed "
+            "blocks, decompressed when read, rather than uncompressed."
+        ),
+    )
+    text_block_size: int = Field(
+        default=2**14,
+        gt=0,
+        description="Number of bytes of review text packed into each compressed block.",
+    )
+    text_cache_blocks: int = Field(
+        default=256,
+        ge=0,
+        description=(
+            "Number of decompressed blocks of each text column kept in cache, for "
+            "the most recently read products."
+        ),
+    )
+    background_load: bool = Field(
+        default=True,
+        description=(
+            "Whether the API starts accepting requests while the reviews are loaded "
+            "in the background, reporting the load progress on `/ready`, rather than "
+            "once they are loaded."
+        ),
+    )
+
+    @field_validator("filename")
+    def check_filename_is_not_empty(cls, value: str | list[str]):
+        """Validator to reject empty lists of paths, and empty paths."""
+        patterns = [value] if isinstance(value, str) else value
+        if not patterns:
+            raise ValueError(
+                "At least one reviews CSV file path or pattern is required"
+            )
+        if not all(pattern.strip() for pattern in patterns):
+            raise ValueError("Reviews CSV file paths and patterns must not be empty")
+        return value
 
     @field_validator("version", mode="before")
     def cast_version_to_string(cls, value: int | str):
         """Validator to cast version integers to strings."""
         return str(value) if isinstance(value, int) else value
+
+    @property
+    def sources(self) -> list[str]:
+        """Get the paths of the reviews CSV files, expanding glob patterns.
+
+        Raises:
+            FileNotFoundError: If a glob pattern does not match any file.
+        """
+        patterns = [self.filename] if isinstance(self.filename, str) else self.filename
+        sources = []
+        for pattern in patterns:
+            if not any(char in pattern for char in "*?["):
+                sources.append(pattern)
+                continue
+            matches = sorted(glob(pattern))
+            if not matches:
+                raise FileNotFoundError(f"No reviews files match {pattern}")
+            sources.extend(matches)
+        return list(dict.fromkeys(sources))
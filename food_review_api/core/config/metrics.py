@@ -0,0 +1,12 @@
+"""Food Review API metrics configuration class definition."""
+
+from pydantic import BaseModel, Field
+
+
+class MetricsConfig(BaseModel):
+    """Metrics configuration model."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether to record request metrics and serve them on `/metrics`.",
+    )
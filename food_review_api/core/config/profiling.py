@@ -0,0 +1,51 @@
+"""Food Review API request profiling configuration class definition."""
+
+from pydantic import BaseModel, Field, SecretStr
+
+
+class ProfilingConfig(BaseModel):
+    """Request profiling configuration model."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Whether requests can be profiled, no overhead when disabled.",
+    )
+    header: str | None = Field(
+        default="X-Profile",
+        description=(
+            "Request header profiling a request when set to the secret, returning "
+            "its profile inline when set to `inline:` followed by the secret, not "
+            "checked if null."
+        ),
+    )
+    secret: SecretStr | None = Field(
+        default=None,
+        description=(
+            "Value of the profiling header profiling a request, the header is not "
+            "checked if null, so only sampled requests are profiled."
+        ),
+    )
+    sample_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Fraction of the requests profiled to files, chosen at random.",
+    )
+    directory: str = Field(
+        default="profiles",
+        description="Directory the profiles are saved to, as `pstats` files.",
+    )
+    max_files: int = Field(
+        default=100,
+        gt=0,
+        description="Number of profile files kept, the oldest ones are removed.",
+    )
+    sort: str = Field(
+        default="cumulative",
+        description="Sort key of the functions of inline profiles.",
+    )
+    limit: int = Field(
+        default=50,
+        gt=0,
+        description="Number of functions listed in inline profiles.",
+    )
@@ -0,0 +1,19 @@
+"""Food Review API traffic recording configuration class definition."""
+
+from pydantic import BaseModel, Field
+
+
+class RecordingConfig(BaseModel):
+    """Traffic recording configuration model."""
+
+    enabled: bool = False
+    filename: str = Field(
+        default="recordings/requests.jsonl",
+        description="Path of the JSON lines file the requests are appended to.",
+    )
+    sample_rate: float = Field(
+        default=1.0,
+        gt=0,
+        le=1,
+        description="Fraction of the requests recorded, chosen at random.",
+    )
@@ -0,0 +1,22 @@
+"""Food Review API server configuration class definition."""
+
+from pydantic import BaseModel, Field
+
+
+class ServerConfig(BaseModel):
+    """Server configuration model."""
+
+    host: str = "0.0.0.0"
+    port: int = Field(default=8000, ge=0, le=65535)
+    workers: int = Field(default=1, ge=1, description="Number of worker processes.")
+    log_level: str = "info"
+    timeout_graceful_shutdown: float = Field(
+        default=30,
+        gt=0,
+        description="Seconds to wait for workers to exit before killing them.",
+    )
+    restart_delay: float = Field(
+        default=1,
+        ge=0,
+        description="Minimum seconds between two starts of the same worker slot.",
+    )
@@ -0,0 +1,192 @@
+"""Food Review API metrics registry definition."""
+
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets, Prometheus-style."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize histogram without observations.
+
+        Args:
+            buckets: The ascending upper bounds of the buckets, an implicit `+Inf`
+                bucket holds larger values.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add an observed value to the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str, labels: Labels) -> Iterable[str]:
+        """Get the cumulative bucket, sum and count samples of the histogram."""
+        cumulative = 0
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for bound, count in zip(bounds, self.counts):
+            cumulative += count
+            yield _sample(f"{name}_bucket", (*labels, ("le", bound)), cumulative)
+        yield _sample(f"{name}_sum", labels, self.sum)
+        yield _sample(f"{name}_count", labels, self.count)
+
+
+class MetricsRegistry:
+    """Registry of the HTTP request metrics of a process.
+
+    Metrics are updated without locking, as requests are observed from the event
+    loop thread of the process serving them. Each worker process keeps its own
+    metrics, which are labelled with its process ID.
+    """
+
+    def __init__(self) -> None:
+        """Initialize registry without observations."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all observations."""
+        self.requests: defaultdict[tuple[str, str, int], int] = defaultdict(int)
+        self.latencies: dict[tuple[str, str], Histogram] = {}
+        self.response_sizes: dict[tuple[str, str], Histogram] = {}
+        self.in_flight = 0
+
+    def observe_request(
+        self, method: str, route: str, status: int, duration: float, size: int
+    ) -> None:
+        """Record a served request.
+
+        Args:
+            method: The HTTP method of the request.
+            route: The path template of the route serving the request.
+            status: The HTTP status of the response.
+            duration: The time spent serving the request, in seconds.
+            size: The number of bytes of the response body.
+        """
+        key = (method, route)
+        self.requests[method, route, status] += 1
+        latencies = self.latencies.get(key)
+        if latencies is None:
+            latencies = self.latencies[key] = Histogram(LATENCY_BUCKETS)
+            self.response_sizes[key] = Histogram(SIZE_BUCKETS)
+        latencies.observe(duration)
+        self.response_sizes[key].observe(size)
+
+    def render(
+        self,
+        gauges: Iterable[tuple[str, str, float]] = (),
+        counters: Iterable[tuple[str, str, float]] = (),
+    ) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Every sample is labelled with the `worker` process ID, as each worker
+        process of a pre-forking server keeps its own metrics and a scrape reaches
+        any one of them. Its series are then kept apart, and can be summed over
+        the workers, e.g. with `sum without (worker)`.
+
+        Args:
+            gauges: The name, help text and value of additional gauges, e.g. of the
+                loaded products.
+            counters: The name, help text and value of additional counters, e.g. of
+                the response cache hits, their name ending with `_total`.
+
+        Returns:
+            str: The metrics exposition.
+        """
+        worker = (("worker", str(os.getpid())),)
+        lines = _header(
+            "food_review_api_http_requests_total", "counter", "HTTP requests served."
+        )
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = (
+                *worker,
+                ("method", method),
+                ("route", route),
+                ("status", str(status)),
+            )
+            lines.append(_sample("food_review_api_http_requests_total", labels, count))
+        for name, help_text, histograms in [
+            (
+                "food_review_api_http_request_duration_seconds",
+                "HTTP request latency.",
+                self.latencies,
+            ),
+            (
+                "food_review_api_http_response_size_bytes",
+                "HTTP response body size.",
+                self.response_sizes,
+            ),
+        ]:
+            lines += _header(name, "histogram", help_text)
+            for (method, route), histogram in sorted(histograms.items()):
+                labels = (*worker, ("method", method), ("route", route))
+                lines += histogram.samples(name, labels)
+        lines += _header(
+            "food_review_api_http_requests_in_flight",
+            "gauge",
+            "HTTP requests being served.",
+        )
+        lines.append(
+            _sample("food_review_api_http_requests_in_flight", worker, self.in_flight)
+        )
+        for metric_type, metrics in [("counter", counters), ("gauge", gauges)]:
+            for name, help_text, value in metrics:
+                lines += _header(name, metric_type, help_text)
+                lines.append(_sample(name, worker, value))
+        return "\n".join(lines) + "\n"
+
+
+def _header(name: str, metric_type: str, help_text: str) -> list[str]:
+    """Get the help and type lines of a metric."""
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def _sample(name: str, labels: Labels, value: float) -> str:
+    """Get the line of a metric sample."""
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    label_text = ",".join(
+        f'{label}="{_escape(label_value)}"' for label, label_value in labels
+    )
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, integers without decimals."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics_registry = MetricsRegistry()
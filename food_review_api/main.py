@@ -1,15 +1,52 @@
 """Food Review API main module entrypoint definition."""
 
+import gc
+import socket
+import threading
+from argparse import ArgumentParser, Namespace
 from logging import getLogger
 
+import uvicorn
+
+from food_review_api.api.lifespan import load_reviews
+from food_review_api.api.main import build_service_app
+from food_review_api.api.server import Supervisor, create_server_socket
 from food_review_api.core.config import Configuration
+from food_review_api.products.repository import product_repository
 from food_review_api.utils.logging import configure_logging
 
 logger = getLogger(__name__)
 
 
-def main():
+def parse_args(argv: list[str] | None = None) -> Namespace:
+    """Parse the command line arguments of the package entrypoint.
+
+    Args:
+        argv: The command line arguments, `sys.argv` if not provided.
+
+    Returns:
+        Namespace: The parsed arguments.
+    """
+    parser = ArgumentParser(prog="food-review-api", description="Food Review API.")
+    commands = parser.add_subparsers(dest="command")
+    serve_parser = commands.add_parser(
+        "serve",
+        help="Load the reviews database once and serve it from forked workers.",
+    )
+    serve_parser.add_argument("--host", help="Address to listen on.")
+    serve_parser.add_argument("--port", type=int, help="Port to listen on.")
+    serve_parser.add_argument("--workers", type=int, help="Number of workers.")
+    commands.add_parser(
+        "snapshot",
+        help="Build the binary snapshot of the configured reviews database.",
+    )
+    parser.set_defaults(command="serve", host=None, port=None, workers=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
     """Food Review API package main entrypoint."""
+    args = parse_args(argv)
     config = Configuration()
     configure_logging(logging_config=config.logging)
     logger.info(
@@ -18,3 +55,110 @@ def main():
         config.version,
         config.environment,
     )
+    if args.command == "snapshot":
+        build_snapshot(config)
+    elif args.command == "serve":
+        overrides = {
+            option: getattr(args, option)
+            for option in ["host", "port", "workers"]
+            if getattr(args, option) is not None
+        }
+        serve(
+            config.model_copy(
+                update={"server": config.server.model_copy(update=overrides)}
+            )
+        )
+
+
+def serve(config: Configuration):
+    """Load the reviews database and serve the API from forked workers.
+
+    The listening socket is bound first. The reviews are then loaded, or
+    memory-mapped from their snapshot, once in the parent process before forking,
+    so workers share them copy-on-write instead of each loading its own copy. With
+    the `database.background_load` configuration option, the parent process serves
+    the API while loading, so `/health` and `/ready` answer and product routes
+    return 503 until the reviews are loaded.
+    """
+    sock = create_server_socket(config.server)
+    logger.info(
+        "Serving on %s:%d with %d workers.",
+        config.server.host,
+        sock.getsockname()[1],
+        config.server.workers,
+    )
+    try:
+        if config.database.background_load:
+            if not serve_while_loading(config, sock):
+                return
+        else:
+            load_reviews(config)
+        # Keep the garbage collector from touching preloaded objects in the
+        # workers, which would copy their memory pages.
+        gc.freeze()
+        Supervisor(config.server, app_factory=build_service_app).run(sock)
+    finally:
+        sock.close()
+
+
+def serve_while_loading(config: Configuration, sock: socket.socket) -> bool:
+    """Serve the API from the parent process while the reviews are loaded.
+
+    The reviews are loaded in a thread, and the server stops once they are loaded.
+    Connections received until the workers are forked wait in the socket backlog.
+
+    Args:
+        config: The service configuration.
+        sock: The listening socket, which is left open for the workers.
+
+    Raises:
+        Exception: The error of the load, if it failed.
+
+    Returns:
+        bool: Whether the reviews are loaded, False if the server was stopped first,
+        e.g. on `SIGTERM`.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(
+            build_service_app(),
+            lifespan="off",
+            log_level=config.server.log_level,
+            timeout_graceful_shutdown=config.server.timeout_graceful_shutdown,
+        )
+    )
+    errors: list[BaseException] = []
+
+    def load() -> None:
+        try:
+            load_reviews(config)
+        except BaseException as error:
+            errors.append(error)
+        finally:
+            server.should_exit = True
+
+    loader = threading.Thread(target=load, name="reviews-loader", daemon=True)
+    loader.start()
+    # The server closes its socket on exit, so it serves on a duplicate of it.
+    server.run(sockets=[sock.dup()])
+    if loader.is_alive():
+        logger.info("Stopped before the reviews were loaded.")
+        return False
+    if errors:
+        raise errors[0]
+    return True
+
+
+def build_snapshot(config: Configuration):
+    """Build the binary snapshot of the configured reviews database.
+
+    The snapshot is written next to the reviews CSV file, unless an up to date
+    snapshot already exists, e.g. to prebuild it in the service docker image.
+    """
+    db = config.database.model_copy(update={"snapshot_cache": True})
+    product_repository.load(db)
+    logger.info(
+        "Snapshot of %d reviews and %d products ready for %s.",
+        product_repository.review_count,
+        product_repository.product_count,
+        db.filename,
+    )
@@ -1,13 +1,21 @@
 """Food Review API products package entrypoint."""
 
-from food_review_api.products.repository import (
+from food_review_api.products.exceptions import (
     ProductNotFoundInRepositoryError,
-    ProductRepository,
-    product_repository,
+    ProductsNotLoadedError,
+    UserNotFoundInRepositoryError,
 )
+from food_review_api.products.progress import LoadPhase, LoadProgress
+from food_review_api.products.repository import ProductRepository, product_repository
+from food_review_api.products.snapshot import ProductSnapshot
 
 __all__ = [
+    "LoadPhase",
+    "LoadProgress",
     "ProductNotFoundInRepositoryError",
     "ProductRepository",
+    "ProductSnapshot",
+    "ProductsNotLoadedError",
+    "UserNotFoundInRepositoryError",
     "product_repository",
 ]
@@ -0,0 +1,13 @@
+"""Food Review API products exceptions definitions."""
+
+
+class ProductNotFoundInRepositoryError(KeyError):
+    """Exception thrown when trying to get a missing product from the repository."""
+
+
+class UserNotFoundInRepositoryError(KeyError):
+    """Exception thrown when trying to get the reviews of a user without reviews."""
+
+
+class ProductsNotLoadedError(RuntimeError):
+    """Exception thrown when trying to get products before they are loaded."""
@@ -0,0 +1,194 @@
+"""Food Review API product reviews orderings class definition."""
+
+import numpy as np
+
+from food_review_api.products.store import ReviewStore, Rows
+
+WILSON_Z = 1.96
+SORT_KEYS = ("time", "score", "helpfulness")
+
+
+def wilson_lower_bound(
+    positive: np.ndarray, total: np.ndarray, z: float = WILSON_Z
+) -> np.ndarray:
+    """Compute the lower bound of the Wilson score interval of proportions.
+
+    The bound ranks proportions by how confidently they are high, e.g. 9 helpful
+    votes out of 10 rank above 1 out of 1, unlike the raw proportion.
+
+    Args:
+        positive: The number of positive votes of each item.
+        total: The number of votes of each item.
+        z: The standard normal quantile of the confidence level, 95% by default.
+
+    Returns:
+        np.ndarray: The lower bound of each item, 0 for items without votes.
+    """
+    total = np.asarray(total, dtype=np.float64)
+    votes = np.maximum(total, 1)
+    # A few reviews have more helpful votes than votes, their proportion is 1.
+    proportion = np.clip(np.asarray(positive, dtype=np.float64), 0, votes) / votes
+    z2 = z * z
+    bound = (
+        proportion
+        + z2 / (2 * votes)
+        - z * np.sqrt(proportion * (1 - proportion) / votes + z2 / (4 * votes**2))
+    ) / (1 + z2 / votes)
+    return np.where(total > 0, bound, 0.0)
+
+
+class ReviewOrderings:
+    """Orderings of the reviews of each product of a store by each sort key.
+
+    Rows of the store are grouped by product and sorted by time within each
+    product. For the other sort keys, `permutations[key]` holds every store row
+    grouped by product the same way, but sorted by ascending key within each
+    product, ties by time, so the reviews of a product sorted by a key are the
+    same range of the permutation as the product rows range, and a page is a
+    slice of it. `scores[key]` holds the score of each row of the permutation, so
+    score range filters are a binary search when sorting by score, and a mask over
+    the contiguous scores of the product otherwise.
+    """
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Build the orderings of the reviews of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        products = np.repeat(np.arange(store.product_count), store.review_counts)
+        self.times = store.columns["time"]
+        self.row_scores = store.columns["score"].astype(np.int8)
+        keys = {
+            "score": self.row_scores,
+            "helpfulness": wilson_lower_bound(
+                store.columns["helpfulness_numerator"],
+                store.columns["helpfulness_denominator"],
+            ),
+        }
+        self.permutations: dict[str, np.ndarray] = {}
+        self.scores: dict[str, np.ndarray] = {}
+        for key, values in keys.items():
+            # `lexsort` is stable, so ties keep the row order, by time.
+            permutation = np.lexsort((values, products))
+            self.permutations[key] = permutation
+            self.scores[key] = self.row_scores[permutation]
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the orderings, keyed by a dotted name."""
+        arrays = {"row_scores": self.row_scores}
+        for key in self.permutations:
+            arrays[f"{key}.permutation"] = self.permutations[key]
+            arrays[f"{key}.scores"] = self.scores[key]
+        return arrays
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "ReviewOrderings":
+        """Build the orderings of a store from the arrays returned by `to_arrays`."""
+        orderings = cls.__new__(cls)
+        orderings.times = store.columns["time"]
+        orderings.row_scores = arrays["row_scores"]
+        orderings.permutations = {}
+        orderings.scores = {}
+        # Store rows are already sorted by time, the first sort key.
+        for key in SORT_KEYS[1:]:
+            orderings.permutations[key] = arrays[f"{key}.permutation"]
+            orderings.scores[key] = arrays[f"{key}.scores"]
+        return orderings
+
+    @property
+    def nbytes(self) -> int:
+        """Get number of bytes of the index arrays."""
+        return self.row_scores.nbytes + sum(
+            self.permutations[key].nbytes + self.scores[key].nbytes
+            for key in self.permutations
+        )
+
+    def page(
+        self,
+        rows: slice,
+        sort: str = "time",
+        offset: int = 0,
+        limit: int | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+    ) -> tuple[Rows, int]:
+        """Get a page of the reviews of a product, sorted and filtered.
+
+        Args:
+            rows: The store rows range of the product.
+            sort: The sort key, one of `SORT_KEYS`, prefixed with `-` for
+                descending order.
+            offset: The number of reviews to skip.
+            limit: The maximum number of reviews to return, all if None.
+            since: The earliest review time, inclusive, unbounded if None.
+            until: The latest review time, inclusive, unbounded if None.
+            min_score: The lowest review score, inclusive, unbounded if None.
+            max_score: The highest review score, inclusive, unbounded if None.
+
+        Returns:
+            tuple[Rows, int]: The store rows of the page, in sort order, and the
+            total number of reviews of the product matching the filters.
+        """
+        key = sort.removeprefix("-")
+        scores = self.row_scores[rows]
+        if key == "time":
+            selected = range(rows.start, rows.stop)
+            start, stop = _bounds(self.times[rows], since, until)
+            since = until = None
+        else:
+            selected = self.permutations[key][rows]
+            scores = self.scores[key][rows]
+            start, stop = 0, len(selected)
+            if key == "score":
+                start, stop = _bounds(scores, min_score, max_score)
+                min_score = max_score = None
+        selected, scores = selected[start:stop], scores[start:stop]
+
+        mask = None
+        if min_score is not None or max_score is not None:
+            mask = _within(scores, min_score, max_score)
+        if since is not None or until is not None:
+            in_range = _within(self.times[selected], since, until)
+            mask = in_range if mask is None else mask & in_range
+        if mask is not None:
+            selected = np.asarray(selected)[mask]
+
+        total = len(selected)
+        if sort.startswith("-"):
+            stop = max(total - offset, 0)
+            start = 0 if limit is None else max(stop - limit, 0)
+            page = selected[start:stop][::-1]
+        else:
+            start = min(offset, total)
+            stop = total if limit is None else min(start + limit, total)
+            page = selected[start:stop]
+        if isinstance(page, range):
+            if page.step == 1:
+                return slice(page.start, page.stop), total
+            return np.arange(page.start, page.stop, page.step), total
+        return page, total
+
+
+def _bounds(values: np.ndarray, low: int | None, high: int | None) -> tuple[int, int]:
+    """Get the range of sorted values between inclusive bounds, by binary search."""
+    start, stop = 0, len(values)
+    if low is not None:
+        start = int(np.searchsorted(values, low, side="left"))
+    if high is not None:
+        stop = max(int(np.searchsorted(values, high, side="right")), start)
+    return start, stop
+
+
+def _within(values: np.ndarray, low: int | None, high: int | None) -> np.ndarray:
+    """Get the mask of the values between inclusive bounds."""
+    mask = np.ones(len(values), dtype=bool)
+    if low is not None:
+        mask &= values >= low
+    if high is not None:
+        mask &= values <= high
+    return mask
@@ -0,0 +1,88 @@
+"""Food Review API products load progress class definition."""
+
+from enum import Enum
+from time import perf_counter
+
+
+class LoadPhase(str, Enum):
+    """Phase of a products load."""
+
+    IDLE = "idle"
+    PARSING = "parsing"
+    INDEXING = "indexing"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class LoadProgress:
+    """Progress of the products load in flight, or of the last one.
+
+    Progress is only updated by the thread running the load, and read without
+    locking, e.g. by the readiness endpoint, so readers may see a slightly stale
+    state, but never a torn value.
+    """
+
+    def __init__(self) -> None:
+        """Initialize progress of a load not started yet."""
+        self.phase = LoadPhase.IDLE
+        self.rows_parsed = 0
+        self.bytes_parsed = 0
+        self.total_bytes = 0
+        self.error: str | None = None
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    def start(self, total_bytes: int = 0) -> None:
+        """Start tracking a new load.
+
+        Args:
+            total_bytes: The number of bytes of CSV to parse, 0 if unknown.
+        """
+        self.rows_parsed = 0
+        self.bytes_parsed = 0
+        self.total_bytes = total_bytes
+        self.error = None
+        self._started = perf_counter()
+        self._finished = None
+        self.phase = LoadPhase.PARSING
+
+    def advance(self, rows: int, bytes_parsed: int) -> None:
+        """Record the rows and bytes of CSV parsed since the last update."""
+        self.rows_parsed += rows
+        self.bytes_parsed += bytes_parsed
+
+    def indexing(self) -> None:
+        """Record that parsing is done, and the derived indexes are being built."""
+        self.phase = LoadPhase.INDEXING
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Record the end of the load, failed if an error is given."""
+        self._finished = perf_counter()
+        if error is None:
+            self.phase = LoadPhase.READY
+        else:
+            self.phase = LoadPhase.FAILED
+            self.error = repr(error)
+
+    @property
+    def elapsed(self) -> float | None:
+        """Get the time spent in the load, in seconds, None if not started."""
+        if self._started is None:
+            return None
+        return (self._finished or perf_counter()) - self._started
+
+    @property
+    def eta(self) -> float | None:
+        """Estimate the time left to parse the CSV files, in seconds.
+
+        The estimate extrapolates the parsing throughput so far to the bytes left,
+        and is None when not parsing or before the first chunk is parsed.
+        """
+        if (
+            self.phase != LoadPhase.PARSING
+            or not self.bytes_parsed
+            or not self.total_bytes
+        ):
+            return None
+        remaining = max(self.total_bytes - self.bytes_parsed, 0)
+        return self.elapsed * remaining / self.bytes_parsed
@@ -0,0 +1,86 @@
+"""Food Review API products rankings class definition."""
+
+import numpy as np
+
+from food_review_api.products.store import ReviewStore, StringColumn
+
+
+class ReviewCountRanking:
+    """Dense ranking of products by number of reviews.
+
+    Products are sorted once by descending number of reviews, and products with the
+    same number of reviews form a tier, whose start position is also precomputed.
+    Getting the products of the top or bottom `n` tiers is then a slice.
+    """
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Build the ranking of the products of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        counts = store.review_counts
+        order = np.argsort(-counts, kind="stable")
+        self._product_ids = store.product_ids.take(order)
+        self._counts = counts[order]
+        changes = np.flatnonzero(self._counts[1:] != self._counts[:-1]) + 1
+        self._tier_starts = np.concatenate(
+            [[0] if len(counts) else [], changes, [len(counts)]]
+        ).astype(np.int64)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the ranking, keyed by a dotted name."""
+        return {
+            "product_ids.data": self._product_ids.data,
+            "product_ids.offsets": self._product_ids.offsets,
+            "counts": self._counts,
+            "tier_starts": self._tier_starts,
+        }
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "ReviewCountRanking":
+        """Build the ranking of a store from the arrays returned by `to_arrays`."""
+        ranking = cls.__new__(cls)
+        ranking._product_ids = StringColumn(
+            data=arrays["product_ids.data"], offsets=arrays["product_ids.offsets"]
+        )
+        ranking._counts = arrays["counts"]
+        ranking._tier_starts = arrays["tier_starts"]
+        return ranking
+
+    @property
+    def tier_count(self) -> int:
+        """Get number of distinct review counts."""
+        return len(self._tier_starts) - 1
+
+    def most_reviewed(self, n: int) -> list[tuple[str, int]]:
+        """Get products in the `n` tiers with most reviews.
+
+        Args:
+            n: The number of distinct review counts to include.
+
+        Returns:
+            list[tuple[str, int]]: Pairs of product ID and number of reviews, by
+            descending number of reviews.
+        """
+        return self._slice(0, self._tier_starts[min(n, self.tier_count)])
+
+    def least_reviewed(self, n: int) -> list[tuple[str, int]]:
+        """Get products in the `n` tiers with least reviews.
+
+        Args:
+            n: The number of distinct review counts to include.
+
+        Returns:
+            list[tuple[str, int]]: Pairs of product ID and number of reviews, by
+            descending number of reviews.
+        """
+        start = self._tier_starts[max(self.tier_count - n, 0)]
+        return self._slice(start, self._tier_starts[-1])
+
+    def _slice(self, start: int, stop: int) -> list[tuple[str, int]]:
+        """Get product ID and number of reviews pairs between two positions."""
+        rows = slice(int(start), int(stop))
+        return list(zip(self._product_ids.tolist(rows), self._counts[rows].tolist()))
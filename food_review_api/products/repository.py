@@ -1,146 +1,527 @@
 """Food Review API products repository class definition."""
 
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import replace
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BufferedReader
+from itertools import count
+from logging import getLogger
+from multiprocessing import get_context
+from threading import Lock
+from time import perf_counter
+
+import numpy as np
 import pandas as pd
 
 from food_review_api.core.config.database import DatabaseConfig
+from food_review_api.products.exceptions import ProductsNotLoadedError
+from food_review_api.products.progress import LoadProgress
 from food_review_api.products.schemas import Product, Review
-
-
-class ProductNotFoundInRepositoryError(KeyError):
-    """Exception thrown when trying to get a missing product from the repository."""
+from food_review_api.products.snapshot import ProductSnapshot
+from food_review_api.products.sources import (
+    FileRange,
+    SourceState,
+    ingestible_size,
+)
+from food_review_api.products.storage import (
+    read_index_snapshot,
+    read_snapshot_sources,
+    read_store_snapshot,
+    store_snapshot_path,
+    write_index_snapshot,
+    write_store_snapshot,
+)
+from food_review_api.products.store import ReviewStore, ReviewStoreBuilder
+
+REVIEW_DTYPES = {
+    "id": pd.Int64Dtype(),
+    "product_id": pd.StringDtype(),
+    "user_id": pd.StringDtype(),
+    "profile_name": pd.StringDtype(),
+    "helpfulness_numerator": pd.Int32Dtype(),
+    "helpfulness_denominator": pd.Int32Dtype(),
+    "score": pd.Int8Dtype(),
+    "time": pd.Int64Dtype(),
+    "summary": pd.StringDtype(),
+    "text": pd.StringDtype(),
+}
+OPTIONAL_TEXT_COLUMNS = ["profile_name", "summary", "text"]
+
+logger = getLogger(__name__)
 
 
 class ProductRepository:
     """product repository class.
 
     This class is meant to hold the loaded products from the product registry, and
-    provide a common interface to manage products.
+    provide a common interface to manage products. Reviews are held in a columnar
+    `ReviewStore` rather than as `Product` and `Review` instances.
     """
 
     def __init__(self) -> None:
         """Initialize product repository with empty product storage."""
+        self._lock = Lock()
+        self._generations = count()
+        self._reload_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="product-reload"
+        )
+        self._reload_future: Future[ProductSnapshot] | None = None
+        self.last_load_duration: float | None = None
+        self.progress = LoadProgress()
         self.clear()
 
     @property
-    def available_products(self) -> int:
+    def available_products(self) -> list[str]:
         """Get available products identifiers."""
-        return list(self._products.keys())
+        return self._snapshot.store.product_ids.tolist()
 
     @property
     def product_count(self) -> int:
         """Get product count."""
-        return len(self._products)
+        return self._snapshot.store.product_count
 
     @property
     def review_count(self) -> int:
         """Get reviews count."""
-        return self._review_count
+        return self._snapshot.store.review_count
+
+    @property
+    def store(self) -> ReviewStore:
+        """Get the columnar store holding the loaded reviews."""
+        return self._snapshot.store
+
+    @property
+    def snapshot(self) -> ProductSnapshot:
+        """Get the currently published products snapshot."""
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        """Get the generation number of the currently published snapshot."""
+        return self._snapshot.generation
+
+    @property
+    def is_reloading(self) -> bool:
+        """Check if a reload is building a new snapshot."""
+        future = self._reload_future
+        return future is not None and not future.done()
 
     def clear(self) -> None:
         """Clear repository product storage."""
-        self._products: dict[str, Product] = {}
-        self._products_metadata: DatabaseConfig | None = None
-        self._review_count: int | None = None
-        self._reviews_per_product: pd.DataFrame | None = None
+        with self._lock:
+            self._snapshot = ProductSnapshot.empty(generation=next(self._generations))
+
+    def load(self, db: DatabaseConfig) -> ProductSnapshot:
+        """Load products from CSV files into the repository.
+
+        This method streams each CSV file in chunks of `db.chunk_size` rows, and
+        folds each chunk into a columnar `ReviewStore`, so only one chunk of raw rows
+        is held in memory at any time by each loading process. Reviews are sorted
+        by product ID and time in the store, and `Product` instances are only built
+        when requested.
 
-    def load(self, db: DatabaseConfig) -> None:
-        """Load products from a CSV file into the repository.
+        CSV files are expected to be append-only: when the published snapshot was
+        loaded from the same database, only the rows appended to its files since
+        are parsed and merged into its store, unless the previously ingested part
+        of a file changed, in which case everything is loaded again. When nothing
+        was appended, the published snapshot is kept as is, generation included.
 
-        This method loads the CSV file, and then processes the loaded data to extract
-        the product IDs and their associated reviews. The reviews are then grouped by
-        product ID and used to create `Product` instances which are stored in the
-        repository.
+        The store and its derived indexes are bundled into a new immutable
+        `ProductSnapshot`, which is published by swapping a single reference, so
+        readers see either the previous or the new snapshot, never a mix of both.
+        The indexes, e.g. the full-text search index, are built before taking the
+        repository lock, which is only held to publish the snapshot.
+
+        With `db.text_compression`, the review texts are compressed once the
+        indexes are built, and only decompressed when reviews are read.
 
         Args:
-            db: The configuration for the database containing the CSV file.
+            db: The configuration for the database containing the CSV files.
+
+        The progress of the load, e.g. the number of rows parsed so far, is tracked
+        in `progress`.
 
         Raises:
-            FileNotFoundError: If the specified file does not exist.
+            FileNotFoundError: If a specified file does not exist.
+
+        Returns:
+            ProductSnapshot: The published snapshot.
         """
-        reviews = self._load_reviews_csv(db.filename)
-        self._review_count = reviews.shape[0]
-        self._reviews_per_product = reviews.value_counts("product_id")
-        grouped_reviews = self._group_reviews_by_product(reviews)
-
-        # Create product instances
-        self._products = {
-            product_id: Product(
-                product_id=product_id,
-                reviews=[Review(**review) for review in reviews],
-                number_of_reviews=len(reviews),
+        self.progress.start()
+        try:
+            snapshot = self._load(db)
+        except BaseException as error:
+            self.progress.finish(error)
+            raise
+        self.progress.finish()
+        return snapshot
+
+    def _load(self, db: DatabaseConfig) -> ProductSnapshot:
+        """Load products from CSV files and publish their snapshot, see `load`."""
+        started = perf_counter()
+        current = self._snapshot
+        added_rows = None
+        loaded = self._load_appended(current, db)
+        if loaded is None:
+            store, sources = self._load_store(db)
+        else:
+            store, sources, added_rows = loaded
+        if store is current.store:
+            # Nothing was appended, so the published snapshot is kept, along with
+            # its generation and the responses cached for it.
+            snapshot = current
+        else:
+            self.progress.indexing()
+            snapshot = self._build_snapshot(
+                store,
+                sources,
+                db,
+                extended=None if added_rows is None else current,
+                added_rows=added_rows,
             )
-            for product_id, reviews in grouped_reviews.items()
-        }
-        self._products_metadata = db
+            if db.text_compression:
+                snapshot = replace(snapshot, store=self._compress_text(store, db))
+
+        with self._lock:
+            self._snapshot = snapshot
+            self.last_load_duration = perf_counter() - started
+        return snapshot
+
+    def _build_snapshot(
+        self,
+        store: ReviewStore,
+        sources: tuple[SourceState, ...],
+        db: DatabaseConfig,
+        extended: ProductSnapshot | None = None,
+        added_rows: np.ndarray | None = None,
+    ) -> ProductSnapshot:
+        """Build the snapshot of a store with its indexes.
+
+        When `db.snapshot_cache` is enabled, the indexes are memory-mapped from the
+        store snapshot if they were written along with it, otherwise they are
+        built, or extended from the snapshot whose store the store extends, and
+        written to the store snapshot, if any.
 
-    async def most_commented_products(self, n: int = 3) -> pd.Series:
-        """Get products with most reviews."""
-        if not self._products:
-            raise RuntimeError("Products not loaded")
+        Args:
+            store: The loaded reviews store.
+            sources: The ingested part of each CSV file of the store.
+            db: The configuration for the database containing the CSV files.
+            extended: The snapshot whose reviews are in the store, if any.
+            added_rows: The rows of the store not in the extended snapshot.
 
-        counts = self._reviews_per_product.unique()[:n]
-        return self._reviews_per_product[self._reviews_per_product.isin(counts)]
+        Returns:
+            ProductSnapshot: The snapshot, with a new generation number.
+        """
+        generation = next(self._generations)
+        snapshot_path = store_snapshot_path(db) if db.snapshot_cache else None
+        if snapshot_path is not None and snapshot_path.exists():
+            arrays = read_index_snapshot(snapshot_path, store)
+            if arrays is not None:
+                logger.info("Loading index snapshot from %s.", snapshot_path)
+                return ProductSnapshot.from_arrays(
+                    store, arrays, metadata=db, generation=generation, sources=sources
+                )
+
+        if extended is None:
+            snapshot = ProductSnapshot.build(
+                store, metadata=db, generation=generation, sources=sources
+            )
+            logger.info(
+                "Built search index of %d terms in %.2fs (%.1f MiB).",
+                snapshot.search_index.term_count,
+                snapshot.search_index.build_time,
+                snapshot.search_index.nbytes / 2**20,
+            )
+        else:
+            snapshot = extended.extend(
+                store, added_rows, metadata=db, generation=generation, sources=sources
+            )
+            logger.info(
+                "Extended search index with %d reviews in %.2fs (%d terms).",
+                len(added_rows),
+                snapshot.search_index.build_time,
+                snapshot.search_index.term_count,
+            )
+        if snapshot_path is not None and snapshot_path.exists():
+            write_index_snapshot(snapshot_path, store, snapshot.to_arrays())
+        return snapshot
+
+    def _compress_text(self, store: ReviewStore, db: DatabaseConfig) -> ReviewStore:
+        """Compress the text columns of a store, see `ReviewStore.compress_text`."""
+        started = perf_counter()
+        compressed = store.compress_text(
+            block_size=db.text_block_size, cache_blocks=db.text_cache_blocks
+        )
+        logger.info(
+            "Compressed review texts in %.2fs (%.1f MiB to %.1f MiB).",
+            perf_counter() - started,
+            store.nbytes / 2**20,
+            compressed.nbytes / 2**20,
+        )
+        return compressed
 
-    async def least_commented_products(self, n: int = 3) -> pd.Series:
-        """Get products with lowest reviews."""
-        if not self._products:
-            raise RuntimeError("Products not loaded")
+    def reload(self, db: DatabaseConfig) -> Future[ProductSnapshot]:
+        """Reload products in a background worker thread.
 
-        counts = self._reviews_per_product.unique()[-n:]
-        return self._reviews_per_product[self._reviews_per_product.isin(counts)]
+        Reload requests received while a reload is in flight are merged into it,
+        so there is at most one snapshot being built at any time.
 
-    def _load_reviews_csv(self, filename: str) -> pd.DataFrame:
-        """Load the reviews CSV file into a pandas DataFrame.
+        Args:
+            db: The configuration for the database containing the CSV file.
+
+        Returns:
+            Future[ProductSnapshot]: The future of the snapshot being built.
+        """
+        with self._lock:
+            if self._reload_future is None or self._reload_future.done():
+                self._reload_future = self._reload_executor.submit(self.load, db)
+            return self._reload_future
+
+    def most_commented_products(self, n: int = 3) -> dict[str, int]:
+        """Get products with most reviews.
 
         Args:
-            filename: The path to the CSV file.
+            n: The number of distinct review counts to include.
 
         Returns:
-            A pandas DataFrame containing the loaded data.
+            dict[str, int]: The number of reviews of the products in the `n` tiers
+            with most reviews, by descending number of reviews.
         """
-        dtypes = {
-            "id": pd.Int64Dtype(),
-            "product_id": pd.StringDtype(),
-            "user_id": pd.StringDtype(),
-            "profile_name": pd.StringDtype(),
-            "helpfulness_numerator": pd.Int8Dtype(),
-            "helpfulness_denominator": pd.Int8Dtype(),
-            "score": pd.Int8Dtype(),
-            "time": pd.Int64Dtype(),
-            "summary": pd.StringDtype(),
-            "text": pd.StringDtype(),
-        }
-        reviews = pd.read_csv(
-            filename,
-            header=0,
-            names=dtypes.keys(),
-            dtype=dtypes,
-            nrows=100,
-        )
-        return reviews
+        return dict(self._loaded_snapshot().ranking.most_reviewed(n))
+
+    def least_commented_products(self, n: int = 3) -> dict[str, int]:
+        """Get products with lowest reviews.
+
+        Args:
+            n: The number of distinct review counts to include.
 
-    def _group_reviews_by_product(self, reviews: pd.DataFrame) -> dict[str, list]:
-        """Group reviews by product.
+        Returns:
+            dict[str, int]: The number of reviews of the products in the `n` tiers
+            with least reviews, by descending number of reviews.
+        """
+        return dict(self._loaded_snapshot().ranking.least_reviewed(n))
+
+    def _loaded_snapshot(self) -> ProductSnapshot:
+        """Get the published snapshot, ensuring products are loaded.
+
+        Raises:
+            ProductsNotLoadedError: If no products are loaded.
+        """
+        snapshot = self._snapshot
+        if not snapshot.store.product_count:
+            raise ProductsNotLoadedError("Products not loaded")
+        return snapshot
+
+    def _load_store(
+        self, db: DatabaseConfig
+    ) -> tuple[ReviewStore, tuple[SourceState, ...]]:
+        """Load the review store of a database.
+
+        When `db.snapshot_cache` is enabled, the store is memory-mapped from the
+        binary snapshot of the CSV files if it is up to date, otherwise the CSV
+        files are parsed and a new snapshot is written. Several CSV files are
+        parsed in parallel by up to `db.load_workers` processes, and merged into a
+        single store, deduplicating reviews by `id`.
+
+        Args:
+            db: The configuration for the database containing the CSV files.
+
+        Returns:
+            tuple[ReviewStore, tuple[SourceState, ...]]: The loaded review store,
+            and the ingested part of each CSV file, empty if unknown.
+        """
+        snapshot_path = store_snapshot_path(db) if db.snapshot_cache else None
+        if snapshot_path is not None and snapshot_path.exists():
+            logger.info("Loading store snapshot from %s.", snapshot_path)
+            store = read_store_snapshot(snapshot_path)
+            self.progress.advance(store.review_count, 0)
+            return store, read_snapshot_sources(snapshot_path)
+
+        sources = db.sources
+        self.progress.total_bytes = sum(map(_file_size, sources))
+        workers = min(db.load_workers or os.cpu_count() or 1, len(sources))
+        builder = ReviewStoreBuilder()
+        if workers > 1:
+            states = self._load_sources_in_parallel(builder, sources, db, workers)
+        else:
+            states = []
+            for source in sources:
+                started = perf_counter()
+                state, row_count = _ingest_source(
+                    builder, source, db.chunk_size, db.max_rows, self._load_reviews_csv
+                )
+                states.append(state)
+                _log_source_loaded(source, row_count, perf_counter() - started)
+        store = builder.build()
+        states = () if None in states else tuple(states)
+        if snapshot_path is not None:
+            write_store_snapshot(snapshot_path, store, sources=states)
+        return store, states
+
+    def _load_sources_in_parallel(
+        self,
+        builder: ReviewStoreBuilder,
+        sources: list[str],
+        db: DatabaseConfig,
+        workers: int,
+    ) -> list[SourceState | None]:
+        """Parse CSV files in a process pool, adding their stores to a builder.
+
+        Each worker process builds the store of a whole file, and the stores are
+        added to the builder in the order of the sources, so the reviews of the
+        first sources are kept when deduplicating by review `id`.
+
+        Args:
+            builder: The builder of the merged store.
+            sources: The paths of the CSV files.
+            db: The configuration for the database containing the CSV files.
+            workers: The number of worker processes.
+
+        Returns:
+            list[SourceState | None]: The ingested part of each CSV file.
+        """
+        # Worker processes are spawned rather than forked, as loads may run in the
+        # reload thread, and forking a multithreaded process is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                partial(
+                    _build_source_arrays, chunk_size=db.chunk_size, max_rows=db.max_rows
+                ),
+                sources,
+            )
+            states = []
+            for source, (arrays, state, load_time) in zip(sources, results):
+                store = ReviewStore.from_arrays(arrays)
+                builder.add_store(store)
+                states.append(state)
+                self.progress.advance(store.review_count, _file_size(source))
+                _log_source_loaded(source, store.review_count, load_time)
+        return states
+
+    def _load_appended(
+        self, snapshot: ProductSnapshot, db: DatabaseConfig
+    ) -> tuple[ReviewStore, tuple[SourceState, ...], np.ndarray | None] | None:
+        """Load the rows appended to the CSV files of a snapshot since its load.
 
         Args:
-            reviews (pd.DataFrame): The DataFrame containing the reviews.
+            snapshot: The snapshot to extend.
+            db: The configuration for the database containing the CSV files.
 
         Returns:
-            dict[str, list]: A dictionary where the keys are the product IDs and
-            the values are the grouped reviews.
+            tuple[ReviewStore, tuple[SourceState, ...], np.ndarray | None] | None:
+            The store with the appended reviews, the snapshot store if nothing was
+            appended, the ingested part of each CSV file, and the rows of the
+            appended reviews in the store, None if nothing was appended, or None if
+            the CSV files must be loaded from scratch. The store snapshot is
+            written if enabled and missing.
         """
-        return (
-            reviews.groupby("product_id")
-            .apply(lambda x: x.to_dict(orient="records"))
-            .to_dict()
+        if not snapshot.sources or snapshot.metadata != db or db.max_rows is not None:
+            return None
+        if [state.filename for state in snapshot.sources] != db.sources:
+            return None
+        ranges = []
+        for state in snapshot.sources:
+            appended_range = state.appended_range()
+            if appended_range is None:
+                logger.info("Reviews of %s changed, loading all.", state.filename)
+                return None
+            ranges.append(appended_range)
+        if all(start == stop for start, stop in ranges):
+            logger.info("No reviews appended since the last load.")
+            store, states, added_rows = snapshot.store, snapshot.sources, None
+        else:
+            store, states, added_rows = self._merge_appended(snapshot, ranges, db)
+        if db.snapshot_cache:
+            snapshot_path = store_snapshot_path(db)
+            if not snapshot_path.exists():
+                write_store_snapshot(snapshot_path, store, sources=states)
+        return store, states, added_rows
+
+    def _merge_appended(
+        self,
+        snapshot: ProductSnapshot,
+        ranges: list[tuple[int, int]],
+        db: DatabaseConfig,
+    ) -> tuple[ReviewStore, tuple[SourceState, ...], np.ndarray]:
+        """Merge the rows appended to the CSV files of a snapshot into its store.
+
+        The appended rows are built into a store of their own, which is merged
+        into the snapshot store, see `ReviewStore.merge`.
+
+        Args:
+            snapshot: The snapshot to extend.
+            ranges: The byte range of the rows appended to each CSV file.
+            db: The configuration for the database containing the CSV files.
+
+        Returns:
+            tuple[ReviewStore, tuple[SourceState, ...], np.ndarray]: The store with
+            the appended reviews, the ingested part of each CSV file, and the rows
+            of the appended reviews in the store.
+        """
+        builder = ReviewStoreBuilder()
+        self.progress.total_bytes = sum(stop - start for start, stop in ranges)
+        states = []
+        for state, (start, stop) in zip(snapshot.sources, ranges):
+            started = perf_counter()
+            row_count = 0
+            for chunk in self._load_reviews_csv(
+                state.filename, chunk_size=db.chunk_size, start=start, stop=stop
+            ):
+                builder.add_chunk(chunk)
+                row_count += len(chunk)
+            states.append(
+                SourceState.of(state.filename, stop, state.row_count + row_count)
+            )
+            logger.info(
+                "Loaded %d appended rows from %s in %.2fs.",
+                row_count,
+                state.filename,
+                perf_counter() - started,
+            )
+        store, added_rows = snapshot.store.merge(builder.build())
+        return store, tuple(states), added_rows
+
+    def _load_reviews_csv(
+        self,
+        filename: str,
+        chunk_size: int,
+        max_rows: int | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream the reviews CSV file as pandas DataFrame chunks.
+
+        See `read_reviews_csv`, the parsed chunks are recorded in `progress`.
+        """
+        return read_reviews_csv(
+            filename,
+            chunk_size=chunk_size,
+            max_rows=max_rows,
+            start=start,
+            stop=stop,
+            progress=self.progress,
         )
 
     def get(self, name: str) -> Product:
-        """Get loaded product instance by name."""
-        try:
-            return self._products[name]
-        except KeyError:
-            raise ProductNotFoundInRepositoryError(name)
+        """Get loaded product instance by name.
+
+        The `Product` and its `Review` instances are built on each call from the
+        rows of the product in the columnar store.
+        """
+        return self._snapshot.get(name)
+
+    def get_reviews(
+        self, name: str, offset: int = 0, limit: int | None = None
+    ) -> tuple[list[Review], int]:
+        """Get a page of the reviews of a loaded product.
+
+        See `ProductSnapshot.get_reviews`.
+        """
+        return self._snapshot.get_reviews(name, offset=offset, limit=limit)
 
     def __getitem__(self, key: str) -> Product:
         """Wrapper on get loaded product to support self[key] accessor."""
@@ -148,7 +529,118 @@ class ProductRepository:
 
     def has_product(self, name: str) -> bool:
         """Check if a product is loaded by product name."""
-        return name in self._products
+        return self._snapshot.has_product(name)
+
+
+def read_reviews_csv(
+    filename: str,
+    chunk_size: int,
+    max_rows: int | None = None,
+    start: int = 0,
+    stop: int | None = None,
+    progress: LoadProgress | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream a reviews CSV file as pandas DataFrame chunks.
+
+    Args:
+        filename: The path to the CSV file.
+        chunk_size: The number of rows of each chunk.
+        max_rows: The maximum number of rows to read, all rows if None.
+        start: The byte offset to read from, at the start of a line. The header
+            line is only expected at offset 0.
+        stop: The byte offset to read up to, at the end of a line, the end of the
+            file if None.
+        progress: The load progress to record the rows and bytes of each parsed
+            chunk in, if any.
+
+    Yields:
+        A pandas DataFrame with at most `chunk_size` rows of loaded data.
+    """
+    with open(filename, "rb") as file:
+        file.seek(start)
+        if stop is None:
+            stop = file.seek(0, os.SEEK_END)
+            file.seek(start)
+        with pd.read_csv(
+            BufferedReader(FileRange(file, stop)),
+            header=0 if start == 0 else None,
+            names=REVIEW_DTYPES.keys(),
+            dtype=REVIEW_DTYPES,
+            chunksize=chunk_size,
+            nrows=max_rows,
+        ) as reader:
+            position = start
+            for chunk in reader:
+                chunk[OPTIONAL_TEXT_COLUMNS] = chunk[OPTIONAL_TEXT_COLUMNS].fillna("")
+                if progress is not None:
+                    # The parser reads ahead of the rows of the chunk, so the parsed
+                    # bytes are approximate.
+                    parsed = min(file.tell(), stop)
+                    progress.advance(len(chunk), parsed - position)
+                    position = parsed
+                yield chunk
+
+
+def _ingest_source(
+    builder: ReviewStoreBuilder,
+    filename: str,
+    chunk_size: int,
+    max_rows: int | None,
+    read_csv: Callable[..., Iterable[pd.DataFrame]],
+) -> tuple[SourceState | None, int]:
+    """Add the reviews of a CSV file to a builder, up to its end.
+
+    The ingested part of the file recorded for later appends ends at its last line
+    break. The last review of a file without a trailing line break is ingested,
+    but left out of that part, so it is read again with the lines appended after
+    it, and then dropped as a duplicate review `id`.
+
+    Returns:
+        tuple[SourceState | None, int]: The ingested part of the file, None if
+        unknown, e.g. as rows are limited by `max_rows`, and the number of rows.
+    """
+    # The size is taken before reading, so rows appended meanwhile are left out.
+    size = _file_size(filename) if max_rows is None else 0
+    row_count = 0
+    for chunk in read_csv(
+        filename, chunk_size=chunk_size, max_rows=max_rows, stop=size or None
+    ):
+        builder.add_chunk(chunk)
+        row_count += len(chunk)
+    stop = ingestible_size(filename, end=size) if size else None
+    if not stop:
+        return None, row_count
+    tail_rows = 1 if stop < size else 0
+    return SourceState.of(filename, stop, row_count - tail_rows), row_count
+
+
+def _build_source_arrays(
+    filename: str, chunk_size: int, max_rows: int | None = None
+) -> tuple[dict[str, np.ndarray], SourceState | None, float]:
+    """Build the store of a reviews CSV file, in a worker process.
+
+    Returns:
+        tuple[dict[str, np.ndarray], SourceState | None, float]: The arrays backing
+        the store, which are cheaper to send back than the store, the ingested
+        part of the file, and the load time in seconds.
+    """
+    started = perf_counter()
+    builder = ReviewStoreBuilder()
+    state, _ = _ingest_source(builder, filename, chunk_size, max_rows, read_reviews_csv)
+    return builder.build().to_arrays(), state, perf_counter() - started
+
+
+def _file_size(filename: str) -> int:
+    """Get the size of a file in bytes, 0 if it does not exist."""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+
+def _log_source_loaded(filename: str, row_count: int, load_time: float) -> None:
+    """Log the number of rows and load time of a reviews CSV file."""
+    logger.info("Loaded %d rows from %s in %.2fs.", row_count, filename, load_time)
 
 
 product_repository = ProductRepository()
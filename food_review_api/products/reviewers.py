@@ -0,0 +1,119 @@
+"""Food Review API reviewers index class definition."""
+
+import numpy as np
+
+from food_review_api.products.store import NULL_CODE, DictionaryColumn, ReviewStore
+
+
+class ReviewerIndex:
+    """Secondary index of the reviews of a store by reviewer.
+
+    The store rows of the reviews of the user with code `i` in the `user_id`
+    dictionary column are `rows[offsets[i]:offsets[i + 1]]`, by ascending time.
+    The profile name of each user, taken from their latest review, and the users
+    ordered by descending number of reviews are also precomputed. Reviews without
+    user are left out of the index.
+    """
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Build the reviewer index of the reviews of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        users = store.columns["user_id"]
+        user_count = len(users.values)
+        self._codes = {
+            user_id: code for code, user_id in enumerate(users.values.tolist())
+        }
+        # Reviews without user have the lowest code, so they are sorted first.
+        null_count = np.count_nonzero(users.codes == NULL_CODE)
+        self.rows = np.lexsort((store.columns["time"], users.codes))[null_count:]
+        self.offsets = np.zeros(user_count + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(users.codes[self.rows], minlength=user_count),
+            out=self.offsets[1:],
+        )
+        self.review_counts = np.diff(self.offsets)
+
+        latest_rows = self.rows[np.maximum(self.offsets[1:] - 1, 0)]
+        self._profile_names = store.columns["profile_name"].take(latest_rows)
+        self._user_ids = users.values
+        # Users whose reviews were all dropped as duplicates have no reviews left.
+        ranking = np.argsort(-self.review_counts, kind="stable")
+        self._ranking = ranking[self.review_counts[ranking] > 0]
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the index, keyed by a dotted name.
+
+        User IDs and profile names are dictionary codes into the store columns, so
+        only their codes are included.
+        """
+        return {
+            "rows": self.rows,
+            "offsets": self.offsets,
+            "profile_names.codes": self._profile_names.codes,
+            "ranking": self._ranking,
+        }
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "ReviewerIndex":
+        """Build the index of a store from the arrays returned by `to_arrays`."""
+        index = cls.__new__(cls)
+        users = store.columns["user_id"]
+        index._codes = {
+            user_id: code for code, user_id in enumerate(users.values.tolist())
+        }
+        index.rows = arrays["rows"]
+        index.offsets = arrays["offsets"]
+        index.review_counts = np.diff(index.offsets)
+        index._profile_names = DictionaryColumn(
+            codes=arrays["profile_names.codes"],
+            values=store.columns["profile_name"].values,
+        )
+        index._user_ids = users.values
+        index._ranking = arrays["ranking"]
+        return index
+
+    def has_user(self, user_id: str) -> bool:
+        """Check if a user reviewed any product."""
+        code = self._codes.get(user_id)
+        return code is not None and self.review_counts[code] > 0
+
+    def profile_name(self, user_id: str) -> str | None:
+        """Get the profile name of a user, as of their latest review.
+
+        Raises:
+            KeyError: If the user has no reviews.
+        """
+        return self._profile_names[self._codes[user_id]]
+
+    def user_rows(self, user_id: str) -> np.ndarray:
+        """Get the store rows of the reviews of a user, by ascending time.
+
+        Raises:
+            KeyError: If the user has no reviews.
+        """
+        code = self._codes[user_id]
+        return self.rows[self.offsets[code] : self.offsets[code + 1]]
+
+    def top_reviewers(self, k: int) -> list[tuple[str, str | None, int]]:
+        """Get the `k` users with most reviews.
+
+        Args:
+            k: The number of users to return.
+
+        Returns:
+            list[tuple[str, str | None, int]]: The user ID, profile name and number of
+            reviews of each user, by descending number of reviews.
+        """
+        codes = self._ranking[:k]
+        return list(
+            zip(
+                self._user_ids.tolist(codes),
+                self._profile_names.tolist(codes),
+                self.review_counts[codes].tolist(),
+            )
+        )
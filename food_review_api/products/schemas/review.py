@@ -6,8 +6,8 @@ class Review(BaseModel):
 
     id: int
     product_id: str = Field(description="Unique identifier for the product")
-    user_id: str = Field(description="Unqiue identifier for the user")
-    profile_name: str = Field(description="Profile name of the user")
+    user_id: str | None = Field(description="Unqiue identifier for the user")
+    profile_name: str | None = Field(description="Profile name of the user")
     helpfulness_numerator: int = Field(
         description="Number of users who found the review helpful"
     )
@@ -0,0 +1,540 @@
+"""Food Review API reviews full-text search index definition."""
+
+import re
+import string
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from food_review_api.products.store import (
+    CompressedStringColumn,
+    ReviewStore,
+    StringColumn,
+)
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+MARKUP_PATTERN = re.compile(r"<[^>]*>")
+BUILD_CHUNK_SIZE = 10_000
+# Longest tokens told apart by their bytes packed into integers, longer ones are few.
+PACKED_TOKEN_SIZE = 16
+# Whether each byte is an ASCII letter or digit.
+ALPHANUMERIC = np.zeros(256, dtype=bool)
+ALPHANUMERIC[list((string.ascii_letters + string.digits).encode())] = True
+# Masks of the first 0 to 8 bytes of a little-endian 64-bit integer.
+WORD_MASKS = np.array([(1 << (8 * size)) - 1 for size in range(9)], dtype=np.uint64)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into lowercase word tokens, ignoring HTML markup.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        list[str]: The tokens, in order of appearance.
+    """
+    return TOKEN_PATTERN.findall(MARKUP_PATTERN.sub(" ", text.lower()))
+
+
+class SearchIndex:
+    """Inverted index of the summary and text of the reviews of a store.
+
+    Each review is a document identified by its store row. The posting list of a
+    term is the slice `offsets[term]:offsets[term + 1]` of the `docs` and `term_freqs`
+    arrays, holding the rows containing the term, in ascending order, and the number
+    of occurrences of the term in them. Matches are ranked with Okapi BM25.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Build the index of the reviews of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        started = perf_counter()
+        self.terms: dict[str, int] = {}
+        doc_count = store.review_count
+        self.doc_lengths = np.zeros(doc_count, dtype=np.int32)
+        term_ids, self.docs, self.term_freqs = self._index_postings(
+            store, np.arange(doc_count)
+        )
+        self.offsets = np.zeros(len(self.terms) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(term_ids, minlength=len(self.terms)), out=self.offsets[1:]
+        )
+        self.average_length = float(self.doc_lengths.mean()) if doc_count else 0.0
+        self.build_time = perf_counter() - started
+
+    @property
+    def term_count(self) -> int:
+        """Get number of distinct indexed terms."""
+        return len(self.terms)
+
+    @property
+    def nbytes(self) -> int:
+        """Get number of bytes of the posting lists and document lengths."""
+        return (
+            self.docs.nbytes
+            + self.term_freqs.nbytes
+            + self.offsets.nbytes
+            + self.doc_lengths.nbytes
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the index, keyed by a dotted name.
+
+        The arrays can be written to disk, and the index rebuilt from them with
+        `from_arrays`. Terms are packed into a string column, by term number.
+        """
+        terms = StringColumn.from_strings(self.terms)
+        return {
+            "terms.data": terms.data,
+            "terms.offsets": terms.offsets,
+            "docs": self.docs,
+            "term_freqs": self.term_freqs,
+            "offsets": self.offsets,
+            "doc_lengths": self.doc_lengths,
+        }
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "SearchIndex":
+        """Build the index of a store from the arrays returned by `to_arrays`.
+
+        Arrays are used as they are, so memory-mapped arrays are not copied, only
+        the vocabulary is decoded.
+        """
+        started = perf_counter()
+        index = cls.__new__(cls)
+        terms = StringColumn(data=arrays["terms.data"], offsets=arrays["terms.offsets"])
+        index.terms = {term: term_id for term_id, term in enumerate(terms.tolist())}
+        index.docs = arrays["docs"]
+        index.term_freqs = arrays["term_freqs"]
+        index.offsets = arrays["offsets"]
+        index.doc_lengths = arrays["doc_lengths"]
+        index.average_length = (
+            float(index.doc_lengths.mean()) if store.review_count else 0.0
+        )
+        index.build_time = perf_counter() - started
+        return index
+
+    def extend(self, store: ReviewStore, added_rows: np.ndarray) -> "SearchIndex":
+        """Build the index of a store made of the indexed reviews and added ones.
+
+        Only the added reviews are tokenized. The postings of the indexed reviews
+        are renumbered to their rows in the store, and the postings of the added
+        reviews are inserted among them, so postings are not sorted again.
+
+        Args:
+            store: The store of the indexed and added reviews, see
+                `ReviewStore.merge`.
+            added_rows: The rows of the added reviews in the store, in ascending
+                order.
+
+        Returns:
+            SearchIndex: The index of the store, this index is left unchanged.
+        """
+        started = perf_counter()
+        index = SearchIndex.__new__(SearchIndex)
+        # Readers may still be searching this index, so its vocabulary is copied.
+        index.terms = dict(self.terms)
+        rows = np.delete(np.arange(store.review_count), added_rows)
+        index.doc_lengths = np.zeros(store.review_count, dtype=np.int32)
+        index.doc_lengths[rows] = self.doc_lengths
+        added_terms, added_docs, added_freqs = index._index_postings(store, added_rows)
+
+        terms = np.repeat(np.arange(self.term_count), np.diff(self.offsets))
+        docs = rows[self.docs]
+        positions = _insertion_positions(terms, docs, added_terms, added_docs)
+        index.docs = np.insert(docs.astype(np.int32), positions, added_docs)
+        index.term_freqs = np.insert(
+            np.asarray(self.term_freqs), positions, added_freqs
+        )
+        counts = np.bincount(added_terms, minlength=index.term_count)
+        counts[: self.term_count] += np.diff(self.offsets)
+        index.offsets = np.zeros(index.term_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=index.offsets[1:])
+        index.average_length = (
+            float(index.doc_lengths.mean()) if store.review_count else 0.0
+        )
+        index.build_time = perf_counter() - started
+        return index
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        rows: slice | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, int]:
+        """Get the reviews best matching a query.
+
+        Args:
+            query: The text to search for, any of its terms may match.
+            limit: The maximum number of matches to return.
+            offset: The number of best matches to skip.
+            rows: The range of store rows to search in, e.g. the rows of a product,
+                all rows if None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, int]: The store rows and BM25 scores of the
+            matches, by descending score, and the total number of matches.
+        """
+        postings = [
+            self._score_postings(self.terms[term])
+            for term in dict.fromkeys(tokenize(query))
+            if term in self.terms
+        ]
+        if not postings:
+            return np.empty(0, dtype=np.int32), np.empty(0), 0
+        docs = np.concatenate([docs for docs, _ in postings])
+        scores = np.concatenate([scores for _, scores in postings])
+        if rows is not None:
+            in_rows = (docs >= rows.start) & (docs < rows.stop)
+            docs, scores = docs[in_rows], scores[in_rows]
+        docs, positions = np.unique(docs, return_inverse=True)
+        scores = np.bincount(positions, weights=scores, minlength=len(docs))
+
+        total = len(docs)
+        top = offset + limit
+        if top < total:
+            # Keep every match scoring at least the top-th best score, so ties at
+            # the cut are broken by row below, and pages are stable.
+            kth_score = np.partition(scores, total - top)[total - top]
+            candidates = np.flatnonzero(scores >= kth_score)
+            docs, scores = docs[candidates], scores[candidates]
+        order = np.lexsort((docs, -scores))[offset:top]
+        return docs[order], scores[order], total
+
+    def _score_postings(self, term: int) -> tuple[np.ndarray, np.ndarray]:
+        """Get the rows containing a term, and the BM25 score of the term in them."""
+        postings = slice(self.offsets[term], self.offsets[term + 1])
+        docs = self.docs[postings]
+        freqs = self.term_freqs[postings].astype(np.float64)
+        doc_count = len(self.doc_lengths)
+        idf = np.log1p((doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+        norms = self.K1 * (
+            1 - self.B + self.B * self.doc_lengths[docs] / self.average_length
+        )
+        return docs, idf * freqs * (self.K1 + 1) / (freqs + norms)
+
+    def _index_postings(
+        self, store: ReviewStore, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tokenize rows by chunks, adding their terms to the vocabulary.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The term, row and number of
+            occurrences of each distinct term of each row, by term and row.
+        """
+        chunks = [
+            self._index_rows(store, rows[start : start + BUILD_CHUNK_SIZE])
+            for start in range(0, len(rows), BUILD_CHUNK_SIZE)
+        ]
+        return _sort_postings(
+            *(
+                np.concatenate(
+                    [chunk[part] for chunk in chunks] or [np.empty(0, dtype)]
+                )
+                for part, dtype in enumerate([np.int64, np.int32, np.uint16])
+            )
+        )
+
+    def _index_rows(
+        self, store: ReviewStore, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tokenize rows, adding their terms to the vocabulary.
+
+        The summary and text of the rows are tokenized from their UTF-8 bytes. Rows
+        of ASCII text, most of them, are tokenized with array operations on all
+        their bytes at once, and the others one by one with `tokenize`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The term, row and number of
+            occurrences of each distinct term of each row, by ascending row.
+        """
+        buffer, doc_starts = _document_bytes(store, rows)
+        doc_count = len(doc_starts) - 1
+        non_ascii = np.zeros(doc_count, dtype=bool)
+        non_ascii[
+            np.searchsorted(doc_starts, np.flatnonzero(buffer >= 0x80), "right") - 1
+        ] = True
+        token_docs, token_terms = self._index_ascii_tokens(
+            buffer, doc_starts, non_ascii
+        )
+        if non_ascii.any():
+            docs = np.flatnonzero(non_ascii)
+            tokens = [
+                tokenize(f"{summary} {text}")
+                for summary, text in zip(
+                    store.columns["summary"].tolist(rows[docs]),
+                    store.columns["text"].tolist(rows[docs]),
+                )
+            ]
+            token_docs = np.concatenate(
+                [
+                    token_docs,
+                    np.repeat(docs, [len(doc_tokens) for doc_tokens in tokens]),
+                ]
+            )
+            token_terms = np.concatenate(
+                [
+                    token_terms,
+                    np.fromiter(
+                        (
+                            self.terms.setdefault(term, len(self.terms))
+                            for doc_tokens in tokens
+                            for term in doc_tokens
+                        ),
+                        dtype=np.int64,
+                    ),
+                ]
+            )
+        self.doc_lengths[rows] = np.bincount(token_docs, minlength=doc_count)
+
+        # Pairs are keyed by document first, so distinct pairs are sorted by row.
+        term_count = len(self.terms)
+        pairs, counts = np.unique(
+            token_docs * term_count + token_terms, return_counts=True
+        )
+        doc_ids, term_ids = np.divmod(pairs, term_count)
+        return (
+            term_ids,
+            rows[doc_ids].astype(np.int32),
+            np.minimum(counts, np.iinfo(np.uint16).max).astype(np.uint16),
+        )
+
+    def _index_ascii_tokens(
+        self, buffer: np.ndarray, doc_starts: np.ndarray, skipped: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Tokenize documents of ASCII text, adding their terms to the vocabulary.
+
+        Tokens are the runs of ASCII letters and digits outside of markup, which
+        is what `tokenize` matches in ASCII text. Tokens of up to
+        `PACKED_TOKEN_SIZE` bytes are told apart by their bytes packed into two
+        integers, so only distinct terms and longer tokens are decoded.
+
+        Args:
+            buffer: The bytes of the documents, back to back.
+            doc_starts: The start of each document in the buffer, followed by the
+                size of the buffer.
+            skipped: Whether each document is left out, e.g. as it is not ASCII.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The document, relative to the buffer,
+            and the term of each token, by order of appearance.
+        """
+        in_token = ALPHANUMERIC[buffer]
+        # Documents end with a line break, so every token ends in the buffer.
+        bounds = np.flatnonzero(in_token[1:] != in_token[:-1]) + 1
+        if len(buffer) and in_token[0]:
+            bounds = np.insert(bounds, 0, 0)
+        starts, ends = bounds[0::2], bounds[1::2]
+        token_docs = np.searchsorted(doc_starts, starts, "right") - 1
+        # Markup bounds are not letters nor digits, so tokens are in or out of it.
+        tag_starts, tag_ends = _markup_spans(buffer, doc_starts)
+        tags = np.searchsorted(tag_starts, starts, "right") - 1
+        in_markup = (tags >= 0) & (starts < np.append(tag_ends, 0)[tags])
+        kept = ~(in_markup | skipped[token_docs])
+        starts, lengths = starts[kept], (ends - starts)[kept]
+        token_docs = token_docs[kept]
+
+        token_terms = np.empty(len(starts), dtype=np.int64)
+        packed = lengths <= PACKED_TOKEN_SIZE
+        high, low = _packed_words(buffer, starts[packed], lengths[packed])
+        # Most tokens fit in the first word, the second one is only compared for
+        # the others, whose first word may equal the one of a shorter token.
+        long = low != 0
+        short_ids, short_words = pd.factorize(high[~long])
+        local_ids = np.empty(len(high), dtype=np.int64)
+        local_ids[~long] = short_ids
+        terms = [short_words, np.zeros_like(short_words)]
+        if long.any():
+            high_ids, high_words = pd.factorize(high[long])
+            low_ids, low_words = pd.factorize(low[long])
+            pair_ids, pairs = pd.factorize(high_ids * len(low_words) + low_ids)
+            local_ids[long] = len(short_words) + pair_ids
+            terms[0] = np.append(short_words, high_words[pairs // len(low_words)])
+            terms[1] = np.append(terms[1], low_words[pairs % len(low_words)])
+        # Byte strings drop the zero bytes padding the packed terms.
+        packed_terms = np.stack(terms, axis=1).astype("<u8")
+        term_ids = np.fromiter(
+            (
+                self.terms.setdefault(term.decode(), len(self.terms))
+                for term in packed_terms.view(f"S{PACKED_TOKEN_SIZE}").ravel()
+            ),
+            dtype=np.int64,
+            count=len(packed_terms),
+        )
+        token_terms[packed] = term_ids[local_ids]
+
+        data = memoryview(buffer)
+        token_terms[~packed] = np.fromiter(
+            (
+                self.terms.setdefault(
+                    str(data[start : start + length], "ascii").lower(),
+                    len(self.terms),
+                )
+                for start, length in zip(
+                    starts[~packed].tolist(), lengths[~packed].tolist()
+                )
+            ),
+            dtype=np.int64,
+            count=np.count_nonzero(~packed),
+        )
+        return token_docs, token_terms
+
+
+def _document_bytes(
+    store: ReviewStore, rows: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the summary and text of rows, as documents in one buffer.
+
+    Each document is the summary and the text of a row separated by a space, and
+    is followed by a line break, so that neither tokens nor markup span documents.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The bytes of the documents, back to back, and
+        the start of each document in the buffer, followed by the buffer size.
+    """
+    values = []
+    for name in ["summary", "text"]:
+        column = store.columns[name]
+        if isinstance(column, CompressedStringColumn):
+            column = StringColumn.from_strings(column.tolist(rows))
+            starts, ends = column.offsets[:-1], column.offsets[1:]
+        else:
+            starts, ends = column.offsets[:-1][rows], column.offsets[1:][rows]
+        data = memoryview(column.data)
+        values.append(
+            [data[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+        )
+    buffer = b"".join(
+        part for summary, text in zip(*values) for part in (summary, b" ", text, b"\n")
+    )
+    doc_starts = np.zeros(len(values[0]) + 1, dtype=np.int64)
+    np.cumsum(
+        [len(summary) + len(text) + 2 for summary, text in zip(*values)],
+        out=doc_starts[1:],
+    )
+    return np.frombuffer(buffer, dtype=np.uint8), doc_starts
+
+
+def _packed_words(
+    buffer: np.ndarray, starts: np.ndarray, lengths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pack lowercase tokens of up to `PACKED_TOKEN_SIZE` bytes into two integers.
+
+    The bytes of each token are read as two little-endian 64-bit integers, with
+    the bytes following the token masked out, so that tokens equal but for their
+    case, and only them, have equal integers once lowercased.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The integers of the first and last 8 bytes
+        of each token, 0 for the last 8 bytes of tokens of up to 8 bytes.
+    """
+    padded = np.append(buffer, np.zeros(PACKED_TOKEN_SIZE, np.uint8))
+    # Each item of this view is the 8 bytes starting at its index.
+    words = np.ndarray(len(buffer) + 8, dtype="<u8", buffer=padded, strides=(1,))
+    high = words[starts].astype(np.uint64) & WORD_MASKS[np.minimum(lengths, 8)]
+    low = words[starts + 8].astype(np.uint64) & WORD_MASKS[np.clip(lengths - 8, 0, 8)]
+    return _lowercase(high), _lowercase(low)
+
+
+def _lowercase(words: np.ndarray) -> np.ndarray:
+    """Lowercase the bytes of integers made of ASCII letters, digits and zeros.
+
+    The bytes from `A` to `Z` are found all at once, as the bytes whose top bit is
+    set by adding `0x3F` but not by adding `0x25`, which never carries over to the
+    next byte, and get the lowercase bit `0x20`.
+    """
+    added = words + np.uint64(0x3F3F3F3F3F3F3F3F)
+    uppercase = added & ~(words + np.uint64(0x2525252525252525))
+    return words | ((uppercase & np.uint64(0x8080808080808080)) >> np.uint64(2))
+
+
+def _sort_postings(
+    term_ids: np.ndarray, docs: np.ndarray, freqs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sort postings by term, and by row for each term.
+
+    The term, row and number of occurrences of each posting are packed into a
+    single integer when they fit, as sorting integers is much faster than sorting
+    positions by term, which is done otherwise.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The term, row and number of
+        occurrences of each posting, in order.
+    """
+    doc_bits = int(docs.max(initial=0)).bit_length()
+    term_bits = int(term_ids.max(initial=0)).bit_length()
+    if term_bits + doc_bits + 16 > 63:
+        order = np.lexsort((docs, term_ids))
+        return term_ids[order], docs[order], freqs[order]
+    keys = term_ids << (doc_bits + 16)
+    keys |= docs.astype(np.int64) << 16
+    keys |= freqs
+    keys.sort()
+    sorted_docs = ((keys >> 16) & ((1 << doc_bits) - 1)).astype(np.int32)
+    return keys >> (doc_bits + 16), sorted_docs, (keys & 0xFFFF).astype(np.uint16)
+
+
+def _insertion_positions(
+    term_ids: np.ndarray,
+    docs: np.ndarray,
+    added_term_ids: np.ndarray,
+    added_docs: np.ndarray,
+) -> np.ndarray:
+    """Get where to insert postings among postings, both sorted by term and row.
+
+    Terms and rows are packed into a single integer when they fit, so positions
+    are found by binary search, otherwise all the postings are sorted.
+
+    Returns:
+        np.ndarray: The position of each added posting, before which it is
+        inserted, see `np.insert`.
+    """
+    added_docs = added_docs.astype(np.int64)
+    doc_bits = int(max(docs.max(initial=0), added_docs.max(initial=0))).bit_length()
+    term_bits = int(
+        max(term_ids.max(initial=0), added_term_ids.max(initial=0))
+    ).bit_length()
+    if term_bits + doc_bits > 63:
+        order = np.lexsort(
+            (
+                np.concatenate([docs, added_docs]),
+                np.concatenate([term_ids, added_term_ids]),
+            )
+        )
+        return np.flatnonzero(order >= len(docs)) - np.arange(len(added_docs))
+    return np.searchsorted(
+        (term_ids << doc_bits) | docs, (added_term_ids << doc_bits) | added_docs
+    )
+
+
+def _markup_spans(
+    buffer: np.ndarray, doc_starts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the markup tags of documents, as matched by `MARKUP_PATTERN`.
+
+    A tag spans from a `<` to the next `>` of the same document, unless the `<` is
+    in the previous tag, so each tag starts at the first `<` before its `>`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The start and end, exclusive, of each tag in
+        the buffer, in ascending order.
+    """
+    opening = np.flatnonzero(buffer == ord("<"))
+    closing = np.flatnonzero(buffer == ord(">"))
+    next_closing = np.searchsorted(closing, opening)
+    closed = next_closing < len(closing)
+    opening, next_closing = opening[closed], closing[next_closing[closed]]
+    doc_ends = doc_starts[np.searchsorted(doc_starts, opening, "right")]
+    in_document = next_closing < doc_ends
+    ends, first = np.unique(next_closing[in_document], return_index=True)
+    return opening[in_document][first], ends + 1
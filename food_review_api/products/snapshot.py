@@ -0,0 +1,445 @@
+"""Food Review API products snapshot class definition."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Hashable
+from dataclasses import dataclass, field
+from threading import Lock
+from time import time
+from typing import Any, ClassVar
+
+import numpy as np
+
+from food_review_api.core.config.database import DatabaseConfig
+from food_review_api.products.exceptions import (
+    ProductNotFoundInRepositoryError,
+    UserNotFoundInRepositoryError,
+)
+from food_review_api.products.orderings import ReviewOrderings
+from food_review_api.products.rankings import ReviewCountRanking
+from food_review_api.products.reviewers import ReviewerIndex
+from food_review_api.products.schemas import Product, Review
+from food_review_api.products.search import SearchIndex
+from food_review_api.products.sources import SourceState
+from food_review_api.products.statistics import ProductStatistics
+from food_review_api.products.store import ReviewStore
+from food_review_api.products.timeline import ReviewTimeline
+
+
+@dataclass(frozen=True, eq=False)
+class ProductSnapshot:
+    """Immutable snapshot of the loaded products.
+
+    A snapshot bundles the review store with every index derived from it, so that
+    readers holding a reference to a snapshot always see consistent data, while a
+    reload builds and publishes a new snapshot.
+    """
+
+    MEMO_MAX_ENTRIES: ClassVar[int] = 64
+    # Indexes derived from the store, by field name.
+    INDEX_TYPES: ClassVar[dict[str, Any]] = {
+        "ranking": ReviewCountRanking,
+        "search_index": SearchIndex,
+        "statistics": ProductStatistics,
+        "reviewers": ReviewerIndex,
+        "timeline": ReviewTimeline,
+        "orderings": ReviewOrderings,
+    }
+
+    store: ReviewStore
+    ranking: ReviewCountRanking
+    search_index: SearchIndex
+    statistics: ProductStatistics
+    reviewers: ReviewerIndex
+    timeline: ReviewTimeline
+    orderings: ReviewOrderings
+    metadata: DatabaseConfig | None = None
+    sources: tuple[SourceState, ...] = ()
+    generation: int = 0
+    created_at: float = field(default_factory=time)
+    _memo: OrderedDict = field(default_factory=OrderedDict, repr=False)
+    _memo_lock: Lock = field(default_factory=Lock, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        store: ReviewStore,
+        metadata: DatabaseConfig | None = None,
+        generation: int = 0,
+        sources: tuple[SourceState, ...] = (),
+    ) -> "ProductSnapshot":
+        """Build a snapshot and its derived indexes from a review store.
+
+        Args:
+            store: The loaded reviews store.
+            metadata: The configuration of the database the store was loaded from.
+            generation: The generation number of the snapshot.
+            sources: The ingested part of each CSV file of the store.
+
+        Returns:
+            ProductSnapshot: The snapshot.
+        """
+        return cls(
+            store=store,
+            **{name: index_type(store) for name, index_type in cls.INDEX_TYPES.items()},
+            metadata=metadata,
+            sources=sources,
+            generation=generation,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        store: ReviewStore,
+        arrays: dict[str, np.ndarray],
+        metadata: DatabaseConfig | None = None,
+        generation: int = 0,
+        sources: tuple[SourceState, ...] = (),
+    ) -> "ProductSnapshot":
+        """Build a snapshot from a store and the index arrays of `to_arrays`.
+
+        Arrays are used as they are, so memory-mapped indexes are not copied.
+
+        Args:
+            store: The loaded reviews store the indexes were built from.
+            arrays: The arrays of the indexes, keyed by index and array name.
+            metadata: The configuration of the database the store was loaded from.
+            generation: The generation number of the snapshot.
+            sources: The ingested part of each CSV file of the store.
+
+        Returns:
+            ProductSnapshot: The snapshot.
+        """
+        index_arrays: dict[str, dict[str, np.ndarray]] = {
+            name: {} for name in cls.INDEX_TYPES
+        }
+        for key, array in arrays.items():
+            name, array_name = key.split(".", 1)
+            index_arrays[name][array_name] = array
+        return cls(
+            store=store,
+            **{
+                name: index_type.from_arrays(store, index_arrays[name])
+                for name, index_type in cls.INDEX_TYPES.items()
+            },
+            metadata=metadata,
+            sources=sources,
+            generation=generation,
+        )
+
+    def extend(
+        self,
+        store: ReviewStore,
+        added_rows: np.ndarray,
+        metadata: DatabaseConfig | None = None,
+        generation: int = 0,
+        sources: tuple[SourceState, ...] = (),
+    ) -> "ProductSnapshot":
+        """Build the snapshot of a store made of the reviews of this one and more.
+
+        The search index is extended with the added reviews only, see
+        `SearchIndex.extend`, the other indexes are cheap enough to build again.
+
+        Args:
+            store: The store of the reviews of this snapshot and the added ones,
+                see `ReviewStore.merge`.
+            added_rows: The rows of the added reviews in the store, in ascending
+                order.
+            metadata: The configuration of the database the store was loaded from.
+            generation: The generation number of the snapshot.
+            sources: The ingested part of each CSV file of the store.
+
+        Returns:
+            ProductSnapshot: The snapshot.
+        """
+        indexes = {
+            name: index_type(store)
+            for name, index_type in self.INDEX_TYPES.items()
+            if name != "search_index"
+        }
+        return ProductSnapshot(
+            store=store,
+            search_index=self.search_index.extend(store, added_rows),
+            **indexes,
+            metadata=metadata,
+            sources=sources,
+            generation=generation,
+        )
+
+    @classmethod
+    def empty(cls, generation: int = 0) -> "ProductSnapshot":
+        """Build a snapshot without products."""
+        return cls.build(ReviewStore.empty(), generation=generation)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the indexes, keyed by index and array name.
+
+        The store arrays are not included, see `ReviewStore.to_arrays`. The
+        snapshot can be rebuilt from both with `from_arrays`.
+        """
+        return {
+            f"{name}.{array_name}": array
+            for name in self.INDEX_TYPES
+            for array_name, array in getattr(self, name).to_arrays().items()
+        }
+
+    def has_product(self, name: str) -> bool:
+        """Check if a product is in the snapshot by product name."""
+        return self.store.has_product(name)
+
+    def product_rows(self, name: str) -> slice:
+        """Get the store rows of the reviews of a product.
+
+        Raises:
+            ProductNotFoundInRepositoryError: If the product is not loaded.
+        """
+        try:
+            return self.store.product_rows(name)
+        except KeyError:
+            raise ProductNotFoundInRepositoryError(name)
+
+    def get(self, name: str) -> Product:
+        """Get product instance by name, with all its reviews.
+
+        Raises:
+            ProductNotFoundInRepositoryError: If the product is not loaded.
+        """
+        rows = self.product_rows(name)
+        return Product(
+            product_id=name,
+            reviews=self.store.reviews(rows),
+            number_of_reviews=rows.stop - rows.start,
+        )
+
+    def get_stats(self, name: str) -> dict[str, Any]:
+        """Get the precomputed statistics of the reviews of a product.
+
+        Raises:
+            ProductNotFoundInRepositoryError: If the product is not loaded.
+        """
+        try:
+            position = self.store.product_position(name)
+        except KeyError:
+            raise ProductNotFoundInRepositoryError(name)
+        return self.statistics.get(position)
+
+    def get_reviews(
+        self,
+        name: str,
+        offset: int = 0,
+        limit: int | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        fields: Collection[str] | None = None,
+        sort: str = "time",
+        min_score: int | None = None,
+        max_score: int | None = None,
+    ) -> tuple[list[Review], int]:
+        """Get a page of the reviews of a product, by ascending time by default.
+
+        The page is sliced from the product rows range of the columnar store, which
+        is sorted by time, or from the same range of a permutation of the rows
+        sorted by another key, built when the products are loaded, so only the
+        `Review` instances of the page are built.
+
+        Args:
+            name: The product identifier.
+            offset: The number of reviews to skip.
+            limit: The maximum number of reviews to return, all if None.
+            since: The earliest review time, inclusive, unbounded if None.
+            until: The latest review time, inclusive, unbounded if None.
+            fields: The `Review` fields to set, all if None.
+            sort: The sort key, `time`, `score` or `helpfulness`, prefixed with
+                `-` for descending order.
+            min_score: The lowest review score, inclusive, unbounded if None.
+            max_score: The highest review score, inclusive, unbounded if None.
+
+        Raises:
+            ProductNotFoundInRepositoryError: If the product is not loaded.
+
+        Returns:
+            tuple[list[Review], int]: The reviews of the page and the total number
+            of reviews of the product matching the filters.
+        """
+        rows, total = self.orderings.page(
+            self.product_rows(name),
+            sort=sort,
+            offset=offset,
+            limit=limit,
+            since=since,
+            until=until,
+            min_score=min_score,
+            max_score=max_score,
+        )
+        return self.store.reviews(rows, fields), total
+
+    def get_latest_reviews(
+        self,
+        limit: int,
+        offset: int = 0,
+        since: int | None = None,
+        until: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Review], int]:
+        """Get a page of the latest reviews across all products.
+
+        Args:
+            limit: The maximum number of reviews to return.
+            offset: The number of latest reviews to skip.
+            since: The earliest review time, inclusive, unbounded if None.
+            until: The latest review time, inclusive, unbounded if None.
+            fields: The `Review` fields to set, all if None.
+
+        Returns:
+            tuple[list[Review], int]: The reviews of the page, by descending time,
+            and the total number of reviews in the time range.
+        """
+        rows, total = self.timeline.latest(
+            limit, offset=offset, since=since, until=until
+        )
+        return self.store.reviews(rows, fields), total
+
+    def get_many_reviews(
+        self, names: list[str], limit: int | None = None
+    ) -> tuple[list[tuple[str, list[Review], int]], list[str]]:
+        """Get the reviews of several products at once.
+
+        The rows of all the found products are gathered into a single array, so
+        the reviews of the whole batch are built in one pass over the store.
+
+        Args:
+            names: The product identifiers.
+            limit: The maximum number of reviews of each product, all if None.
+
+        Returns:
+            tuple[list[tuple[str, list[Review], int]], list[str]]: The product
+            identifier, reviews and total number of reviews of each found product,
+            and the identifiers of the products not loaded, in request order.
+        """
+        positions, found, missing = self._product_positions(names)
+        rows, lengths = self.store.positions_rows(positions, limit=limit)
+        reviews = self.store.reviews(rows)
+        bounds = np.cumsum(lengths).tolist()
+        totals = self.store.review_counts[positions].tolist()
+        return [
+            (name, reviews[stop - length : stop], total)
+            for name, stop, length, total in zip(
+                found, bounds, lengths.tolist(), totals
+            )
+        ], missing
+
+    def get_many_stats(
+        self, names: list[str]
+    ) -> tuple[list[tuple[str, dict[str, Any]]], list[str]]:
+        """Get the precomputed statistics of several products at once.
+
+        Args:
+            names: The product identifiers.
+
+        Returns:
+            tuple[list[tuple[str, dict[str, Any]]], list[str]]: The product
+            identifier and statistics of each found product, and the identifiers
+            of the products not loaded, in request order.
+        """
+        positions, found, missing = self._product_positions(names)
+        return list(zip(found, self.statistics.get_many(positions))), missing
+
+    def _product_positions(
+        self, names: list[str]
+    ) -> tuple[np.ndarray, list[str], list[str]]:
+        """Get the store positions of the loaded products among several products.
+
+        Returns:
+            tuple[np.ndarray, list[str], list[str]]: The positions and identifiers
+            of the loaded products, and the identifiers of the products not loaded.
+        """
+        positions = self.store.product_positions(names)
+        is_found = (positions >= 0).tolist()
+        found = [name for name, is_loaded in zip(names, is_found) if is_loaded]
+        missing = [name for name, is_loaded in zip(names, is_found) if not is_loaded]
+        return positions[positions >= 0], found, missing
+
+    def get_user_reviews(
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[str, list[Review], int]:
+        """Get a page of the reviews of a user, by ascending time.
+
+        Args:
+            user_id: The user identifier.
+            offset: The number of reviews to skip.
+            limit: The maximum number of reviews to return, all if None.
+            fields: The `Review` fields to set, all if None.
+
+        Raises:
+            UserNotFoundInRepositoryError: If the user has no loaded reviews.
+
+        Returns:
+            tuple[str, list[Review], int]: The profile name of the user, the
+            reviews of the page and the total number of reviews of the user.
+        """
+        if not self.reviewers.has_user(user_id):
+            raise UserNotFoundInRepositoryError(user_id)
+        rows = self.reviewers.user_rows(user_id)
+        stop = None if limit is None else offset + limit
+        return (
+            self.reviewers.profile_name(user_id),
+            self.store.reviews(rows[offset:stop], fields),
+            len(rows),
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        product_id: str | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[tuple[Review, float]], int]:
+        """Search reviews by summary and text, by descending relevance.
+
+        Args:
+            query: The text to search for, any of its terms may match.
+            limit: The maximum number of matches to return.
+            offset: The number of best matches to skip.
+            product_id: The product to search the reviews of, all if None.
+            fields: The `Review` fields to set, all if None.
+
+        Raises:
+            ProductNotFoundInRepositoryError: If the product is not loaded.
+
+        Returns:
+            tuple[list[tuple[Review, float]], int]: The matching reviews of the page
+            with their relevance score, and the total number of matches.
+        """
+        rows = None if product_id is None else self.product_rows(product_id)
+        matches, scores, total = self.search_index.search(
+            query, limit=limit, offset=offset, rows=rows
+        )
+        return list(zip(self.store.reviews(matches, fields), scores.tolist())), total
+
+    def memoize(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get a value derived from the snapshot, computing it on first use.
+
+        Values are kept for the lifetime of the snapshot, e.g. serialized responses,
+        evicting the least recently used once `MEMO_MAX_ENTRIES` is reached.
+
+        Args:
+            key: The key identifying the value.
+            factory: The function computing the value.
+
+        Returns:
+            Any: The memoized value.
+        """
+        with self._memo_lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+        value = factory()
+        with self._memo_lock:
+            self._memo[key] = value
+            if len(self._memo) > self.MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+        return value
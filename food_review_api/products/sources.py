@@ -0,0 +1,143 @@
+"""Food Review API reviews source files definitions."""
+
+import io
+import os
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import BinaryIO
+
+BLOCK_SIZE = 2**16
+
+
+@dataclass(frozen=True)
+class SourceState:
+    """Part of an append-only reviews CSV file ingested into a store.
+
+    The first `offset` bytes of the file, holding `row_count` reviews, have been
+    ingested. The digests of the first and last blocks of those bytes are used to
+    detect if they were modified since, rather than only appended to. Reading two
+    blocks keeps the check cheap whatever the size of the file, but it misses
+    edits which are confined to the middle of the ingested bytes and keep their
+    size, e.g. a review text rewritten in place with as many characters.
+    """
+
+    filename: str
+    offset: int
+    row_count: int
+    head_digest: str
+    tail_digest: str
+
+    @classmethod
+    def of(cls, filename: str, offset: int, row_count: int) -> "SourceState":
+        """Get the state of a file ingested up to a byte offset.
+
+        Args:
+            filename: The path to the CSV file.
+            offset: The number of ingested bytes, at the end of a line.
+            row_count: The number of ingested reviews.
+
+        Returns:
+            SourceState: The state of the file.
+        """
+        head_digest, tail_digest = prefix_digests(filename, offset)
+        return cls(
+            filename=filename,
+            offset=offset,
+            row_count=row_count,
+            head_digest=head_digest,
+            tail_digest=tail_digest,
+        )
+
+    def appended_range(self) -> tuple[int, int] | None:
+        """Get the byte range of the complete lines appended to the file since.
+
+        Returns:
+            tuple[int, int] | None: The start and stop bytes of the appended lines,
+            or None if the ingested bytes were modified, or the file removed.
+        """
+        stop = ingestible_size(self.filename)
+        if stop is None or stop < self.offset:
+            return None
+        if prefix_digests(self.filename, self.offset) != (
+            self.head_digest,
+            self.tail_digest,
+        ):
+            return None
+        return self.offset, stop
+
+
+class FileRange(io.RawIOBase):
+    """Read-only view of a file up to a byte offset, from its current position."""
+
+    def __init__(self, file: BinaryIO, stop: int) -> None:
+        """Initialize view of an open binary file.
+
+        Args:
+            file: The file, positioned at the start of the view.
+            stop: The byte offset of the end of the view.
+        """
+        self._file = file
+        self._remaining = stop - file.tell()
+
+    def readable(self) -> bool:
+        """Check if the view can be read, which it always can."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read bytes of the view into a buffer."""
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        read = self._file.readinto(memoryview(buffer)[:size])
+        self._remaining -= read
+        return read
+
+
+def ingestible_size(filename: str, end: int | None = None) -> int | None:
+    """Get the size of a file up to the end of its last complete line.
+
+    Args:
+        filename: The path to the CSV file.
+        end: The byte offset to look for the last line break before, the end of
+            the file if None.
+
+    Returns:
+        int | None: The number of bytes up to the last line break, or None if the
+        file does not exist.
+    """
+    try:
+        file = open(filename, "rb")
+    except FileNotFoundError:
+        return None
+    with file:
+        size = file.seek(0, os.SEEK_END)
+        end = size if end is None else min(end, size)
+        while end > 0:
+            start = max(end - BLOCK_SIZE, 0)
+            file.seek(start)
+            newline = file.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+        return 0
+
+
+def prefix_digests(filename: str, offset: int) -> tuple[str, str]:
+    """Get the digests of the first and last blocks of the first bytes of a file.
+
+    Args:
+        filename: The path to the file.
+        offset: The number of first bytes, at most the size of the file.
+
+    Returns:
+        tuple[str, str]: The hexadecimal digests of the first and last
+        `BLOCK_SIZE` bytes before `offset`.
+    """
+    with open(filename, "rb") as file:
+        head = file.read(min(offset, BLOCK_SIZE))
+        file.seek(max(offset - BLOCK_SIZE, 0))
+        tail = file.read(min(offset, BLOCK_SIZE))
+    return (
+        blake2b(head, digest_size=16).hexdigest(),
+        blake2b(tail, digest_size=16).hexdigest(),
+    )
@@ -0,0 +1,171 @@
+"""Food Review API products statistics class definition."""
+
+from typing import Any
+
+import numpy as np
+
+from food_review_api.products.store import NULL_CODE, ReviewStore
+
+SCORES = np.arange(1, 6)
+# Statistics arrays computed from the store, aligned with its `product_ids`.
+STATISTICS = (
+    "score_histograms",
+    "mean_scores",
+    "median_scores",
+    "helpful_votes",
+    "total_votes",
+    "distinct_reviewers",
+    "first_times",
+    "last_times",
+)
+
+
+class ProductStatistics:
+    """Aggregate statistics of the reviews of each product.
+
+    Statistics are computed for every product at once from the store columns, as
+    reviews are grouped by product in the store, and kept in arrays aligned with
+    the store `product_ids`, so getting the statistics of a product is a lookup.
+    """
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Compute the statistics of the products of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        self.review_counts = store.review_counts
+        product_count = store.product_count
+        products = np.repeat(np.arange(product_count), self.review_counts)
+        starts = store.offsets[:-1]
+
+        scores = store.columns["score"].astype(np.int64)
+        in_range = (scores >= SCORES[0]) & (scores <= SCORES[-1])
+        self.score_histograms = np.bincount(
+            products[in_range] * len(SCORES) + scores[in_range] - SCORES[0],
+            minlength=product_count * len(SCORES),
+        ).reshape(product_count, len(SCORES))
+        self.mean_scores = _sum_by_product(
+            scores, starts, self.review_counts
+        ) / np.maximum(self.review_counts, 1)
+        self.median_scores = _histogram_medians(self.score_histograms)
+
+        self.helpful_votes = _sum_by_product(
+            store.columns["helpfulness_numerator"], starts, self.review_counts
+        )
+        self.total_votes = _sum_by_product(
+            store.columns["helpfulness_denominator"], starts, self.review_counts
+        )
+
+        user_codes = store.columns["user_id"].codes.astype(np.int64)
+        user_count = len(store.columns["user_id"].values)
+        known = user_codes != NULL_CODE
+        product_users = np.unique(products[known] * user_count + user_codes[known])
+        self.distinct_reviewers = np.bincount(
+            product_users // max(user_count, 1), minlength=product_count
+        )
+
+        times = store.columns["time"]
+        self.first_times = _reduce_by_product(
+            np.minimum, times, starts, self.review_counts
+        )
+        self.last_times = _reduce_by_product(
+            np.maximum, times, starts, self.review_counts
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays of statistics, keyed by name."""
+        return {name: getattr(self, name) for name in STATISTICS}
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "ProductStatistics":
+        """Build the statistics of a store from the arrays returned by `to_arrays`."""
+        statistics = cls.__new__(cls)
+        statistics.review_counts = store.review_counts
+        for name in STATISTICS:
+            setattr(statistics, name, arrays[name])
+        return statistics
+
+    def get_many(self, positions: np.ndarray) -> list[dict[str, Any]]:
+        """Get the statistics of several products.
+
+        Statistics are gathered column by column for all the products at once.
+
+        Args:
+            positions: The positions of the products in the store `product_ids`.
+
+        Returns:
+            list[dict[str, Any]]: The statistics of each product reviews, in the
+            order of the positions.
+        """
+        helpful_votes = self.helpful_votes[positions]
+        total_votes = self.total_votes[positions]
+        helpfulness_ratios = np.divide(
+            helpful_votes,
+            total_votes,
+            out=np.full(len(positions), np.nan),
+            where=total_votes > 0,
+        )
+        columns = {
+            "number_of_reviews": self.review_counts[positions].tolist(),
+            "mean_score": self.mean_scores[positions].tolist(),
+            "median_score": self.median_scores[positions].astype(float).tolist(),
+            "score_histogram": self.score_histograms[positions].tolist(),
+            "helpfulness_ratio": [
+                None if total == 0 else ratio
+                for ratio, total in zip(
+                    helpfulness_ratios.tolist(), total_votes.tolist()
+                )
+            ],
+            "distinct_reviewers": self.distinct_reviewers[positions].tolist(),
+            "first_review_time": self.first_times[positions].tolist(),
+            "last_review_time": self.last_times[positions].tolist(),
+        }
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def get(self, position: int) -> dict[str, Any]:
+        """Get the statistics of a product.
+
+        Args:
+            position: The position of the product in the store `product_ids`.
+
+        Returns:
+            dict[str, Any]: The statistics of the product reviews.
+        """
+        return self.get_many(np.array([position]))[0]
+
+
+def _sum_by_product(
+    values: np.ndarray, starts: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """Sum the values of the rows of each product."""
+    return _reduce_by_product(np.add, values.astype(np.int64), starts, counts)
+
+
+def _reduce_by_product(
+    ufunc: np.ufunc, values: np.ndarray, starts: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """Reduce the values of the rows of each product, 0 for products without rows.
+
+    `reduceat` gives the value at the start of an empty segment instead of the
+    identity, and fails if it starts past the last row, so only the segments of
+    products with rows are reduced, each ending at the start of the next one.
+    """
+    reduced = np.zeros(len(starts), dtype=values.dtype)
+    non_empty = counts > 0
+    if non_empty.any():
+        reduced[non_empty] = ufunc.reduceat(values, starts[non_empty])
+    return reduced
+
+
+def _histogram_medians(histograms: np.ndarray) -> np.ndarray:
+    """Get the median score of each product from its score histogram."""
+    cumulative = np.cumsum(histograms, axis=1)
+    counts = cumulative[:, -1:]
+    # Scores of the middle review, or the two middle reviews for even counts.
+    lower = SCORES[0] + (cumulative <= (counts - 1) // 2).sum(axis=1)
+    upper = SCORES[0] + (cumulative <= counts // 2).sum(axis=1)
+    return (lower + upper) / 2
@@ -0,0 +1,215 @@
+"""Food Review API review store snapshot files definitions."""
+
+import json
+import os
+import shutil
+from dataclasses import asdict
+from hashlib import blake2b
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Any
+
+import numpy as np
+
+from food_review_api.core.config.database import DatabaseConfig
+from food_review_api.products.sources import SourceState, prefix_digests
+from food_review_api.products.store import ReviewStore
+
+logger = getLogger(__name__)
+
+SNAPSHOT_SCHEMA_VERSION = 3
+MANIFEST_FILENAME = "manifest.json"
+INDEXES_DIRNAME = "indexes"
+
+
+def source_fingerprint(filename: str, max_rows: int | None = None) -> str:
+    """Get the fingerprint of a reviews source file.
+
+    The fingerprint changes whenever the size, modification time, or first or last
+    64 KiB of the file change, as well as when the snapshot schema version or the
+    number of ingested rows change. Only those two blocks are read,
+    so fingerprinting takes the same time whatever the size of the file, but
+    content edits confined to the middle of the file which keep both its size and
+    modification time are not detected.
+
+    Args:
+        filename: The path to the reviews CSV file.
+        max_rows: The maximum number of rows ingested from the file.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    stat = Path(filename).stat()
+    head_digest, tail_digest = prefix_digests(filename, stat.st_size)
+    key = ":".join(
+        [
+            str(SNAPSHOT_SCHEMA_VERSION),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            head_digest,
+            tail_digest,
+            str(max_rows),
+        ]
+    )
+    return blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def store_snapshot_path(db: DatabaseConfig) -> Path:
+    """Get the path of the store snapshot of a database.
+
+    Snapshots are directories next to the first source file, named after it and
+    the fingerprint of all the source files, e.g.
+    `data/.reviews_1.csv.<fingerprint>.snapshot`, or
+    `data/.reviews_1.csv+1.<fingerprint>.snapshot` with a second source file.
+
+    Args:
+        db: The configuration for the database containing the CSV files.
+
+    Returns:
+        Path: The snapshot directory path, which may not exist yet.
+    """
+    sources = db.sources
+    fingerprint = blake2b(digest_size=8)
+    for source in sources:
+        fingerprint.update(source_fingerprint(source, max_rows=db.max_rows).encode())
+    first_source = Path(sources[0])
+    name = first_source.name
+    if len(sources) > 1:
+        name = f"{name}+{len(sources) - 1}"
+    return first_source.with_name(f".{name}.{fingerprint.hexdigest()}.snapshot")
+
+
+def read_store_snapshot(path: Path) -> ReviewStore:
+    """Read a store snapshot, memory-mapping its arrays.
+
+    Args:
+        path: The snapshot directory path.
+
+    Returns:
+        ReviewStore: The store, backed by read-only memory-mapped arrays.
+    """
+    manifest = json.loads((path / MANIFEST_FILENAME).read_text())
+    arrays = {
+        name: np.load(path / f"{name}.npy", mmap_mode="r")
+        for name in manifest["arrays"]
+    }
+    return ReviewStore.from_arrays(arrays)
+
+
+def read_snapshot_sources(path: Path) -> tuple[SourceState, ...]:
+    """Read the ingested part of each CSV file of a store snapshot.
+
+    Args:
+        path: The snapshot directory path.
+
+    Returns:
+        tuple[SourceState, ...]: The ingested part of each CSV file, empty if
+        unknown.
+    """
+    manifest = json.loads((path / MANIFEST_FILENAME).read_text())
+    return tuple(SourceState(**source) for source in manifest.get("sources", []))
+
+
+def read_index_snapshot(path: Path, store: ReviewStore) -> dict[str, np.ndarray] | None:
+    """Read the index arrays of a store snapshot, memory-mapping them.
+
+    Args:
+        path: The snapshot directory path.
+        store: The store read from the snapshot.
+
+    Returns:
+        dict[str, np.ndarray] | None: The read-only memory-mapped arrays of the
+        indexes, see `ProductSnapshot.to_arrays`, or None if the snapshot has no
+        indexes of the store.
+    """
+    indexes_path = path / INDEXES_DIRNAME
+    try:
+        manifest = json.loads((indexes_path / MANIFEST_FILENAME).read_text())
+    except FileNotFoundError:
+        return None
+    if (manifest["review_count"], manifest["product_count"]) != (
+        store.review_count,
+        store.product_count,
+    ):
+        return None
+    return {
+        name: np.load(indexes_path / f"{name}.npy", mmap_mode="r")
+        for name in manifest["arrays"]
+    }
+
+
+def write_store_snapshot(
+    path: Path, store: ReviewStore, sources: tuple[SourceState, ...] = ()
+) -> None:
+    """Write a store snapshot, replacing stale snapshots of the same source.
+
+    The snapshot is written to a temporary directory renamed once complete, so an
+    existing snapshot directory is always complete.
+
+    Args:
+        path: The snapshot directory path.
+        store: The store to write.
+        sources: The ingested part of each CSV file of the store.
+    """
+    _write_arrays(
+        path,
+        store.to_arrays(),
+        {
+            "review_count": store.review_count,
+            "product_count": store.product_count,
+            "sources": [asdict(source) for source in sources],
+        },
+    )
+    source_name = path.name.rsplit(".", 2)[0]
+    for stale_path in path.parent.glob(f"{source_name}.*.snapshot"):
+        if stale_path != path:
+            shutil.rmtree(stale_path, ignore_errors=True)
+    logger.info("Wrote store snapshot to %s.", path)
+
+
+def write_index_snapshot(
+    path: Path, store: ReviewStore, arrays: dict[str, np.ndarray]
+) -> None:
+    """Write the index arrays of a store snapshot, next to the store arrays.
+
+    Args:
+        path: The snapshot directory path.
+        store: The store of the snapshot.
+        arrays: The arrays of the indexes of the store, see
+            `ProductSnapshot.to_arrays`.
+    """
+    _write_arrays(
+        path / INDEXES_DIRNAME,
+        arrays,
+        {"review_count": store.review_count, "product_count": store.product_count},
+    )
+    logger.info("Wrote index snapshot to %s.", path)
+
+
+def _write_arrays(
+    path: Path, arrays: dict[str, np.ndarray], manifest: dict[str, Any]
+) -> None:
+    """Write arrays and their manifest to a directory, unless it already exists.
+
+    The arrays are written to a temporary directory renamed once complete, so an
+    existing directory is always complete.
+    """
+    tmp_path = Path(mkdtemp(prefix=f"{path.name}.", dir=path.parent))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", array)
+        manifest = {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            **manifest,
+            "arrays": list(arrays),
+        }
+        (tmp_path / MANIFEST_FILENAME).write_text(json.dumps(manifest))
+        os.rename(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not path.exists():
+            raise
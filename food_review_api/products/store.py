@@ -0,0 +1,894 @@
+"""Food Review API columnar review store definition."""
+
+import zlib
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Sequence
+from threading import Lock
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from food_review_api.products.schemas import Review
+
+Rows = slice | np.ndarray
+
+NUMERIC_COLUMNS = {
+    "id": np.int64,
+    "helpfulness_numerator": np.int32,
+    "helpfulness_denominator": np.int32,
+    "score": np.int8,
+    "time": np.int64,
+}
+DICTIONARY_COLUMNS = ["user_id", "profile_name"]
+# Code of the missing values of dictionary columns, e.g. reviews without user.
+NULL_CODE = -1
+STRING_COLUMNS = ["summary", "text"]
+ZLIB_DICTIONARY_SIZE = 2**15
+
+
+class StringColumn:
+    """Immutable column of UTF-8 strings packed into a single byte buffer.
+
+    Strings are stored back to back in `data`, and the i-th string spans the bytes
+    `data[offsets[i]:offsets[i + 1]]`, the same layout as Arrow string arrays. This
+    avoids the overhead of one Python object per value.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray) -> None:
+        """Initialize column from its byte buffer and offsets arrays."""
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values: Iterable[str]) -> "StringColumn":
+        """Build a column by encoding the given strings."""
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(data=data, offsets=offsets)
+
+    @classmethod
+    def concat(cls, columns: Sequence["StringColumn"]) -> "StringColumn":
+        """Concatenate several columns into a new one."""
+        if not columns:
+            return cls.from_strings([])
+        bases = np.cumsum([0] + [len(column.data) for column in columns[:-1]])
+        offsets = np.concatenate(
+            [columns[0].offsets[:1]]
+            + [column.offsets[1:] + base for column, base in zip(columns, bases)]
+        )
+        data = np.concatenate([column.data for column in columns])
+        return cls(data=data, offsets=offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Get memory used by the column buffers."""
+        return self.data.nbytes + self.offsets.nbytes
+
+    def __len__(self) -> int:
+        """Get number of values in the column."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """Decode a single value of the column."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def tolist(self, rows: Rows | None = None) -> list[str]:
+        """Decode the values of the given rows, all of them if not provided."""
+        starts, ends = self.offsets[:-1], self.offsets[1:]
+        if rows is not None:
+            starts, ends = starts[rows], ends[rows]
+        buffer = memoryview(self.data)
+        return [
+            str(buffer[start:end], "utf-8")
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+
+    def take(self, indices: np.ndarray) -> "StringColumn":
+        """Build a new column with the values of the given rows, in that order."""
+        starts, ends = self.offsets[:-1][indices], self.offsets[1:][indices]
+        offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(ends - starts, out=offsets[1:])
+        buffer = memoryview(self.data)
+        data = b"".join(
+            buffer[start:end] for start, end in zip(starts.tolist(), ends.tolist())
+        )
+        return StringColumn(data=np.frombuffer(data, dtype=np.uint8), offsets=offsets)
+
+    def insert(self, indices: np.ndarray, values: "StringColumn") -> "StringColumn":
+        """Build a new column with values inserted before the given rows.
+
+        Like `np.insert`, the values are inserted in order, before the rows of
+        ascending `indices`. The buffer is copied in one piece per inserted value,
+        not per row.
+        """
+        lengths = np.insert(np.diff(self.offsets), indices, np.diff(values.offsets))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buffer, inserted = memoryview(self.data), memoryview(values.data)
+        pieces = []
+        start = int(self.offsets[0])
+        for cut, value_start, value_end in zip(
+            self.offsets[indices].tolist(),
+            values.offsets[:-1].tolist(),
+            values.offsets[1:].tolist(),
+        ):
+            pieces += [buffer[start:cut], inserted[value_start:value_end]]
+            start = cut
+        pieces.append(buffer[start : int(self.offsets[-1])])
+        data = np.frombuffer(b"".join(pieces), dtype=np.uint8)
+        return StringColumn(data=data, offsets=offsets)
+
+
+class CompressedStringColumn:
+    """Immutable column of UTF-8 strings packed into zlib compressed blocks.
+
+    Consecutive values are packed into blocks of about `block_size` bytes, which
+    are compressed with a preset dictionary sampled from the values, so that small
+    blocks still compress well. As store rows are sorted by product, the values of
+    a product span one or a few blocks. Blocks are only decompressed when their
+    values are read, and the most recently read blocks are kept decompressed in a
+    thread-safe LRU cache.
+
+    The rows `block_rows[j]:block_rows[j + 1]` are packed in the j-th block, which
+    spans the bytes `block_offsets[j]:block_offsets[j + 1]` of `data`, and
+    `block_sizes[j]` bytes once decompressed. Each value starts at byte
+    `starts[i]` of its decompressed block, and ends where the next value of the
+    block starts.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        block_offsets: np.ndarray,
+        block_rows: np.ndarray,
+        block_sizes: np.ndarray,
+        starts: np.ndarray,
+        zdict: bytes,
+        cache_blocks: int = 256,
+    ) -> None:
+        """Initialize column from its compressed blocks.
+
+        Args:
+            data: The compressed blocks, back to back.
+            block_offsets: The start byte of each block in `data`, followed by the
+                size of `data`.
+            block_rows: The first row of each block, followed by the row count.
+            block_sizes: The decompressed size of each block.
+            starts: The start byte of each value in its decompressed block.
+            zdict: The preset dictionary the blocks are compressed with.
+            cache_blocks: The maximum number of decompressed blocks kept in cache.
+        """
+        self.data = data
+        self.block_offsets = block_offsets
+        self.block_rows = block_rows
+        self.block_sizes = block_sizes
+        self.starts = starts
+        self.zdict = zdict
+        self.cache_blocks = cache_blocks
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.decompression_time = 0.0
+        self._cache: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    @classmethod
+    def compress(
+        cls,
+        column: StringColumn,
+        block_size: int = 2**14,
+        cache_blocks: int = 256,
+        level: int = 6,
+    ) -> "CompressedStringColumn":
+        """Build a column by compressing the values of a string column.
+
+        Args:
+            column: The string column to compress.
+            block_size: The number of bytes of values packed into each block. A
+                block holds at least one value, so it may be larger.
+            cache_blocks: The maximum number of decompressed blocks kept in cache.
+            level: The zlib compression level.
+
+        Returns:
+            CompressedStringColumn: The compressed column.
+        """
+        row_count = len(column)
+        offsets = np.asarray(column.offsets, dtype=np.int64)
+        splits = np.searchsorted(
+            offsets[:-1], np.arange(block_size, int(offsets[-1]), block_size)
+        )
+        block_rows = np.unique(np.concatenate([[0], splits, [row_count]]))
+        zdict = _sample_dictionary(column)
+        buffer = memoryview(column.data)
+        blocks = []
+        for start, stop in zip(
+            offsets[block_rows[:-1]].tolist(), offsets[block_rows[1:]].tolist()
+        ):
+            compressor = zlib.compressobj(level, zdict=zdict)
+            blocks.append(compressor.compress(buffer[start:stop]) + compressor.flush())
+        block_offsets = np.zeros(len(blocks) + 1, dtype=np.int64)
+        np.cumsum([len(block) for block in blocks], out=block_offsets[1:])
+        block_starts = offsets[block_rows]
+        starts = offsets[:-1] - np.repeat(block_starts[:-1], np.diff(block_rows))
+        return cls(
+            data=np.frombuffer(b"".join(blocks), dtype=np.uint8),
+            block_offsets=block_offsets,
+            block_rows=block_rows.astype(np.int64),
+            block_sizes=np.diff(block_starts),
+            starts=starts.astype(np.uint32),
+            zdict=zdict,
+            cache_blocks=cache_blocks,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Get memory used by the compressed column buffers, without the cache."""
+        return (
+            self.data.nbytes
+            + self.block_offsets.nbytes
+            + self.block_rows.nbytes
+            + self.block_sizes.nbytes
+            + self.starts.nbytes
+            + len(self.zdict)
+        )
+
+    @property
+    def cache_nbytes(self) -> int:
+        """Get memory used by the decompressed blocks in cache."""
+        with self._lock:
+            return sum(len(block) for block in self._cache.values())
+
+    def __len__(self) -> int:
+        """Get number of values in the column."""
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        """Decode a single value of the column."""
+        return self.tolist(np.array([index]))[0]
+
+    def tolist(self, rows: Rows | None = None) -> list[str]:
+        """Decode the values of the given rows, all of them if not provided.
+
+        Each block holding any of the rows is decompressed at most once.
+        """
+        if rows is None:
+            rows = slice(None)
+        if isinstance(rows, slice):
+            row_numbers = np.arange(*rows.indices(len(self)))
+        else:
+            row_numbers = np.asarray(rows)
+        blocks = np.searchsorted(self.block_rows, row_numbers, side="right") - 1
+        starts = self.starts[row_numbers]
+        next_rows = row_numbers + 1
+        ends = np.where(
+            next_rows < self.block_rows[blocks + 1],
+            self.starts[np.minimum(next_rows, len(self) - 1)],
+            self.block_sizes[blocks],
+        )
+        buffers: dict[int, memoryview] = {}
+        values = []
+        for block, start, end in zip(blocks.tolist(), starts.tolist(), ends.tolist()):
+            buffer = buffers.get(block)
+            if buffer is None:
+                buffer = buffers[block] = memoryview(self._block(block))
+            values.append(str(buffer[start:end], "utf-8"))
+        return values
+
+    def take(self, indices: np.ndarray) -> StringColumn:
+        """Build a new uncompressed column with the values of the given rows."""
+        return StringColumn.from_strings(self.tolist(indices))
+
+    def decompress(self) -> StringColumn:
+        """Build the uncompressed column, without going through the cache."""
+        data = b"".join(
+            self._decompress(block) for block in range(len(self.block_sizes))
+        )
+        block_starts = np.cumsum(self.block_sizes) - self.block_sizes
+        offsets = np.empty(len(self) + 1, dtype=np.int64)
+        offsets[:-1] = self.starts + np.repeat(block_starts, np.diff(self.block_rows))
+        offsets[-1] = len(data)
+        return StringColumn(data=np.frombuffer(data, dtype=np.uint8), offsets=offsets)
+
+    def _block(self, block: int) -> bytes:
+        """Get a decompressed block, from the cache if it was recently read."""
+        with self._lock:
+            data = self._cache.get(block)
+            if data is not None:
+                self._cache.move_to_end(block)
+                self.cache_hits += 1
+                return data
+        started = perf_counter()
+        data = self._decompress(block)
+        elapsed = perf_counter() - started
+        with self._lock:
+            self.cache_misses += 1
+            self.decompression_time += elapsed
+            self._cache[block] = data
+            while len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return data
+
+    def _decompress(self, block: int) -> bytes:
+        """Decompress a block."""
+        start, stop = self.block_offsets[block], self.block_offsets[block + 1]
+        decompressor = zlib.decompressobj(zdict=self.zdict)
+        return decompressor.decompress(memoryview(self.data)[start:stop])
+
+
+def _sample_dictionary(column: StringColumn) -> bytes:
+    """Sample values evenly spread over a column as a zlib preset dictionary.
+
+    The dictionary is kept small relative to the column, as it is stored with it.
+    """
+    max_size = min(ZLIB_DICTIONARY_SIZE, int(column.offsets[-1]) // 64)
+    sample = []
+    size = 0
+    step = max(len(column) // 1024, 1)
+    for value in column.tolist(slice(None, None, step)):
+        if size >= max_size:
+            break
+        encoded = value.encode("utf-8")
+        sample.append(encoded)
+        size += len(encoded) + 1
+    # zlib rejects empty preset dictionaries.
+    return b" ".join(sample)[-max_size:] or b" "
+
+
+class DictionaryColumn:
+    """Immutable dictionary-encoded string column.
+
+    Each row stores an integer code into a `StringColumn` of distinct values, which
+    is how repeated values such as user identifiers are kept compact. Missing values
+    have the `NULL_CODE` code, and are decoded as None.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: np.ndarray, values: StringColumn) -> None:
+        """Initialize column from its codes and distinct values."""
+        self.codes = codes
+        self.values = values
+
+    @property
+    def nbytes(self) -> int:
+        """Get memory used by the column buffers."""
+        return self.codes.nbytes + self.values.nbytes
+
+    def __len__(self) -> int:
+        """Get number of values in the column."""
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str | None:
+        """Decode a single value of the column."""
+        code = self.codes[index]
+        return None if code == NULL_CODE else self.values[code]
+
+    def tolist(self, rows: Rows | None = None) -> list[str | None]:
+        """Decode the values of the given rows, all of them if not provided."""
+        codes = self.codes if rows is None else self.codes[rows]
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        decoded: list[str | None] = self.values.tolist(unique_codes[unique_codes >= 0])
+        if len(unique_codes) and unique_codes[0] == NULL_CODE:
+            decoded.insert(0, None)
+        return [decoded[code] for code in inverse.tolist()]
+
+    def take(self, indices: np.ndarray) -> "DictionaryColumn":
+        """Build a new column with the values of the given rows, in that order."""
+        return DictionaryColumn(codes=self.codes[indices], values=self.values)
+
+
+Column = np.ndarray | StringColumn | CompressedStringColumn | DictionaryColumn
+
+
+def column_values(column: Column, rows: Rows) -> list:
+    """Get the values of the given rows of a column as Python objects."""
+    if isinstance(column, np.ndarray):
+        return column[rows].tolist()
+    return column.tolist(rows)
+
+
+class ReviewStore:
+    """Immutable columnar store of reviews, CSR-indexed by product.
+
+    Reviews are kept as one array per `Review` field, with rows sorted by product
+    and then by ascending time. The reviews of the product at position `i` of
+    `product_ids` are the rows `offsets[i]:offsets[i + 1]`, and `Review` objects are
+    only built for the rows a caller asks for.
+    """
+
+    def __init__(
+        self,
+        product_ids: StringColumn,
+        offsets: np.ndarray,
+        columns: dict[str, Column],
+    ) -> None:
+        """Initialize the store from its product index and review columns.
+
+        Args:
+            product_ids: The sorted product identifiers.
+            offsets: The start row of each product, followed by the row count.
+            columns: The review columns, keyed by `Review` field name.
+        """
+        self.product_ids = product_ids
+        self.offsets = offsets
+        self.columns = columns
+        self._index = {
+            product_id: position
+            for position, product_id in enumerate(product_ids.tolist())
+        }
+
+    @classmethod
+    def empty(cls) -> "ReviewStore":
+        """Build a store without reviews."""
+        return ReviewStoreBuilder().build()
+
+    @property
+    def product_count(self) -> int:
+        """Get product count."""
+        return len(self.product_ids)
+
+    @property
+    def review_count(self) -> int:
+        """Get reviews count."""
+        return int(self.offsets[-1])
+
+    @property
+    def review_counts(self) -> np.ndarray:
+        """Get number of reviews of each product, aligned with `product_ids`."""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Get memory used by the store buffers."""
+        return (
+            self.product_ids.nbytes
+            + self.offsets.nbytes
+            + sum(column.nbytes for column in self.columns.values())
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the store, keyed by a dotted name.
+
+        The arrays can be written to disk, and the store rebuilt from them with
+        `from_arrays`.
+        """
+        arrays = {
+            "product_ids.data": self.product_ids.data,
+            "product_ids.offsets": self.product_ids.offsets,
+            "offsets": self.offsets,
+        }
+        for name in NUMERIC_COLUMNS:
+            arrays[name] = self.columns[name]
+        for name in DICTIONARY_COLUMNS:
+            arrays[f"{name}.codes"] = self.columns[name].codes
+            arrays[f"{name}.values.data"] = self.columns[name].values.data
+            arrays[f"{name}.values.offsets"] = self.columns[name].values.offsets
+        for name in STRING_COLUMNS:
+            column = _uncompressed(self.columns[name])
+            arrays[f"{name}.data"] = column.data
+            arrays[f"{name}.offsets"] = column.offsets
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray]) -> "ReviewStore":
+        """Build a store from the arrays returned by `to_arrays`.
+
+        Arrays are used as they are, so memory-mapped arrays are not copied.
+        """
+        columns: dict[str, Column] = {name: arrays[name] for name in NUMERIC_COLUMNS}
+        for name in DICTIONARY_COLUMNS:
+            columns[name] = DictionaryColumn(
+                codes=arrays[f"{name}.codes"],
+                values=StringColumn(
+                    data=arrays[f"{name}.values.data"],
+                    offsets=arrays[f"{name}.values.offsets"],
+                ),
+            )
+        for name in STRING_COLUMNS:
+            columns[name] = StringColumn(
+                data=arrays[f"{name}.data"], offsets=arrays[f"{name}.offsets"]
+            )
+        return cls(
+            product_ids=StringColumn(
+                data=arrays["product_ids.data"], offsets=arrays["product_ids.offsets"]
+            ),
+            offsets=arrays["offsets"],
+            columns=columns,
+        )
+
+    def compress_text(
+        self, block_size: int = 2**14, cache_blocks: int = 256
+    ) -> "ReviewStore":
+        """Build a store with the same reviews, and compressed text columns.
+
+        The `summary` and `text` columns are packed into compressed blocks, see
+        `CompressedStringColumn`, the other columns are shared with this store.
+
+        Args:
+            block_size: The number of bytes of values packed into each block.
+            cache_blocks: The maximum number of decompressed blocks kept in cache
+                for each column.
+
+        Returns:
+            ReviewStore: The store with compressed text columns.
+        """
+        columns = dict(self.columns)
+        for name in STRING_COLUMNS:
+            columns[name] = CompressedStringColumn.compress(
+                _uncompressed(columns[name]),
+                block_size=block_size,
+                cache_blocks=cache_blocks,
+            )
+        return ReviewStore(
+            product_ids=self.product_ids, offsets=self.offsets, columns=columns
+        )
+
+    def merge(self, store: "ReviewStore") -> tuple["ReviewStore", np.ndarray]:
+        """Build a store with the reviews of this store and of another one.
+
+        The store is the one `ReviewStoreBuilder` would build from the reviews of
+        this store followed by those of the other one, e.g. appended to the same
+        CSV file, but the rows of this store are not sorted again: the rows of the
+        other store are inserted among them. Reviews of the other store with the
+        same `id` as a review of this store are dropped.
+
+        Args:
+            store: The store of the reviews to add.
+
+        Returns:
+            tuple[ReviewStore, np.ndarray]: The merged store, and its rows of the
+            added reviews, in ascending order.
+        """
+        kept = ~np.isin(store.columns["id"], self.columns["id"])
+        products = np.repeat(np.arange(store.product_count), store.review_counts)[kept]
+        counts = np.bincount(products, minlength=store.product_count)
+        positions = self.product_positions(store.product_ids.tolist())
+        added_products = np.flatnonzero((positions < 0) & (counts > 0))
+        product_inserts = np.searchsorted(
+            np.array(list(self._index), dtype=object),
+            np.array(store.product_ids.tolist(added_products), dtype=object),
+        )
+        # Positions in the merged store of the products of both stores.
+        old_positions = np.arange(self.product_count) + np.searchsorted(
+            product_inserts, np.arange(self.product_count), side="right"
+        )
+        positions[positions >= 0] = old_positions[positions[positions >= 0]]
+        positions[added_products] = product_inserts + np.arange(len(added_products))
+
+        row_positions = positions[products]
+        added_rows = _insertion_rows(
+            np.repeat(old_positions, self.review_counts),
+            np.asarray(self.columns["time"]),
+            row_positions,
+            store.columns["time"][kept],
+        )
+        counts = np.bincount(
+            np.concatenate([old_positions, row_positions]),
+            weights=np.concatenate(
+                [self.review_counts, np.ones(len(row_positions), dtype=np.int64)]
+            ),
+            minlength=self.product_count + len(added_products),
+        ).astype(np.int64)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # `np.insert` inserts values before the rows of this store.
+        indices = added_rows - np.arange(len(added_rows))
+        columns: dict[str, Column] = {}
+        for name in NUMERIC_COLUMNS:
+            columns[name] = np.insert(
+                np.asarray(self.columns[name]), indices, store.columns[name][kept]
+            )
+        for name in DICTIONARY_COLUMNS:
+            column, added = self.columns[name], store.columns[name]
+            codes = pd.Index(column.values.tolist()).get_indexer(added.values.tolist())
+            added_values = np.flatnonzero(codes < 0)
+            codes[added_values] = len(column.values) + np.arange(len(added_values))
+            # Null codes pick the last code, which is null.
+            codes = np.append(codes, NULL_CODE).astype(np.int32)
+            columns[name] = DictionaryColumn(
+                codes=np.insert(column.codes, indices, codes[added.codes[kept]]),
+                values=StringColumn.concat(
+                    [column.values, added.values.take(added_values)]
+                ),
+            )
+        for name in STRING_COLUMNS:
+            columns[name] = _uncompressed(self.columns[name]).insert(
+                indices, _uncompressed(store.columns[name]).take(np.flatnonzero(kept))
+            )
+        product_ids = self.product_ids.insert(
+            product_inserts, store.product_ids.take(added_products)
+        )
+        return (
+            ReviewStore(product_ids=product_ids, offsets=offsets, columns=columns),
+            added_rows,
+        )
+
+    def has_product(self, product_id: str) -> bool:
+        """Check if a product is in the store."""
+        return product_id in self._index
+
+    def product_position(self, product_id: str) -> int:
+        """Get the position of a product in `product_ids`.
+
+        Raises:
+            KeyError: If the product is not in the store.
+        """
+        return self._index[product_id]
+
+    def product_rows(self, product_id: str) -> slice:
+        """Get the rows of the reviews of a product.
+
+        Raises:
+            KeyError: If the product is not in the store.
+        """
+        position = self._index[product_id]
+        return slice(int(self.offsets[position]), int(self.offsets[position + 1]))
+
+    def time_range_rows(
+        self, rows: slice, since: int | None = None, until: int | None = None
+    ) -> slice:
+        """Narrow a range of rows sorted by time, e.g. of a product, to a time range.
+
+        Args:
+            rows: The range of rows, by ascending time.
+            since: The earliest review time to keep, inclusive, unbounded if None.
+            until: The latest review time to keep, inclusive, unbounded if None.
+
+        Returns:
+            slice: The rows of the range within the time range.
+        """
+        times = self.columns["time"][rows]
+        start, stop = 0, len(times)
+        if since is not None:
+            start = int(np.searchsorted(times, since, side="left"))
+        if until is not None:
+            stop = max(int(np.searchsorted(times, until, side="right")), start)
+        return slice(rows.start + start, rows.start + stop)
+
+    def product_positions(self, product_ids: Iterable[str]) -> np.ndarray:
+        """Get the positions of several products in `product_ids`.
+
+        Returns:
+            np.ndarray: The position of each product, -1 for products not in the
+            store.
+        """
+        return np.fromiter(
+            (self._index.get(product_id, -1) for product_id in product_ids),
+            dtype=np.int64,
+        )
+
+    def positions_rows(
+        self, positions: np.ndarray, limit: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the rows of the reviews of several products, concatenated.
+
+        Args:
+            positions: The positions of the products in `product_ids`.
+            limit: The maximum number of rows of each product, all if None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The rows of the reviews of the products,
+            in the order of the positions, and the number of rows of each product.
+        """
+        starts = self.offsets[positions]
+        stops = self.offsets[positions + 1]
+        if limit is not None:
+            stops = np.minimum(stops, starts + limit)
+        lengths = stops - starts
+        # Shift a single range by the start of each product block.
+        block_starts = np.cumsum(lengths) - lengths
+        rows = np.arange(lengths.sum()) + np.repeat(starts - block_starts, lengths)
+        return rows, lengths
+
+    def reviews(
+        self, rows: Rows, fields: Collection[str] | None = None
+    ) -> list[Review]:
+        """Build `Review` instances for the given rows.
+
+        When `fields` is set, only the columns of those fields are read, and the
+        reviews are built with only those fields set, so they are the only ones
+        serialized.
+
+        Args:
+            rows: A slice or an array of row numbers.
+            fields: The `Review` fields to set, all if None.
+
+        Returns:
+            list[Review]: The reviews, in the same order as the rows.
+        """
+        if isinstance(rows, slice):
+            row_numbers = np.arange(*rows.indices(self.review_count))
+        else:
+            row_numbers = rows
+        values = {}
+        if fields is None or "product_id" in fields:
+            positions = np.searchsorted(self.offsets, row_numbers, side="right") - 1
+            values["product_id"] = self.product_ids.tolist(positions)
+        for name, column in self.columns.items():
+            if fields is None or name in fields:
+                values[name] = column_values(column, rows)
+        if not values:
+            return [Review.model_construct() for _ in range(len(row_numbers))]
+        # The fields are set in declaration order, so they are serialized in it.
+        names = [name for name in Review.model_fields if name in values]
+        return [
+            Review.model_construct(**dict(zip(names, row)))
+            for row in zip(*(values[name] for name in names))
+        ]
+
+
+def _uncompressed(column: Column) -> StringColumn:
+    """Get a string column, decompressing it if compressed."""
+    if isinstance(column, CompressedStringColumn):
+        return column.decompress()
+    return column
+
+
+def _insertion_rows(
+    positions: np.ndarray,
+    times: np.ndarray,
+    added_positions: np.ndarray,
+    added_times: np.ndarray,
+) -> np.ndarray:
+    """Get the rows of reviews inserted among reviews sorted by product and time.
+
+    Both the reviews and the inserted reviews are sorted by product position and
+    time, and inserted reviews go after the reviews of the same product and time.
+    Both keys are packed into a single integer when they fit, so the rows are
+    found by binary search, otherwise all the reviews are sorted.
+
+    Returns:
+        np.ndarray: The row of each inserted review among all the reviews.
+    """
+    low = int(min(times.min(initial=0), added_times.min(initial=0)))
+    span = int(max(times.max(initial=0), added_times.max(initial=0))) - low + 1
+    position_count = int(max(positions.max(initial=0), added_positions.max(initial=0)))
+    if (position_count + 1) * span >= 2**63:
+        order = np.lexsort(
+            (
+                np.concatenate([times, added_times]),
+                np.concatenate([positions, added_positions]),
+            )
+        )
+        return np.flatnonzero(order >= len(times))
+    keys = positions * span + (times - low)
+    added_keys = added_positions * span + (added_times - low)
+    rows = np.searchsorted(keys, added_keys, side="right")
+    return rows + np.arange(len(rows))
+
+
+def _concat(arrays: list[np.ndarray], dtype: type) -> np.ndarray:
+    """Concatenate arrays, returning an empty array of `dtype` if there are none."""
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+
+class _Encoder:
+    """Incremental string to integer code encoder, coding missing values as null."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+
+    def encode(self, values: pd.Series) -> np.ndarray:
+        """Get the codes of the given values, assigning new ones as needed."""
+        codes, uniques = pd.factorize(values)
+        # Missing values have the -1 code, which picks the last, null, mapping.
+        mapping = np.full(len(uniques) + 1, NULL_CODE, dtype=np.int32)
+        mapping[:-1] = np.fromiter(
+            (self.codes.setdefault(value, len(self.codes)) for value in uniques),
+            dtype=np.int32,
+            count=len(uniques),
+        )
+        return mapping[codes]
+
+
+class ReviewStoreBuilder:
+    """Builder folding chunks of reviews into a `ReviewStore`.
+
+    Each chunk is converted into compact column arrays as soon as it is added, so
+    the source DataFrame can be released before the next chunk is parsed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize builder without reviews."""
+        self._products = _Encoder()
+        self._dictionaries = {name: _Encoder() for name in DICTIONARY_COLUMNS}
+        self._product_codes: list[np.ndarray] = []
+        self._chunks: dict[str, list] = {
+            name: []
+            for name in [*NUMERIC_COLUMNS, *DICTIONARY_COLUMNS, *STRING_COLUMNS]
+        }
+
+    def add_chunk(self, reviews: pd.DataFrame) -> None:
+        """Add a chunk of reviews to the builder.
+
+        Args:
+            reviews: The DataFrame of reviews, with `Review` fields as columns.
+        """
+        self._product_codes.append(self._products.encode(reviews["product_id"]))
+        for name, dtype in NUMERIC_COLUMNS.items():
+            self._chunks[name].append(reviews[name].to_numpy(dtype=dtype))
+        for name, encoder in self._dictionaries.items():
+            self._chunks[name].append(encoder.encode(reviews[name]))
+        for name in STRING_COLUMNS:
+            self._chunks[name].append(StringColumn.from_strings(reviews[name]))
+
+    def add_store(self, store: ReviewStore) -> None:
+        """Add the reviews of a store to the builder, e.g. one built in parallel.
+
+        Only the distinct product identifiers and dictionary values of the store
+        are re-encoded, the review columns are added as they are.
+
+        Args:
+            store: The review store to add.
+        """
+        products = self._products.encode(pd.Series(store.product_ids.tolist()))
+        self._product_codes.append(np.repeat(products, store.review_counts))
+        for name in NUMERIC_COLUMNS:
+            self._chunks[name].append(np.asarray(store.columns[name]))
+        for name, encoder in self._dictionaries.items():
+            column = store.columns[name]
+            values = encoder.encode(pd.Series([*column.values.tolist(), None]))
+            # Null codes pick the last value, which is missing.
+            self._chunks[name].append(values[column.codes])
+        for name in STRING_COLUMNS:
+            self._chunks[name].append(_uncompressed(store.columns[name]))
+
+    def build(self) -> ReviewStore:
+        """Build the store, sorting the added reviews by product and time.
+
+        Reviews of a product with the same time keep the order they were added in.
+        Reviews with the same `id` as a previously added review are dropped, and
+        so are the products left without reviews.
+        Columns are concatenated and reordered one at a time, releasing the chunks
+        as they are consumed to keep peak memory close to the final store size.
+        """
+        product_ids = np.array(list(self._products.codes), dtype=object)
+        order = np.argsort(product_ids, kind="stable")
+        ranks = np.empty(len(order), dtype=np.int32)
+        ranks[order] = np.arange(len(order), dtype=np.int32)
+        product_codes = ranks[_concat(self._product_codes, np.int32)]
+        ids = _concat(self._chunks["id"], NUMERIC_COLUMNS["id"])
+        times = _concat(self._chunks.pop("time"), NUMERIC_COLUMNS["time"])
+        _, first_rows = np.unique(ids, return_index=True)
+        if len(first_rows) < len(ids):
+            first_rows.sort()
+            permutation = first_rows[
+                np.lexsort((times[first_rows], product_codes[first_rows]))
+            ]
+            product_codes = product_codes[first_rows]
+        else:
+            permutation = np.lexsort((times, product_codes))
+        counts = np.bincount(product_codes, minlength=len(order))
+        product_ids = product_ids[order]
+        if not counts.all():
+            product_ids, counts = product_ids[counts > 0], counts[counts > 0]
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        columns: dict[str, Column] = {}
+        for name, dtype in NUMERIC_COLUMNS.items():
+            if name == "time":
+                columns[name] = times[permutation]
+            else:
+                columns[name] = _concat(self._chunks.pop(name), dtype)[permutation]
+        for name, encoder in self._dictionaries.items():
+            codes = _concat(self._chunks.pop(name), np.int32)
+            columns[name] = DictionaryColumn(
+                codes=codes[permutation],
+                values=StringColumn.from_strings(encoder.codes),
+            )
+        for name in STRING_COLUMNS:
+            columns[name] = StringColumn.concat(self._chunks.pop(name)).take(
+                permutation
+            )
+        return ReviewStore(
+            product_ids=StringColumn.from_strings(product_ids),
+            offsets=offsets,
+            columns=columns,
+        )
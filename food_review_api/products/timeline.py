@@ -0,0 +1,71 @@
+"""Food Review API reviews timeline index class definition."""
+
+import numpy as np
+
+from food_review_api.products.store import ReviewStore
+
+
+class ReviewTimeline:
+    """Index of all the reviews of a store by time, across products.
+
+    `rows` holds every store row by ascending time, and `times` the time of each of
+    them, so the reviews of a time range are a contiguous slice of `rows` found by
+    binary search.
+    """
+
+    def __init__(self, store: ReviewStore) -> None:
+        """Build the timeline of the reviews of a review store.
+
+        Args:
+            store: The loaded reviews store.
+        """
+        times = store.columns["time"]
+        self.rows = np.argsort(times, kind="stable")
+        self.times = np.asarray(times)[self.rows]
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Get the arrays backing the index, keyed by name."""
+        return {"rows": self.rows, "times": self.times}
+
+    @classmethod
+    def from_arrays(
+        cls, store: ReviewStore, arrays: dict[str, np.ndarray]
+    ) -> "ReviewTimeline":
+        """Build the timeline of a store from the arrays returned by `to_arrays`."""
+        timeline = cls.__new__(cls)
+        timeline.rows = arrays["rows"]
+        timeline.times = arrays["times"]
+        return timeline
+
+    @property
+    def nbytes(self) -> int:
+        """Get number of bytes of the index arrays."""
+        return self.rows.nbytes + self.times.nbytes
+
+    def latest(
+        self,
+        limit: int,
+        offset: int = 0,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> tuple[np.ndarray, int]:
+        """Get the latest reviews, optionally within a time range.
+
+        Args:
+            limit: The maximum number of reviews to return.
+            offset: The number of latest reviews to skip.
+            since: The earliest review time, inclusive, unbounded if None.
+            until: The latest review time, inclusive, unbounded if None.
+
+        Returns:
+            tuple[np.ndarray, int]: The store rows of the reviews, by descending
+            time, and the total number of reviews in the time range.
+        """
+        start, stop = 0, len(self.times)
+        if since is not None:
+            start = int(np.searchsorted(self.times, since, side="left"))
+        if until is not None:
+            stop = max(int(np.searchsorted(self.times, until, side="right")), start)
+        page_stop = max(stop - offset, start)
+        page_start = max(page_stop - limit, start)
+        return self.rows[page_start:page_stop][::-1], stop - start
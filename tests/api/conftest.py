@@ -6,6 +6,8 @@ from httpx import ASGITransport, AsyncClient
 from pytest import fixture
 
 from food_review_api.api import build_service_app
+from food_review_api.core.config import Configuration
+from food_review_api.products import product_repository
 
 
 @fixture
@@ -42,3 +44,15 @@ async def async_client(app):
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         yield client
+
+
+@fixture
+def loaded_product_repository(config: Configuration):
+    """Load the test reviews into the product repository singleton.
+
+    Yields:
+        ProductRepository: The loaded product repository, cleared on teardown.
+    """
+    product_repository.load(config.database)
+    yield product_repository
+    product_repository.clear()
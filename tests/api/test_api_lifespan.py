@@ -6,6 +6,7 @@ import pytest
 from pytest import fixture
 
 from food_review_api.api import lifespan as lifespan_module
+from food_review_api.products import LoadPhase, product_repository
 
 
 @fixture(autouse=True)
@@ -52,3 +53,15 @@ async def test_lifespan_shutdown_event_called(app, mock_shutdown_event):
         async with lifespan_module.lifespan(app):
             pass
         mock_shutdown_event.assert_called_once()
+
+
+def test_load_reviews_in_background(config):
+    """Verify that reviews loaded in the background are published once loaded."""
+    try:
+        future = lifespan_module.load_reviews_in_background(config)
+        snapshot = future.result(timeout=30)
+        assert product_repository.snapshot is snapshot
+        assert snapshot.metadata == config.database
+        assert product_repository.progress.phase == LoadPhase.READY
+    finally:
+        product_repository.clear()
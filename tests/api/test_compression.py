@@ -0,0 +1,180 @@
+"""Test Food Review API response compression definition."""
+
+import gzip
+import threading
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from food_review_api.api.cache import response_cache
+from food_review_api.api.compression import (
+    GZIP,
+    CompressionMiddleware,
+    compress,
+    compress_off_loop,
+    negotiate_encoding,
+    precompress,
+)
+from food_review_api.core.config import CompressionConfig
+
+PRODUCT_ID = "B001LG945O"
+LARGE_PAYLOAD = {"reviews": ["A tasty snack, would buy again."] * 100}
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encodings, expected",
+    [
+        (None, ("br", "gzip"), None),
+        ("gzip, deflate", ("br", "gzip"), "gzip"),
+        ("gzip, br", ("br", "gzip"), "br"),
+        ("gzip;q=1.0, br;q=0.5", ("br", "gzip"), "gzip"),
+        ("br", ("gzip",), None),
+        ("*", ("br", "gzip"), "br"),
+        ("gzip;q=0", ("gzip",), None),
+        ("*;q=0.1, gzip;q=0", ("gzip",), None),
+        ("identity", ("gzip",), None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, encodings, expected):
+    """Verify that the accepted encoding with the highest quality is chosen."""
+    assert negotiate_encoding(accept_encoding, encodings) == expected
+
+
+@pytest.mark.asyncio
+async def test_precompress_skips_small_bodies():
+    """Verify that only bodies of at least the minimum size are compressed."""
+    config = CompressionConfig(minimum_size=100)
+    assert await precompress(b"x" * 99, GZIP, config) is None
+    disabled = config.model_copy(update={"enabled": False})
+    assert await precompress(b"x" * 1000, GZIP, disabled) is None
+    compressed = await precompress(b"x" * 1000, GZIP, config)
+    assert gzip.decompress(compressed) == b"x" * 1000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size, offloaded", [(1000, False), (100_000, True)])
+async def test_large_bodies_are_compressed_in_a_thread(size, offloaded):
+    """Verify that only bodies of at least `offload_size` leave the event loop."""
+    threads = []
+
+    def compress_recording_thread(body, encoding, level):
+        threads.append(threading.get_ident())
+        return compress(body, encoding, level)
+
+    config = CompressionConfig(offload_size=10_000)
+    with patch("food_review_api.api.compression.compress", compress_recording_thread):
+        compressed = await compress_off_loop(b"x" * size, GZIP, 1, config)
+    assert gzip.decompress(compressed) == b"x" * size
+    assert (threads != [threading.get_ident()]) is offloaded
+
+
+def build_app(config: CompressionConfig) -> CompressionMiddleware:
+    """Return an app serving a large JSON and a small text response, compressed."""
+    app = Starlette(
+        routes=[
+            Route("/json", lambda request: JSONResponse(LARGE_PAYLOAD)),
+            Route("/text", lambda request: PlainTextResponse("short")),
+            Route(
+                "/encoded",
+                lambda request: JSONResponse(
+                    LARGE_PAYLOAD, headers={"content-encoding": "identity"}
+                ),
+            ),
+        ]
+    )
+    return CompressionMiddleware(app, config=config)
+
+
+async def get(app, path: str, accept_encoding: str = "gzip"):
+    """Send a request to an app, returning the response."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get(path, headers={"accept-encoding": accept_encoding})
+
+
+@pytest.mark.asyncio
+async def test_middleware_compresses_accepted_responses():
+    """Verify that large JSON responses are compressed when accepted."""
+    app = build_app(CompressionConfig())
+    response = await get(app, "/json")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE_PAYLOAD
+
+    response = await get(app, "/json", accept_encoding="identity")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == LARGE_PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_middleware_skips_small_large_and_encoded_responses():
+    """Verify that responses outside the size limits, or encoded, are unchanged."""
+    app = build_app(CompressionConfig(max_dynamic_size=1000))
+    assert "content-encoding" not in (await get(app, "/text")).headers
+    assert "content-encoding" not in (await get(app, "/json")).headers
+    response = await get(app, "/encoded")
+    assert response.headers["content-encoding"] == "identity"
+    assert "vary" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_served_precompressed(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test cached reviews are compressed once, and served compressed."""
+    params = {"product_id": PRODUCT_ID}
+    headers = {"accept-encoding": "gzip"}
+    first = await async_client.get("/api/v1/reviews", params=params, headers=headers)
+    second = await async_client.get("/api/v1/reviews", params=params, headers=headers)
+    assert second.status_code == HTTPStatus.OK
+    assert second.headers["content-encoding"] == "gzip"
+    assert second.headers["vary"] == "Accept-Encoding"
+    assert second.json() == first.json()
+    cached = await response_cache.get(
+        loaded_product_repository.snapshot,
+        ("reviews", PRODUCT_ID, 0, None, None, None, "time", None, None, None),
+        lambda: pytest.fail("response not cached"),
+    )
+    assert int(second.headers["content-length"]) == len(cached.encodings[GZIP])
+    assert gzip.decompress(cached.encodings[GZIP]) == cached.body
+    assert second.headers["etag"] == cached.etag.removesuffix('"') + '-gzip"'
+
+    identity = await async_client.get(
+        "/api/v1/reviews", params=params, headers={"accept-encoding": "identity"}
+    )
+    assert "content-encoding" not in identity.headers
+    assert identity.json() == first.json()
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_have_an_etag_per_encoding(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test cached reviews vary with the encoding, and have an ETag per encoding."""
+    params = {"product_id": PRODUCT_ID}
+    identity = await async_client.get(
+        "/api/v1/reviews", params=params, headers={"accept-encoding": "identity"}
+    )
+    compressed = await async_client.get(
+        "/api/v1/reviews", params=params, headers={"accept-encoding": "gzip"}
+    )
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == compressed.headers["vary"] == "Accept-Encoding"
+    assert identity.headers["etag"] != compressed.headers["etag"]
+
+    response = await async_client.get(
+        "/api/v1/reviews",
+        params=params,
+        headers={"accept-encoding": "gzip", "if-none-match": identity.headers["etag"]},
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == compressed.headers["etag"]
+    assert response.headers["vary"] == "Accept-Encoding"
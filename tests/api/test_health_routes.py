@@ -11,3 +11,28 @@ async def test_health_route_returns_healthy_string(async_client: AsyncClient):
     """Test `/health` endpoint."""
     response = await async_client.get("/health")
     assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_ready_route_reports_progress_until_loaded(async_client: AsyncClient):
+    """Test `/ready` endpoint before the products are loaded."""
+    response = await async_client.get("/ready")
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    body = response.json()
+    assert body["ready"] is False
+    assert body["reviews"] == 0
+    assert {"phase", "rows_parsed", "total_bytes", "eta_seconds"} <= body.keys()
+
+
+@pytest.mark.asyncio
+async def test_ready_route_returns_ok_once_loaded(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/ready` endpoint once the products are loaded."""
+    response = await async_client.get("/ready")
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["ready"] is True
+    assert body["phase"] == "ready"
+    assert body["reviews"] == loaded_product_repository.review_count
+    assert body["rows_parsed"] == loaded_product_repository.review_count
@@ -0,0 +1,112 @@
+"""Test Food Review API metrics middleware and router definition."""
+
+import os
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+from food_review_api.core.metrics import metrics_registry
+from food_review_api.products import product_repository
+
+PRODUCT_ID = "B001LG945O"
+WORKER = f'worker="{os.getpid()}"'
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics_registry():
+    """Clear the metrics registry singleton around each test."""
+    metrics_registry.clear()
+    yield
+    metrics_registry.clear()
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_exposes_request_metrics_by_route(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/metrics` labels requests with their full route path template."""
+    await async_client.get(f"/api/v1/products/{PRODUCT_ID}/stats")
+    await async_client.get("/api/v1/products/unknown/stats")
+    await async_client.get("/unknown")
+    response = await async_client.get("/metrics")
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    route = f'{WORKER},method="GET",route="/api/v1/products/{{product_id}}/stats"'
+    assert f'food_review_api_http_requests_total{{{route},status="200"}} 1' in lines
+    assert f'food_review_api_http_requests_total{{{route},status="404"}} 1' in lines
+    assert (
+        f'food_review_api_http_requests_total{{{WORKER},method="GET",'
+        'route="unmatched",status="404"} 1'
+    ) in lines
+    assert f"food_review_api_http_request_duration_seconds_count{{{route}}} 2" in lines
+    # The metrics request itself is in flight while they are rendered.
+    assert f"food_review_api_http_requests_in_flight{{{WORKER}}} 1" in lines
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_labels_routes_with_empty_path(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/metrics` labels routes declared with an empty path by their prefix."""
+    await async_client.get("/api/v1/reviews", params={"product_id": PRODUCT_ID})
+    await async_client.get("/api/v1/search", params={"q": "coffee"})
+    lines = (await async_client.get("/metrics")).text.splitlines()
+    for path in ["/api/v1/reviews", "/api/v1/search"]:
+        assert (
+            f'food_review_api_http_requests_total{{{WORKER},method="GET",'
+            f'route="{path}",status="200"}} 1'
+        ) in lines
+    assert not any('route=""' in line for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_exposes_repository_gauges(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/metrics` describes the loaded products snapshot."""
+    response = await async_client.get("/metrics")
+    lines = response.text.splitlines()
+    snapshot = loaded_product_repository.snapshot
+    assert f"food_review_api_reviews{{{WORKER}}} {snapshot.store.review_count}" in lines
+    assert (
+        f"food_review_api_products{{{WORKER}}} {snapshot.store.product_count}" in lines
+    )
+    assert (
+        f"food_review_api_snapshot_generation{{{WORKER}}} {snapshot.generation}"
+        in lines
+    )
+    assert f"food_review_api_store_bytes{{{WORKER}}} {snapshot.store.nbytes}" in lines
+    assert loaded_product_repository.last_load_duration > 0
+    assert any(
+        line.startswith(f"food_review_api_last_load_duration_seconds{{{WORKER}}} ")
+        for line in lines
+    )
+    assert not any(line.startswith("food_review_api_text_") for line in lines)
+    assert "# TYPE food_review_api_response_cache_hits_total counter" in lines
+    assert any(
+        line.startswith(f"food_review_api_response_cache_misses_total{{{WORKER}}} ")
+        for line in lines
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_exposes_text_decompression_counters(
+    async_client: AsyncClient, config
+):
+    """Test `/metrics` describes the decompression of compressed review texts."""
+    db = config.database.model_copy(update={"text_compression": True})
+    store = product_repository.load(db).store
+    try:
+        await async_client.get("/api/v1/reviews", params={"product_id": PRODUCT_ID})
+        response = await async_client.get("/metrics")
+    finally:
+        product_repository.clear()
+    lines = response.text.splitlines()
+    misses = store.columns["summary"].cache_misses + store.columns["text"].cache_misses
+    assert misses > 0
+    assert (
+        f"food_review_api_text_block_cache_misses_total{{{WORKER}}} {misses}" in lines
+    )
+    assert "# TYPE food_review_api_text_decompression_seconds_total counter" in lines
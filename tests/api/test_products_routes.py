@@ -0,0 +1,171 @@
+"""Test Food Review API products router definition."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_products_route_lists_products(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products` returns every loaded product."""
+    response = await async_client.get("/api/v1/products")
+    assert response.status_code == HTTPStatus.OK
+    assert (
+        response.json()["available_products"]
+        == loaded_product_repository.available_products
+    )
+
+
+@pytest.mark.asyncio
+async def test_most_reviewed_route_returns_top_tiers(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/most_reviewed` returns products of the top `n` counts."""
+    response = await async_client.get("/api/v1/products/most_reviewed", params={"n": 2})
+    assert response.status_code == HTTPStatus.OK
+    counts = [product["number_of_reviews"] for product in response.json()]
+    assert sorted(set(counts), reverse=True) == [6, 4]
+    assert counts == sorted(counts, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_least_reviewed_route_returns_bottom_tiers(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/least_reviewed` returns products of the bottom counts."""
+    response = await async_client.get(
+        "/api/v1/products/least_reviewed", params={"n": 1}
+    )
+    assert response.status_code == HTTPStatus.OK
+    counts = {product["number_of_reviews"] for product in response.json()}
+    assert counts == {1}
+
+
+@pytest.mark.asyncio
+async def test_reload_route_reports_snapshot_generation(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/reload` keeps the snapshot of unchanged files."""
+    snapshot = loaded_product_repository.snapshot
+    response = await async_client.get("/api/v1/products/reload")
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["products"]["filename"] == "data/reviews_1.csv"
+    assert body["generation"] == snapshot.generation
+
+    reloaded = loaded_product_repository.reload(snapshot.metadata).result(timeout=10)
+    assert reloaded is snapshot
+    assert loaded_product_repository.snapshot is snapshot
+
+
+@pytest.mark.asyncio
+async def test_reload_route_is_disabled_with_several_workers(
+    app, async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/reload` is rejected when served by several workers."""
+    generation = loaded_product_repository.generation
+    app.state.workers = 2
+    response = await async_client.get("/api/v1/products/reload")
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert not loaded_product_repository.is_reloading
+    assert loaded_product_repository.generation == generation
+
+
+@pytest.mark.asyncio
+async def test_rankings_are_serialized_once_per_generation(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test rankings are memoized in the snapshot, for equivalent values of `n`."""
+    snapshot = loaded_product_repository.snapshot
+    tier_count = snapshot.ranking.tier_count
+    first = await async_client.get("/api/v1/products/most_reviewed", params={"n": 500})
+    second = await async_client.get(
+        "/api/v1/products/most_reviewed", params={"n": tier_count}
+    )
+    assert first.content == second.content
+    assert list(snapshot._memo) == [("most_reviewed", tier_count)]
+    assert len(first.json()) == loaded_product_repository.product_count
+
+
+@pytest.mark.asyncio
+async def test_product_stats_route_returns_review_statistics(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/{product_id}/stats` matches the product reviews."""
+    reviews = loaded_product_repository.get("B001LG945O").reviews
+    response = await async_client.get("/api/v1/products/B001LG945O/stats")
+    assert response.status_code == HTTPStatus.OK
+    assert "etag" in response.headers
+    stats = response.json()
+    scores = [review.score for review in reviews]
+    assert stats["number_of_reviews"] == len(reviews)
+    assert stats["mean_score"] == pytest.approx(sum(scores) / len(scores))
+    assert stats["score_histogram"] == [scores.count(score) for score in range(1, 6)]
+    assert stats["last_review_time"] == max(review.time for review in reviews)
+
+
+@pytest.mark.asyncio
+async def test_product_stats_route_unknown_product(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/{product_id}/stats` returns 404 for unknown products."""
+    response = await async_client.get("/api/v1/products/unknown/stats")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_products_batch_route_returns_reviews(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/batch` returns the reviews of each product in order."""
+    product_ids = loaded_product_repository.available_products[:20][::-1]
+    response = await async_client.post(
+        "/api/v1/products/batch",
+        json={"product_ids": product_ids + ["unknown"], "limit": 2},
+    )
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["missing_product_ids"] == ["unknown"]
+    assert [product["product_id"] for product in body["products"]] == product_ids
+    for product in body["products"]:
+        reviews = loaded_product_repository.get(product["product_id"]).reviews
+        assert product["number_of_reviews"] == len(reviews)
+        assert [review["id"] for review in product["reviews"]] == [
+            review.id for review in reviews[:2]
+        ]
+        assert "stats" not in product
+
+
+@pytest.mark.asyncio
+async def test_products_batch_route_returns_stats(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/batch` stats match the single product stats route."""
+    product_ids = ["B001LG945O", "unknown", "B004391DK0"]
+    response = await async_client.post(
+        "/api/v1/products/batch", json={"product_ids": product_ids, "include": "stats"}
+    )
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["missing_product_ids"] == ["unknown"]
+    for product in body["products"]:
+        single = await async_client.get(
+            f"/api/v1/products/{product['product_id']}/stats"
+        )
+        assert product["stats"] == single.json()
+        assert "reviews" not in product
+
+
+@pytest.mark.asyncio
+async def test_products_batch_route_rejects_oversized_batches(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/products/batch` rejects empty and too large batches."""
+    for product_ids in ([], [f"product{i}" for i in range(501)]):
+        response = await async_client.post(
+            "/api/v1/products/batch", json={"product_ids": product_ids}
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
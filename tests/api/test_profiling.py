@@ -0,0 +1,128 @@
+"""Test Food Review API request profiling middleware definition."""
+
+import pstats
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest import fixture
+
+from food_review_api.api.middelwares import add_middlewares
+from food_review_api.api.profiling import ProfilingMiddleware, profile_filename
+from food_review_api.core.config import ProfilingConfig
+
+
+def slow_sum(count: int) -> int:
+    """Return the sum of the first integers, slowly."""
+    return sum(range(count))
+
+
+@fixture
+def profiles_dir(tmp_path):
+    """Return the path to a profiles directory in a temporary directory."""
+    return tmp_path / "profiles"
+
+
+def profiling_app(config: ProfilingConfig) -> FastAPI:
+    """Return an app with profiling middleware and a route calling `slow_sum`."""
+    app = FastAPI()
+
+    @app.get("/sum/{count}")
+    async def get_sum(count: int):
+        return {"sum": slow_sum(count)}
+
+    app.add_middleware(ProfilingMiddleware, config=config)
+    return app
+
+
+def test_profiling_middleware_saves_profile_of_requests_with_header(profiles_dir):
+    """Verify that requests with the header are profiled to a named file."""
+    config = ProfilingConfig(enabled=True, secret="s3cret", directory=str(profiles_dir))
+    client = TestClient(profiling_app(config))
+    response = client.get("/sum/1000", headers={"X-Profile": "s3cret"})
+    assert response.json() == {"sum": 499500}
+    filename = response.headers["x-profile-file"]
+    assert filename.endswith("-GET-sum_1000.prof")
+
+    stats = pstats.Stats(str(profiles_dir / filename))
+    assert any(function == "slow_sum" for _, _, function in stats.stats)
+
+    response = client.get("/sum/10")
+    assert "x-profile-file" not in response.headers
+    response = client.get("/sum/10", headers={"X-Profile": "guess"})
+    assert "x-profile-file" not in response.headers
+    assert len(list(profiles_dir.iterdir())) == 1
+
+
+def test_profiling_middleware_ignores_header_without_secret(profiles_dir):
+    """Verify that the header does not profile requests when no secret is set."""
+    config = ProfilingConfig(enabled=True, directory=str(profiles_dir))
+    client = TestClient(profiling_app(config))
+    response = client.get("/sum/10", headers={"X-Profile": "inline:"})
+    assert response.json() == {"sum": 45}
+    assert not profiles_dir.exists()
+
+
+def test_profiling_middleware_keeps_newest_profiles(profiles_dir):
+    """Verify that the oldest profile files are removed beyond `max_files`."""
+    config = ProfilingConfig(
+        enabled=True, secret="s3cret", directory=str(profiles_dir), max_files=2
+    )
+    client = TestClient(profiling_app(config))
+    filenames = [
+        client.get(f"/sum/{count}", headers={"X-Profile": "s3cret"}).headers[
+            "x-profile-file"
+        ]
+        for count in range(3)
+    ]
+    assert sorted(path.name for path in profiles_dir.iterdir()) == filenames[1:]
+
+
+def test_profiling_middleware_returns_inline_profile(profiles_dir):
+    """Verify that an inline profile replaces the response."""
+    config = ProfilingConfig(
+        enabled=True, secret="s3cret", directory=str(profiles_dir), limit=5
+    )
+    client = TestClient(profiling_app(config))
+    response = client.get("/sum/x", headers={"X-Profile": "inline:s3cret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["x-profiled-status"] == "422"
+    assert "function calls" in response.text
+    assert not profiles_dir.exists()
+
+
+def test_profiling_middleware_samples_requests(profiles_dir):
+    """Verify that sampled requests are profiled, and the header can be ignored."""
+    config = ProfilingConfig(
+        enabled=True, directory=str(profiles_dir), header=None, sample_rate=0.5
+    )
+    client = TestClient(profiling_app(config))
+    with patch("food_review_api.api.profiling.random.random", side_effect=[0.7, 0.2]):
+        first = client.get("/sum/1", headers={"X-Profile": "inline:s3cret"})
+        second = client.get("/sum/2")
+    assert first.json() == {"sum": 0}
+    assert "x-profile-file" not in first.headers
+    assert second.headers["x-profile-file"].endswith("-GET-sum_2.prof")
+
+
+def test_profile_filename_is_safe():
+    """Verify that profile file names only hold safe characters."""
+    filename = profile_filename({"method": "GET", "path": "/a/../b c"})
+    assert filename.endswith("-GET-a_.._b_c.prof")
+    assert "/" not in filename
+    assert profile_filename({"method": "GET", "path": "/"}).endswith("-GET-root.prof")
+
+
+def test_profiling_middleware_is_opt_in(config, profiles_dir):
+    """Verify that the middleware is only added when profiling is enabled."""
+    app = FastAPI()
+    add_middlewares(app, config)
+    assert ProfilingMiddleware not in [
+        middleware.cls for middleware in app.user_middleware
+    ]
+
+    profiling = ProfilingConfig(enabled=True, directory=str(profiles_dir))
+    app = FastAPI()
+    add_middlewares(app, config.model_copy(update={"profiling": profiling}))
+    assert ProfilingMiddleware in [middleware.cls for middleware in app.user_middleware]
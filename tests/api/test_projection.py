@@ -0,0 +1,31 @@
+"""Test Food Review API review field projection functions definitions."""
+
+from pytest import raises
+
+from food_review_api.api.projection import (
+    REVIEW_FIELDS,
+    InvalidFieldsError,
+    parse_fields,
+)
+
+
+def test_parse_fields_orders_and_deduplicates_fields():
+    """Verify that projections are normalized to `Review` field order."""
+    assert parse_fields(["summary, score", "time,score"]) == (
+        "score",
+        "time",
+        "summary",
+    )
+
+
+def test_parse_fields_returns_none_for_all_fields():
+    """Verify that no projection is made when no or all fields are requested."""
+    assert parse_fields([]) is None
+    assert parse_fields([""]) is None
+    assert parse_fields([",".join(REVIEW_FIELDS)]) is None
+
+
+def test_parse_fields_rejects_unknown_fields():
+    """Verify that unknown field names raise an error naming them."""
+    with raises(InvalidFieldsError, match="body"):
+        parse_fields(["score,body"])
@@ -0,0 +1,86 @@
+"""Test Food Review API traffic recording middleware definition."""
+
+import json
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest import fixture
+
+from food_review_api.api.middelwares import add_middlewares
+from food_review_api.api.recording import MAX_RECORDED_BODY_BYTES, RecordingMiddleware
+from food_review_api.core.config import RecordingConfig
+
+
+@fixture
+def recording_file(tmp_path):
+    """Return the path to a recording file in a temporary directory."""
+    return tmp_path / "recordings" / "requests.jsonl"
+
+
+def recording_app(config: RecordingConfig) -> FastAPI:
+    """Return an app with recording middleware and an item and an echo route."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/echo")
+    def echo(payload: dict):
+        return payload
+
+    app.add_middleware(RecordingMiddleware, config=config)
+    return app
+
+
+def read_lines(filename) -> list[dict]:
+    """Return the records of a JSON lines file."""
+    return [json.loads(line) for line in filename.read_text().splitlines()]
+
+
+def test_recording_middleware_records_requests(recording_file):
+    """Verify that requests are appended as JSON lines, with their status."""
+    config = RecordingConfig(enabled=True, filename=str(recording_file))
+    client = TestClient(recording_app(config))
+    client.get("/items/3", params={"q": "a b"})
+    client.get("/items/x")
+    client.post("/echo", json={"key": "value"})
+    client.post("/echo", content=b"x" * (MAX_RECORDED_BODY_BYTES + 1))
+
+    records = read_lines(recording_file)
+    assert [record["status"] for record in records] == [200, 422, 200, 422]
+    assert records[0]["method"] == "GET"
+    assert records[0]["path"] == "/items/3"
+    assert records[0]["query"] == "q=a+b"
+    assert records[0]["body"] is None
+    assert records[0]["duration_ms"] > 0
+    assert records[2]["body"] == '{"key":"value"}'
+    assert records[3]["body"] is None
+    assert records[0]["timestamp"] <= records[1]["timestamp"]
+
+
+def test_recording_middleware_samples_requests(recording_file):
+    """Verify that only requests drawn below the sample rate are recorded."""
+    config = RecordingConfig(
+        enabled=True, filename=str(recording_file), sample_rate=0.5
+    )
+    client = TestClient(recording_app(config))
+    with patch("food_review_api.api.recording.random.random", side_effect=[0.7, 0.2]):
+        client.get("/items/1")
+        client.get("/items/2")
+    assert [record["path"] for record in read_lines(recording_file)] == ["/items/2"]
+
+
+def test_recording_middleware_is_opt_in(config, recording_file):
+    """Verify that the middleware is only added when recording is enabled."""
+    app = FastAPI()
+    add_middlewares(app, config)
+    assert RecordingMiddleware not in [
+        middleware.cls for middleware in app.user_middleware
+    ]
+
+    recording = RecordingConfig(enabled=True, filename=str(recording_file))
+    app = FastAPI()
+    add_middlewares(app, config.model_copy(update={"recording": recording}))
+    assert RecordingMiddleware in [middleware.cls for middleware in app.user_middleware]
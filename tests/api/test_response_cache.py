@@ -0,0 +1,138 @@
+"""Test Food Review API serialized responses cache definition."""
+
+import gzip
+from unittest.mock import MagicMock
+
+import pytest
+from pytest import fixture
+
+from food_review_api.api.cache import ResponseCache
+from food_review_api.core.config import (
+    CompressionConfig,
+    DatabaseConfig,
+    ResponseCacheConfig,
+)
+from food_review_api.products import ProductSnapshot
+
+
+def snapshot(generation: int) -> ProductSnapshot:
+    """Return an empty snapshot of the given generation."""
+    return ProductSnapshot.build(
+        ProductSnapshot.empty().store,
+        metadata=DatabaseConfig(filename="test_file.csv", version="7"),
+        generation=generation,
+    )
+
+
+@fixture
+def cache():
+    """Return a response cache holding at most 180 bytes."""
+    return ResponseCache(ResponseCacheConfig(max_bytes=180))
+
+
+@pytest.mark.asyncio
+async def test_cache_renders_once(cache: ResponseCache):
+    """Verify that a cached response is only rendered on the first request."""
+    render = MagicMock(return_value=b"body")
+    first = await cache.get(snapshot(1), "key", render)
+    second = await cache.get(snapshot(1), "key", render)
+    assert first is second
+    assert render.call_count == 1
+    assert first.etag.startswith('"7-')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_drops_previous_generation(cache: ResponseCache):
+    """Verify that responses of a previous snapshot generation are not served."""
+    await cache.get(snapshot(1), "key", lambda: b"old")
+    cached = await cache.get(snapshot(2), "key", lambda: b"new")
+    assert cached.body == b"new"
+    assert (await cache.get(snapshot(2), "key", lambda: b"other")).body == b"new"
+
+
+@pytest.mark.asyncio
+async def test_cache_ignores_responses_of_older_generations(cache: ResponseCache):
+    """Verify that a response of an older generation does not evict newer ones."""
+    await cache.get(snapshot(2), "key", lambda: b"new")
+    assert (await cache.get(snapshot(1), "key", lambda: b"old")).body == b"old"
+    assert (await cache.get(snapshot(2), "key", lambda: b"other")).body == b"new"
+    assert (await cache.get(snapshot(1), "key", lambda: b"again")).body == b"again"
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_within_byte_budget(
+    cache: ResponseCache,
+):
+    """Verify that the cache evicts least recently used responses over budget."""
+    current = snapshot(1)
+    await cache.get(current, "a", lambda: b"a" * 30)
+    await cache.get(current, "b", lambda: b"b" * 30)
+    await cache.get(current, "a", lambda: b"unused")
+    await cache.get(current, "c", lambda: b"c" * 30)
+    assert cache.nbytes <= 180
+    assert (await cache.get(current, "a", lambda: b"miss")).body == b"a" * 30
+    assert (await cache.get(current, "b", lambda: b"miss")).body == b"miss"
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_renders():
+    """Verify that a disabled cache renders every response."""
+    cache = ResponseCache(ResponseCacheConfig(enabled=False))
+    render = MagicMock(return_value=b"body")
+    await cache.get(snapshot(1), "key", render)
+    cached = await cache.get(snapshot(1), "key", render)
+    assert render.call_count == 2
+    assert cached.etag
+    assert cache.nbytes == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_compressed_bodies():
+    """Verify that cached responses are stored compressed, within the budget."""
+    cache = ResponseCache(
+        ResponseCacheConfig(max_bytes=10_000),
+        compression=CompressionConfig(minimum_size=100),
+    )
+    cached = await cache.get(snapshot(1), "key", lambda: b"x" * 1000, "gzip")
+    assert list(cached.encodings) == ["gzip"]
+    assert gzip.decompress(cached.encodings["gzip"]) == b"x" * 1000
+    assert cached.nbytes == 1000 + len(cached.etag) + len(cached.encodings["gzip"])
+    assert cache.nbytes == cached.nbytes
+    small = await cache.get(snapshot(1), "small", lambda: b"x" * 10, "gzip")
+    assert small.encodings == {}
+    assert small.incompressible == {"gzip"}
+
+
+@pytest.mark.asyncio
+async def test_cache_compresses_each_encoding_when_first_accepted():
+    """Verify that a response is compressed with an encoding once it is accepted."""
+    cache = ResponseCache(
+        ResponseCacheConfig(max_bytes=10_000),
+        compression=CompressionConfig(minimum_size=100),
+    )
+    cached = await cache.get(snapshot(1), "key", lambda: b"x" * 1000)
+    assert cached.encodings == {}
+    assert cache.nbytes == cached.nbytes
+
+    assert await cache.get(snapshot(1), "key", render_once, "gzip") is cached
+    assert list(cached.encodings) == ["gzip"]
+    assert cache.nbytes == cached.nbytes
+
+    gzipped = cached.encodings["gzip"]
+    await cache.get(snapshot(1), "key", render_once, "gzip")
+    assert cached.encodings["gzip"] is gzipped
+
+
+def render_once() -> bytes:
+    """Fail the test when a cached response is rendered again."""
+    pytest.fail("response rendered again")
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_does_not_compress():
+    """Verify that responses rendered on every request are not compressed."""
+    cache = ResponseCache(
+        ResponseCacheConfig(enabled=False), compression=CompressionConfig()
+    )
+    assert (await cache.get(snapshot(1), "key", lambda: b"x" * 10_000)).encodings == {}
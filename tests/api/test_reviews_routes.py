@@ -0,0 +1,250 @@
+"""Test Food Review API reviews router definition."""
+
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from food_review_api.products.orderings import wilson_lower_bound
+
+PRODUCT_ID = "B001LG945O"
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_returns_all_reviews(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns every review of a product without a limit."""
+    response = await async_client.get(
+        "/api/v1/reviews", params={"product_id": PRODUCT_ID}
+    )
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert len(body["reviews"]) == body["number_of_reviews"] == 6
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_paginates_with_cursor(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` cursor pages cover all reviews in a stable order."""
+    expected = loaded_product_repository.get(PRODUCT_ID).reviews
+    params = {"product_id": PRODUCT_ID, "limit": 4}
+    response = await async_client.get("/api/v1/reviews", params=params)
+    first_page = response.json()
+    assert len(first_page["reviews"]) == 4
+    assert first_page["next_cursor"] is not None
+
+    params["cursor"] = first_page["next_cursor"]
+    response = await async_client.get("/api/v1/reviews", params=params)
+    second_page = response.json()
+    assert second_page["next_cursor"] is None
+    ids = [review["id"] for review in first_page["reviews"] + second_page["reviews"]]
+    assert ids == [review.id for review in expected]
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_paginates_with_offset(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns the page starting at `offset`."""
+    expected = loaded_product_repository.get(PRODUCT_ID).reviews
+    response = await async_client.get(
+        "/api/v1/reviews", params={"product_id": PRODUCT_ID, "offset": 5, "limit": 2}
+    )
+    body = response.json()
+    assert [review["id"] for review in body["reviews"]] == [expected[5].id]
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_rejects_invalid_cursor(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns 400 for a cursor of another product."""
+    response = await async_client.get(
+        "/api/v1/reviews", params={"product_id": PRODUCT_ID, "limit": 1}
+    )
+    cursor = response.json()["next_cursor"]
+    for invalid_cursor in [cursor, "not-a-cursor"]:
+        response = await async_client.get(
+            "/api/v1/reviews",
+            params={"product_id": "B004391DK0", "cursor": invalid_cursor},
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_returns_not_found(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns 404 for a product not loaded."""
+    response = await async_client.get("/api/v1/reviews", params={"product_id": "x"})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_returns_not_modified_for_matching_etag(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns 304 when `If-None-Match` matches the ETag."""
+    params = {"product_id": PRODUCT_ID}
+    response = await async_client.get("/api/v1/reviews", params=params)
+    etag = response.headers["etag"]
+
+    response = await async_client.get(
+        "/api/v1/reviews", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+
+    response = await async_client.get(
+        "/api/v1/reviews", params=params, headers={"If-None-Match": '"other"'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_filters_time_range(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns the reviews in `since`/`until` by time."""
+    times = [
+        review.time for review in loaded_product_repository.get(PRODUCT_ID).reviews
+    ]
+    assert times == sorted(times)
+    since, until = times[1], times[-2]
+    response = await async_client.get(
+        "/api/v1/reviews",
+        params={"product_id": PRODUCT_ID, "since": since, "until": until},
+    )
+    body = response.json()
+    expected = [time for time in times if since <= time <= until]
+    assert [review["time"] for review in body["reviews"]] == expected
+    assert body["number_of_reviews"] == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_latest_reviews_route_paginates_by_descending_time(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews/latest` cursor pages cover reviews by descending time."""
+    params = {"limit": 100}
+    times = []
+    while True:
+        response = await async_client.get("/api/v1/reviews/latest", params=params)
+        assert response.status_code == HTTPStatus.OK
+        body = response.json()
+        times += [review["time"] for review in body["reviews"]]
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+    snapshot = loaded_product_repository.snapshot
+    assert len(times) == body["number_of_reviews"] == snapshot.store.review_count
+    assert times == sorted(times, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_latest_reviews_route_filters_time_range(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews/latest` only returns reviews in the time range."""
+    times = loaded_product_repository.snapshot.store.columns["time"]
+    since, until = int(np.quantile(times, 0.25)), int(np.quantile(times, 0.75))
+    response = await async_client.get(
+        "/api/v1/reviews/latest",
+        params={"since": since, "until": until, "limit": 5},
+    )
+    body = response.json()
+    assert body["number_of_reviews"] == int(((times >= since) & (times <= until)).sum())
+    assert all(since <= review["time"] <= until for review in body["reviews"])
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_projects_fields(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` only returns the requested fields of the reviews."""
+    expected = loaded_product_repository.get(PRODUCT_ID).reviews
+    full = await async_client.get("/api/v1/reviews", params={"product_id": PRODUCT_ID})
+    for fields in ["summary,time,score", ["score", "time,summary"]]:
+        response = await async_client.get(
+            "/api/v1/reviews", params={"product_id": PRODUCT_ID, "fields": fields}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["reviews"] == [
+            {"score": review.score, "time": review.time, "summary": review.summary}
+            for review in expected
+        ]
+        assert len(response.content) < len(full.content)
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_rejects_unknown_fields(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` returns 400 for fields which are not review fields."""
+    response = await async_client.get(
+        "/api/v1/reviews", params={"product_id": PRODUCT_ID, "fields": "score,body"}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert "body" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_latest_reviews_route_projects_fields(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews/latest` only returns the requested fields."""
+    response = await async_client.get(
+        "/api/v1/reviews/latest", params={"fields": "id,time", "limit": 5}
+    )
+    reviews = response.json()["reviews"]
+    assert len(reviews) == 5
+    assert all(set(review) == {"id", "time"} for review in reviews)
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_sorts_and_filters_by_score(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` pages reviews sorted by descending helpfulness."""
+    product_id = loaded_product_repository.snapshot.ranking.most_reviewed(1)[0][0]
+    params = {"product_id": product_id, "sort": "-helpfulness", "max_score": 4}
+    response = await async_client.get("/api/v1/reviews", params=params)
+    body = response.json()
+    reviews = body["reviews"]
+    assert response.status_code == HTTPStatus.OK
+    assert 1 < len(reviews) == body["number_of_reviews"]
+    assert all(review["score"] <= 4 for review in reviews)
+    helpfulness = wilson_lower_bound(
+        np.array([review["helpfulness_numerator"] for review in reviews]),
+        np.array([review["helpfulness_denominator"] for review in reviews]),
+    )
+    assert (np.diff(helpfulness) <= 0).all()
+
+    params["limit"] = 1
+    ids = []
+    while True:
+        response = await async_client.get("/api/v1/reviews", params=params)
+        page = response.json()
+        ids += [review["id"] for review in page["reviews"]]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    assert ids == [review["id"] for review in reviews]
+
+
+@pytest.mark.asyncio
+async def test_reviews_route_rejects_invalid_sort(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/reviews` validates the sort key and score bounds."""
+    for params in [{"sort": "price"}, {"min_score": 6}]:
+        response = await async_client.get(
+            "/api/v1/reviews", params={"product_id": PRODUCT_ID, **params}
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
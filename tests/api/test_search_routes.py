@@ -0,0 +1,82 @@
+"""Test Food Review API search router definition."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+PRODUCT_ID = "B001LG945O"
+
+
+@pytest.mark.asyncio
+async def test_search_route_returns_best_matches(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/search` returns matching reviews by descending score."""
+    response = await async_client.get("/api/v1/search", params={"q": "coffee"})
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert 0 < len(body["results"]) <= 10
+    scores = [result["score"] for result in body["results"]]
+    assert scores == sorted(scores, reverse=True)
+    for result in body["results"]:
+        review = result["review"]
+        assert "coffee" in f"{review['summary']} {review['text']}".lower()
+
+
+@pytest.mark.asyncio
+async def test_search_route_paginates_with_cursor(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/search` cursor pages cover all results without repetition."""
+    params = {"q": "good great", "limit": 100}
+    response = await async_client.get("/api/v1/search", params=params)
+    expected = [result["review"]["id"] for result in response.json()["results"]]
+
+    ids, params["limit"] = [], 3
+    while True:
+        body = (await async_client.get("/api/v1/search", params=params)).json()
+        ids += [result["review"]["id"] for result in body["results"]]
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+    assert ids == expected
+    assert len(ids) == body["number_of_results"]
+
+
+@pytest.mark.asyncio
+async def test_search_route_filters_by_product(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/search` only returns reviews of the given product."""
+    response = await async_client.get(
+        "/api/v1/search", params={"q": "the", "product_id": PRODUCT_ID}
+    )
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()["results"]
+    assert results
+    assert {result["review"]["product_id"] for result in results} == {PRODUCT_ID}
+
+
+@pytest.mark.asyncio
+async def test_search_route_unknown_product(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/search` returns 404 when filtering by an unknown product."""
+    response = await async_client.get(
+        "/api/v1/search", params={"q": "coffee", "product_id": "unknown"}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_search_route_projects_fields(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/search` only returns the requested fields of the reviews."""
+    response = await async_client.get(
+        "/api/v1/search", params={"q": "coffee", "fields": "id,score"}
+    )
+    results = response.json()["results"]
+    assert results
+    assert all(set(result["review"]) == {"id", "score"} for result in results)
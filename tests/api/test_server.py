@@ -0,0 +1,100 @@
+"""Test Food Review API pre-forking server definition."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+from pytest import fixture
+
+SERVER_SCRIPT = """
+import os
+
+from fastapi import FastAPI, Request
+
+from food_review_api.api.server import Supervisor, create_server_socket
+from food_review_api.core.config import ServerConfig
+
+
+def build_app():
+    app = FastAPI()
+    app.get("/pid")(os.getpid)
+    app.get("/workers")(get_workers)
+    return app
+
+
+def get_workers(request: Request):
+    return request.app.state.workers
+
+
+config = ServerConfig(
+    host="127.0.0.1", port=0, workers=2, log_level="warning", restart_delay=0
+)
+sock = create_server_socket(config)
+print(sock.getsockname()[1], flush=True)
+Supervisor(config, app_factory=build_app).run(sock)
+"""
+
+
+@fixture
+def server(tmp_path):
+    """Run a supervisor with two workers serving their pid in a subprocess.
+
+    Yields:
+        tuple[subprocess.Popen, str]: The supervisor process and the server URL.
+    """
+    script = tmp_path / "server.py"
+    script.write_text(SERVER_SCRIPT)
+    process = subprocess.Popen(
+        [sys.executable, str(script)], stdout=subprocess.PIPE, text=True
+    )
+    port = int(process.stdout.readline())
+    url = f"http://127.0.0.1:{port}/pid"
+    yield process, url
+    if process.poll() is None:
+        # Stop gracefully, so that the supervisor does not leave orphan workers.
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def get_pid(url: str, timeout: float = 10) -> int:
+    """Get the pid of the worker serving a request, waiting for a worker to be up."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return httpx.get(url).json()
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def test_supervisor_restarts_killed_worker(server):
+    """Verify that a killed worker is replaced by a new worker."""
+    process, url = server
+    worker_pid = get_pid(url)
+    assert worker_pid != process.pid
+    os.kill(worker_pid, signal.SIGKILL)
+    pids = {get_pid(url) for _ in range(20)}
+    assert worker_pid not in pids
+
+
+def test_supervisor_tells_apps_the_number_of_workers(server):
+    """Verify that the apps of the workers know they are one of several workers."""
+    _, url = server
+    get_pid(url)
+    assert httpx.get(url.replace("/pid", "/workers")).json() == 2
+
+
+def test_supervisor_stops_workers_on_sigterm(server):
+    """Verify that the supervisor exits once its workers shut down on SIGTERM."""
+    process, url = server
+    get_pid(url)
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=10) == 0
@@ -0,0 +1,61 @@
+"""Test Food Review API users router definition."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+PRODUCT_ID = "B001LG945O"
+
+
+@pytest.mark.asyncio
+async def test_user_reviews_route_returns_user_reviews(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/users/{user_id}/reviews` returns the reviews of the user."""
+    review = loaded_product_repository.get(PRODUCT_ID).reviews[0]
+    response = await async_client.get(f"/api/v1/users/{review.user_id}/reviews")
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["profile_name"] == review.profile_name
+    assert body["number_of_reviews"] == len(body["reviews"])
+    assert review.model_dump() in body["reviews"]
+    assert {user_review["user_id"] for user_review in body["reviews"]} == {
+        review.user_id
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_reviews_route_unknown_user(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/users/{user_id}/reviews` returns 404 for unknown users."""
+    response = await async_client.get("/api/v1/users/unknown/reviews")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_user_reviews_route_projects_fields(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/users/{user_id}/reviews` only returns the requested fields."""
+    review = loaded_product_repository.get(PRODUCT_ID).reviews[0]
+    response = await async_client.get(
+        f"/api/v1/users/{review.user_id}/reviews", params={"fields": "product_id"}
+    )
+    body = response.json()
+    assert {"product_id": review.product_id} in body["reviews"]
+    assert all(list(user_review) == ["product_id"] for user_review in body["reviews"])
+
+
+@pytest.mark.asyncio
+async def test_top_reviewers_route_returns_k_reviewers(
+    async_client: AsyncClient, loaded_product_repository
+):
+    """Test `/api/v1/users/top_reviewers` returns `k` reviewers by review count."""
+    response = await async_client.get("/api/v1/users/top_reviewers", params={"k": 5})
+    assert response.status_code == HTTPStatus.OK
+    reviewers = response.json()
+    assert len(reviewers) == 5
+    counts = [reviewer["number_of_reviews"] for reviewer in reviewers]
+    assert counts == sorted(counts, reverse=True)
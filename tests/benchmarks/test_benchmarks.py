@@ -0,0 +1,101 @@
+"""Test Food Review API load and endpoints benchmarks."""
+
+from pytest import fixture
+
+from benchmarks.compare import compare_results
+from benchmarks.compression import benchmark_compression
+from benchmarks.endpoints import benchmark_endpoints
+from benchmarks.generator import write_reviews_csv
+from benchmarks.instrumentation import benchmark_metrics_overhead
+from benchmarks.load import benchmark_load
+
+
+@fixture(scope="module")
+def reviews_csv(tmp_path_factory):
+    """Return the path to a small synthetic reviews CSV file."""
+    return write_reviews_csv(tmp_path_factory.mktemp("benchmarks") / "r.csv", 300)
+
+
+def test_benchmark_load_measures_each_case(reviews_csv):
+    """Verify that every load case loads all reviews and reports its memory."""
+    results = benchmark_load(reviews_csv)
+    assert [result["case"] for result in results] == [
+        "csv",
+        "csv_and_snapshot_write",
+        "snapshot",
+        "csv_text_compression",
+    ]
+    for result in results:
+        assert result["review_count"] == 300
+        assert result["wall_time"] > result["index_build_time"] > 0
+        assert result["peak_rss_bytes"] >= result["baseline_peak_rss_bytes"] > 0
+    assert list(reviews_csv.parent.glob(".*.snapshot")) == []
+    assert results[-1]["store_bytes"] < results[0]["store_bytes"]
+
+
+def test_benchmark_endpoints_measures_each_endpoint(reviews_csv):
+    """Verify that every endpoint is measured, and the repository cleared."""
+    results = benchmark_endpoints(reviews_csv, requests=3, warmup=1)
+    assert {result["endpoint"] for result in results} >= {"reviews_top_product"}
+    assert {result["cached"] for result in results} == {True, False}
+    assert all(
+        result["requests"] == 3 and result["p99_ms"] >= result["p50_ms"] > 0
+        for result in results
+    )
+
+
+def test_benchmark_metrics_overhead():
+    """Verify that the middleware overhead is the difference of request times."""
+    result = benchmark_metrics_overhead(requests=1_000)
+    assert result["instrumented_us"] > result["bare_us"] > 0
+    assert result["metrics_middleware_overhead_us"] == (
+        result["instrumented_us"] - result["bare_us"]
+    )
+
+
+def test_compare_results_flags_regressions():
+    """Verify that metrics over the baseline by more than the threshold regress."""
+    baseline = {
+        "datasets": [
+            {
+                "rows": 10,
+                "load": [{"case": "csv", "wall_time": 1.0, "peak_rss_bytes": 100}],
+                "endpoints": [
+                    {"endpoint": "search", "cached": False, "p50_ms": 2.0, "p95_ms": 3}
+                ],
+            }
+        ]
+    }
+    results = {
+        "datasets": [
+            {
+                "rows": 10,
+                "load": [{"case": "csv", "wall_time": 1.5, "peak_rss_bytes": 110}],
+                "endpoints": [
+                    {"endpoint": "search", "cached": False, "p50_ms": 1.0, "p95_ms": 3}
+                ],
+            },
+            {"rows": 20, "load": [], "endpoints": []},
+        ]
+    }
+    comparisons = compare_results(results, baseline, threshold=0.2)
+    regressions = {
+        (comparison["benchmark"], comparison["metric"])
+        for comparison in comparisons
+        if comparison["regression"]
+    }
+    assert len(comparisons) == 4
+    assert regressions == {("10/load/csv", "wall_time")}
+
+
+def test_benchmark_compression_measures_each_encoding(reviews_csv):
+    """Verify that compressed responses are smaller than uncompressed ones."""
+    results = benchmark_compression(
+        reviews_csv, requests=2, warmup=1, cache_modes=(True,)
+    )
+    sizes = {
+        (result["endpoint"], result["encoding"]): result["response_bytes"]
+        for result in results
+    }
+    assert sizes["latest_reviews", "gzip"] < sizes["latest_reviews", "identity"]
+    assert all(result["cpu_ms"] > 0 for result in results)
@@ -0,0 +1,32 @@
+"""Test Food Review API synthetic reviews dataset generator."""
+
+import pandas as pd
+
+from benchmarks.generator import generate_reviews, write_reviews_csv
+from food_review_api.products.repository import read_reviews_csv
+
+
+def test_generated_reviews_are_deterministic_and_skewed():
+    """Verify that a seed generates the same reviews, skewed by product."""
+    reviews = pd.concat(generate_reviews(2_000, seed=1, chunk_size=700))
+    assert reviews["id"].tolist() == list(range(1, 2_001))
+    assert reviews.equals(pd.concat(generate_reviews(2_000, seed=1, chunk_size=700)))
+    assert reviews["score"].between(1, 5).all()
+    assert (
+        reviews["helpfulness_numerator"] <= reviews["helpfulness_denominator"]
+    ).all()
+    review_counts = reviews["product_id"].value_counts()
+    assert review_counts.max() > 5 * review_counts.median()
+
+
+def test_written_csv_is_loadable(tmp_path):
+    """Verify that the written CSV file is read like the real dataset."""
+    filename = write_reviews_csv(tmp_path / "reviews.csv", 500)
+    header = filename.read_text().splitlines()[0]
+    assert header == (
+        "Id,ProductId,UserId,ProfileName,HelpfulnessNumerator,"
+        "HelpfulnessDenominator,Score,Time,Summary,Text"
+    )
+    reviews = pd.concat(read_reviews_csv(str(filename), chunk_size=200))
+    assert len(reviews) == 500
+    assert reviews.equals(next(generate_reviews(500)))
@@ -0,0 +1,79 @@
+"""Test Food Review API recorded traffic replay driver."""
+
+import json
+
+from pytest import fixture
+
+from benchmarks.replay import RouteTemplates, format_report, read_recording, replay
+from food_review_api.api import build_service_app
+from food_review_api.products import product_repository
+
+PRODUCT_ID = "B001LG945O"
+
+
+@fixture
+def recording(tmp_path):
+    """Return the path to a recording of a few requests, written out of order."""
+    records = [
+        {"timestamp": 10.0, "method": "GET", "path": "/api/v1/reviews",
+         "query": f"product_id={PRODUCT_ID}&limit=2"},
+        {"timestamp": 10.5, "method": "GET", "path": f"/api/v1/products/{PRODUCT_ID}/stats"},
+        {"timestamp": 10.2, "method": "POST", "path": "/api/v1/products/batch",
+         "body": json.dumps({"product_ids": [PRODUCT_ID], "include": "stats"})},
+        {"timestamp": 10.3, "method": "GET", "path": "/api/v1/products/unknown/stats"},
+    ]  # fmt: skip
+    filename = tmp_path / "requests.jsonl"
+    filename.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return filename
+
+
+@fixture
+def loaded_app(config):
+    """Return the service app, with the test reviews loaded."""
+    product_repository.load(config.database)
+    yield build_service_app()
+    product_repository.clear()
+
+
+def test_read_recording_sorts_requests_by_time(recording):
+    """Verify that recorded requests are read by ascending time."""
+    requests = read_recording(recording)
+    assert [request.timestamp for request in requests] == [10.0, 10.2, 10.3, 10.5]
+    assert requests[0].url == f"/api/v1/reviews?product_id={PRODUCT_ID}&limit=2"
+    assert requests[1].body is not None
+
+
+def test_route_templates_match_request_paths(loaded_app):
+    """Verify that requests are grouped by the path template of their route."""
+    routes = RouteTemplates(loaded_app)
+    assert (
+        routes.match("GET", f"/api/v1/products/{PRODUCT_ID}/stats")
+        == "GET /api/v1/products/{product_id}/stats"
+    )
+    assert (
+        routes.match("GET", "/api/v1/products/most_reviewed")
+        == "GET /api/v1/products/most_reviewed"
+    )
+    assert routes.match("POST", "/unknown") == "POST /unknown"
+
+
+def test_replay_in_process_reports_each_route(loaded_app, recording):
+    """Verify that every request is replayed and reported by route."""
+    report = replay(read_recording(recording), loaded_app, concurrency=2, speedup=10)
+    assert report["requests"] == 4
+    assert report["errors"] == 0
+    assert report["wall_time"] >= 0.05
+    assert report["routes"]["GET /api/v1/products/{product_id}/stats"]["requests"] == 2
+    assert set(report["routes"]) == {
+        "GET /api/v1/reviews",
+        "GET /api/v1/products/{product_id}/stats",
+        "POST /api/v1/products/batch",
+    }
+    assert "GET /api/v1/reviews" in format_report(report)
+
+
+def test_replay_at_fixed_rate(loaded_app, recording):
+    """Verify that a fixed rate replaces the recorded times between requests."""
+    report = replay(read_recording(recording), loaded_app, rate=1000)
+    assert report["requests"] == 4
+    assert report["wall_time"] < 1
@@ -3,11 +3,13 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 from pytest import fixture
 
 from food_review_api.core.config.configuration import Configuration
 from food_review_api.products.repository import ProductRepository
+from food_review_api.products.store import ReviewStoreBuilder
 
 
 @fixture
@@ -28,6 +30,47 @@ def mock_reviews():
     )
 
 
+@fixture
+def make_reviews(mock_reviews):
+    """Return a factory of random reviews of a few products with distinct times.
+
+    The factory takes the number of reviews and of products, and column overrides,
+    each a value or a function of the random generator drawing the values, e.g.
+    `make_reviews(60, 3, score=lambda rng: rng.integers(1, 6, 60))`.
+    """
+
+    def make(count: int, product_count: int, **columns) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        reviews = mock_reviews.sample(count, replace=True, random_state=0)
+        reviews = reviews.reset_index(drop=True)
+        reviews["id"] = range(count)
+        products = [f"product{i}" for i in range(product_count)]
+        # Products and times are drawn first, unless overridden.
+        columns = {
+            "product_id": lambda rng: rng.choice(products, count),
+            "time": lambda rng: rng.permutation(count),
+            **columns,
+        }
+        for name, values in columns.items():
+            reviews[name] = values(rng) if callable(values) else values
+        return reviews
+
+    return make
+
+
+@fixture
+def store(reviews):
+    """Return the store of the `reviews` fixture of the test module.
+
+    The reviews are added in two chunks, so the store merges several chunks.
+    """
+    builder = ReviewStoreBuilder()
+    half = len(reviews) // 2
+    builder.add_chunk(reviews.iloc[:half])
+    builder.add_chunk(reviews.iloc[half:])
+    return builder.build()
+
+
 @fixture(scope="session")
 def config_file_local():
     """Return the path to the test configuration file.
@@ -0,0 +1,71 @@
+"""Test Food Review API configuration class definition."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import fixture
+
+from food_review_api.core.config import configuration
+from food_review_api.core.config.configuration import (
+    Configuration,
+    clear_configuration_cache,
+    get_configuration,
+)
+
+
+@fixture
+def config_file(tmp_path: Path, config_file_local: Path):
+    """Return a writable copy of the test configuration file in use.
+
+    Yields:
+        Path: The path to the configuration file copy.
+    """
+    config_file = tmp_path / "application-test.yaml"
+    config_file.write_text(config_file_local.read_text())
+    clear_configuration_cache()
+    with patch.object(Configuration, "config_file_local", config_file):
+        yield config_file
+    clear_configuration_cache()
+
+
+def test_get_configuration_returns_cached_instance(config_file: Path):
+    """Verify that get_configuration() parses the configuration only once."""
+    with patch.object(
+        configuration, "Configuration", wraps=Configuration
+    ) as mock_configuration:
+        first = get_configuration()
+        second = get_configuration()
+    assert first is second
+    assert mock_configuration.call_count == 1
+
+
+def test_get_configuration_reloads_on_file_change(config_file: Path):
+    """Verify that get_configuration() parses the file again when it changes."""
+    first = get_configuration()
+    config_file.write_text("database:\n  filename: data/reviews_2.csv\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = get_configuration()
+    assert second is not first
+    assert second.database.filename == "data/reviews_2.csv"
+
+
+def test_clear_configuration_cache_invalidates_cache(config_file: Path):
+    """Verify that clear_configuration_cache() forces a new configuration."""
+    first = get_configuration()
+    clear_configuration_cache()
+    assert get_configuration() is not first
+
+
+def test_configuration_version_is_memoized(config: Configuration):
+    """Verify that the package version is only read once."""
+    configuration._food_review_api_version.cache_clear()
+    with patch.object(
+        configuration, "package_version", return_value="1.2.3"
+    ) as mock_package_version:
+        assert config.version == "1.2.3"
+        assert config.version == "1.2.3"
+    mock_package_version.assert_called_once_with("food_review_api")
+    configuration._food_review_api_version.cache_clear()
@@ -0,0 +1,28 @@
+"""Test Food Review API database configuration class definition."""
+
+from pydantic import ValidationError
+from pytest import mark, raises
+
+from food_review_api.core.config.database import DatabaseConfig
+
+
+def test_sources_expand_glob_patterns():
+    """Verify that glob patterns expand to sorted paths, without duplicates."""
+    db = DatabaseConfig(filename=["data/reviews_2.csv", "data/reviews_*.csv"])
+    assert db.sources == ["data/reviews_2.csv", "data/reviews_1.csv"]
+    assert DatabaseConfig(filename="data/reviews_1.csv").sources == [
+        "data/reviews_1.csv"
+    ]
+
+
+def test_sources_raise_error_on_unmatched_pattern():
+    """Verify that a glob pattern matching no file raises FileNotFoundError."""
+    with raises(FileNotFoundError):
+        DatabaseConfig(filename="data/missing_*.csv").sources
+
+
+@mark.parametrize("filename", [[], "", ["data/reviews_1.csv", " "]])
+def test_filename_must_not_be_empty(filename):
+    """Verify that empty lists of paths, and empty paths, are rejected."""
+    with raises(ValidationError, match="(?i)reviews CSV file"):
+        DatabaseConfig(filename=filename)
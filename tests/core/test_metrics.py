@@ -0,0 +1,61 @@
+"""Test Food Review API metrics registry definition."""
+
+import os
+
+from food_review_api.core.metrics import LATENCY_BUCKETS, Histogram, MetricsRegistry
+
+
+def test_histogram_counts_values_in_buckets():
+    """Verify that values are counted in the first bucket they do not exceed."""
+    histogram = Histogram((1, 10))
+    for value in [0.5, 1, 5, 50]:
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert (histogram.sum, histogram.count) == (56.5, 4)
+    assert list(histogram.samples("size", (("route", "/"),))) == [
+        'size_bucket{route="/",le="1"} 2',
+        'size_bucket{route="/",le="10"} 3',
+        'size_bucket{route="/",le="+Inf"} 4',
+        'size_sum{route="/"} 56.5',
+        'size_count{route="/"} 4',
+    ]
+
+
+def test_registry_renders_prometheus_exposition():
+    """Verify that request metrics and gauges are rendered with their headers."""
+    registry = MetricsRegistry()
+    registry.observe_request("GET", "/items/{id}", 200, 0.002, 120)
+    registry.observe_request("GET", "/items/{id}", 200, 0.004, 80)
+    registry.observe_request("GET", "/items/{id}", 404, 0.001, 20)
+    registry.in_flight = 1
+    lines = registry.render(
+        [("products", "Loaded products.", 7)], [("hits_total", "Cache hits.", 3)]
+    ).splitlines()
+    worker = f'worker="{os.getpid()}"'
+
+    assert "# TYPE food_review_api_http_requests_total counter" in lines
+    assert (
+        f'food_review_api_http_requests_total{{{worker},method="GET",'
+        'route="/items/{id}",status="200"} 2'
+    ) in lines
+    assert (
+        f'food_review_api_http_request_duration_seconds_count{{{worker},method="GET",'
+        'route="/items/{id}"} 3'
+    ) in lines
+    assert (
+        f'food_review_api_http_response_size_bytes_bucket{{{worker},method="GET",'
+        'route="/items/{id}",le="100"} 2'
+    ) in lines
+    assert (
+        sum("http_request_duration_seconds_bucket" in line for line in lines)
+        == len(LATENCY_BUCKETS) + 1
+    )
+    assert f"food_review_api_http_requests_in_flight{{{worker}}} 1" in lines
+    assert lines[-6:] == [
+        "# HELP hits_total Cache hits.",
+        "# TYPE hits_total counter",
+        f"hits_total{{{worker}}} 3",
+        "# HELP products Loaded products.",
+        "# TYPE products gauge",
+        f"products{{{worker}}} 7",
+    ]
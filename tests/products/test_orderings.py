@@ -0,0 +1,98 @@
+"""Test Food Review API product reviews orderings class definition."""
+
+import numpy as np
+import pandas as pd
+from pytest import fixture, mark
+
+from food_review_api.products.orderings import ReviewOrderings, wilson_lower_bound
+
+
+@fixture
+def reviews(make_reviews):
+    """Return random reviews of a few products with distinct times and votes."""
+    reviews = make_reviews(
+        60,
+        3,
+        time=lambda rng: rng.permutation(60) * 10,
+        score=lambda rng: rng.integers(1, 6, 60),
+        helpfulness_denominator=lambda rng: rng.integers(0, 8, 60),
+        helpfulness_numerator=lambda rng: rng.integers(0, 8, 60),
+    )
+    reviews["helpfulness_numerator"] %= reviews["helpfulness_denominator"] + 1
+    return reviews
+
+
+def _expected_ids(reviews: pd.DataFrame, key: str, ascending: bool) -> list[int]:
+    """Get the identifiers of the reviews sorted by a key, ties by time."""
+    if key == "helpfulness":
+        reviews = reviews.assign(
+            helpfulness=wilson_lower_bound(
+                reviews["helpfulness_numerator"], reviews["helpfulness_denominator"]
+            )
+        )
+    columns = ["time"] if key == "time" else [key, "time"]
+    return reviews.sort_values(columns, ascending=ascending)["id"].tolist()
+
+
+def test_wilson_lower_bound_ranks_by_confidence():
+    """Verify that more votes rank higher than a smaller equal proportion."""
+    bounds = wilson_lower_bound(np.array([9, 1, 0, 5, 3]), np.array([10, 1, 0, 5, 2]))
+    assert bounds[0] > bounds[1] > bounds[2] == 0
+    assert 0 < bounds[1] < 1
+    assert bounds[3] < bounds[0]
+    # More helpful votes than votes count as all votes helpful.
+    assert bounds[4] == wilson_lower_bound(np.array([2]), np.array([2]))[0]
+
+
+@mark.parametrize("sort", ["time", "-time", "score", "-score", "-helpfulness"])
+def test_page_sorts_product_reviews(reviews, store, sort):
+    """Verify that pages of a product are slices of its sorted reviews."""
+    orderings = ReviewOrderings(store)
+    product_reviews = reviews[reviews["product_id"] == "product1"]
+    expected = _expected_ids(
+        product_reviews, sort.removeprefix("-"), not sort.startswith("-")
+    )
+    rows = store.product_rows("product1")
+    page_rows, total = orderings.page(rows, sort=sort)
+    assert total == len(expected)
+    assert store.columns["id"][page_rows].tolist() == expected
+    page_rows, total = orderings.page(rows, sort=sort, offset=3, limit=4)
+    assert total == len(expected)
+    assert store.columns["id"][page_rows].tolist() == expected[3:7]
+
+
+@mark.parametrize("sort", ["time", "-score", "helpfulness", "-helpfulness"])
+def test_page_filters_score_and_time_ranges(reviews, store, sort):
+    """Verify that score and time range bounds are inclusive."""
+    orderings = ReviewOrderings(store)
+    product_reviews = reviews[
+        (reviews["product_id"] == "product2")
+        & reviews["score"].between(2, 4)
+        & reviews["time"].between(100, 450)
+    ]
+    expected = _expected_ids(
+        product_reviews, sort.removeprefix("-"), not sort.startswith("-")
+    )
+    page_rows, total = orderings.page(
+        store.product_rows("product2"),
+        sort=sort,
+        since=100,
+        until=450,
+        min_score=2,
+        max_score=4,
+        limit=5,
+    )
+    assert total == len(expected) > 5
+    assert store.columns["id"][page_rows].tolist() == expected[:5]
+
+
+def test_page_is_empty_for_empty_ranges(store):
+    """Verify that empty score ranges and offsets past the end return no rows."""
+    orderings = ReviewOrderings(store)
+    rows = store.product_rows("product0")
+    page_rows, total = orderings.page(rows, sort="score", min_score=4, max_score=3)
+    assert total == 0
+    assert len(page_rows) == 0
+    page_rows, total = orderings.page(rows, sort="-helpfulness", offset=100)
+    assert total == rows.stop - rows.start
+    assert len(page_rows) == 0
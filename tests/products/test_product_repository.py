@@ -1,13 +1,21 @@
 """Food Review API models repository class defintion."""
 
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from threading import Event
+from unittest.mock import patch
 
 import pytest
 from pytest import raises
 
 from food_review_api.core.config.database import DatabaseConfig
-from food_review_api.products.repository import ProductNotFoundInRepositoryError
+from food_review_api.products import (
+    LoadPhase,
+    ProductNotFoundInRepositoryError,
+    ProductRepository,
+)
 from food_review_api.products.schemas.product import Product
+from food_review_api.products.schemas.review import Review
+from food_review_api.products.store import CompressedStringColumn
 
 
 def test_product_repository_init(product_repository):
@@ -17,13 +25,14 @@ def test_product_repository_init(product_repository):
     This test verifies that the ProductRepository is correctly initialized with empty
     model storage, and that the metadata is set to None.
     """
-    assert product_repository._products == {}
-    assert product_repository._products_metadata is None
-    assert product_repository._review_count is None
-    assert product_repository._reviews_per_product is None
+    assert product_repository.product_count == 0
+    assert product_repository.review_count == 0
+    assert product_repository.snapshot.metadata is None
+    assert product_repository.snapshot.ranking.tier_count == 0
+    assert product_repository.generation == 0
 
 
-def test_product_repository_clear(product_repository):
+def test_product_repository_clear(product_repository, mock_reviews):
     """
     Verify that clear() method correctly resets repository state.
 
@@ -31,11 +40,15 @@ def test_product_repository_clear(product_repository):
     It creates a repository with a model and some data, and checks that after calling
     clear(), all data is erased.
     """
-    product_repository._products = {"model1": MagicMock()}
-    product_repository._products_metadata = {"data1": "value1"}
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        mock_load_reviews_csv.return_value = [mock_reviews]
+        product_repository.load(DatabaseConfig(filename="test_file.csv"))
     product_repository.clear()
-    assert product_repository._products == {}
-    assert product_repository._products_metadata is None
+    assert product_repository.product_count == 0
+    assert product_repository.available_products == []
+    assert product_repository.snapshot.metadata is None
 
 
 def test_product_repository_raises_error_when_getting_missing_model(product_repository):
@@ -69,10 +82,11 @@ def test_load_correctly_loads_products(product_repository, mock_reviews):
     with patch(
         "food_review_api.products.repository.ProductRepository._load_reviews_csv"
     ) as mock_load_reviews_csv:
-        mock_load_reviews_csv.return_value = mock_reviews
+        mock_load_reviews_csv.return_value = [mock_reviews]
         db = DatabaseConfig(filename="test_file.csv", version="1")
         product_repository.load(db)
-        assert len(product_repository._products) == 2
+        assert product_repository.product_count == 2
+        assert product_repository.available_products == ["product1", "product2"]
 
 
 def test_load_correctly_sets_review_count(product_repository, mock_reviews):
@@ -80,10 +94,10 @@ def test_load_correctly_sets_review_count(product_repository, mock_reviews):
     with patch(
         "food_review_api.products.repository.ProductRepository._load_reviews_csv"
     ) as mock_load_reviews_csv:
-        mock_load_reviews_csv.return_value = mock_reviews
+        mock_load_reviews_csv.return_value = [mock_reviews]
         db = DatabaseConfig(filename="test_file.csv")
         product_repository.load(db)
-        assert product_repository._review_count == 3
+        assert product_repository.review_count == 3
 
 
 def test_load_correctly_sets_reviews_per_product(product_repository, mock_reviews):
@@ -91,11 +105,11 @@ def test_load_correctly_sets_reviews_per_product(product_repository, mock_review
     with patch(
         "food_review_api.products.repository.ProductRepository._load_reviews_csv"
     ) as mock_load_reviews_csv:
-        mock_load_reviews_csv.return_value = mock_reviews
+        mock_load_reviews_csv.return_value = [mock_reviews]
         db = DatabaseConfig(filename="test_file.csv")
         product_repository.load(db)
-        assert product_repository._reviews_per_product["product1"] == 2
-        assert product_repository._reviews_per_product["product2"] == 1
+        reviews_per_product = product_repository.most_commented_products(n=2)
+        assert reviews_per_product == {"product1": 2, "product2": 1}
 
 
 def test_load_correctly_creates_product_instances(product_repository, mock_reviews):
@@ -103,13 +117,26 @@ def test_load_correctly_creates_product_instances(product_repository, mock_revie
     with patch(
         "food_review_api.products.repository.ProductRepository._load_reviews_csv"
     ) as mock_load_reviews_csv:
-        mock_load_reviews_csv.return_value = mock_reviews
+        mock_load_reviews_csv.return_value = [mock_reviews]
         db = DatabaseConfig(filename="test_file.csv")
         product_repository.load(db)
-        assert isinstance(product_repository._products["product1"], Product)
-        assert isinstance(product_repository._products["product2"], Product)
-        assert len(product_repository._products["product1"].reviews) == 2
-        assert len(product_repository._products["product2"].reviews) == 1
+        assert isinstance(product_repository.get("product1"), Product)
+        assert isinstance(product_repository.get("product2"), Product)
+        assert len(product_repository.get("product1").reviews) == 2
+        assert len(product_repository.get("product2").reviews) == 1
+
+
+def test_load_correctly_builds_reviews(product_repository, mock_reviews):
+    """Verify that products built from the store hold the loaded review values."""
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        mock_load_reviews_csv.return_value = [mock_reviews]
+        db = DatabaseConfig(filename="test_file.csv")
+        product_repository.load(db)
+        product = product_repository.get("product1")
+        assert product.number_of_reviews == 2
+        assert product.reviews[1] == Review(**mock_reviews.iloc[2].to_dict())
 
 
 def test_load_correctly_sets_products_metadata(product_repository, mock_reviews):
@@ -117,26 +144,277 @@ def test_load_correctly_sets_products_metadata(product_repository, mock_reviews)
     with patch(
         "food_review_api.products.repository.ProductRepository._load_reviews_csv"
     ) as mock_load_reviews_csv:
-        mock_load_reviews_csv.return_value = mock_reviews
+        mock_load_reviews_csv.return_value = [mock_reviews]
         db = DatabaseConfig(filename="test_file.csv")
         product_repository.load(db)
-        assert product_repository._products_metadata == db
+        assert product_repository.snapshot.metadata == db
+
 
+@pytest.fixture
+def loaded_product_repository(product_repository, mock_reviews):
+    """Return a product repository loaded with the mock reviews."""
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        mock_load_reviews_csv.return_value = [mock_reviews]
+        product_repository.load(DatabaseConfig(filename="test_file.csv"))
+    return product_repository
 
-def test_product_repository_get(product_repository):
+
+def test_product_repository_get(loaded_product_repository):
     """Verify that get() method correctly returns a model instance."""
-    product_repository._products = {"model1": MagicMock()}
-    assert product_repository.get("model1") == product_repository._products["model1"]
+    product = loaded_product_repository.get("product2")
+    assert product.product_id == "product2"
+    assert [review.id for review in product.reviews] == [2]
 
 
-def test_product_repository_getitem(product_repository):
+def test_product_repository_getitem(loaded_product_repository):
     """Verify that __getitem__() method correctly returns a model instance."""
-    product_repository._products = {"model1": MagicMock()}
-    assert product_repository["model1"] == product_repository._products["model1"]
+    assert loaded_product_repository["product1"] == loaded_product_repository.get(
+        "product1"
+    )
 
 
-def test_product_repository_has_product(product_repository):
+def test_product_repository_has_product(loaded_product_repository):
     """Verify that has_product() method correctly checks if a model is loaded."""
-    product_repository._products = {"model1": MagicMock()}
-    assert product_repository.has_product("model1")
-    assert not product_repository.has_product("model2")
+    assert loaded_product_repository.has_product("product1")
+    assert not loaded_product_repository.has_product("model2")
+
+
+def test_load_folds_chunks_into_products(product_repository, mock_reviews):
+    """Verify that load() method merges the reviews of a product split over chunks."""
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        mock_load_reviews_csv.return_value = [mock_reviews[:2], mock_reviews[2:]]
+        db = DatabaseConfig(filename="test_file.csv")
+        product_repository.load(db)
+        assert product_repository.review_count == 3
+        assert product_repository["product1"].number_of_reviews == 2
+        reviews = product_repository["product1"].reviews
+        assert [review.id for review in reviews] == [1, 3]
+
+
+def test_load_reads_csv_in_chunks_up_to_max_rows(product_repository):
+    """Verify that load() method streams the CSV file and honours max_rows."""
+    db = DatabaseConfig(filename="data/reviews_2.csv", chunk_size=7)
+    product_repository.load(db)
+    assert product_repository.review_count == 150
+    assert sum(product_repository.most_commented_products(n=150).values()) == 150
+
+    db = DatabaseConfig(filename="data/reviews_2.csv", chunk_size=7, max_rows=20)
+    product_repository.load(db)
+    assert product_repository.review_count == 20
+
+
+def test_product_repository_get_reviews_page(loaded_product_repository):
+    """Verify that get_reviews() slices a page of the product reviews."""
+    reviews, number_of_reviews = loaded_product_repository.get_reviews(
+        "product1", offset=1, limit=5
+    )
+    assert number_of_reviews == 2
+    assert [review.id for review in reviews] == [3]
+
+    with raises(ProductNotFoundInRepositoryError):
+        loaded_product_repository.get_reviews("product3")
+
+
+def test_load_publishes_new_snapshot_generation(product_repository, mock_reviews):
+    """Verify that each load() publishes a new snapshot with the next generation."""
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        mock_load_reviews_csv.return_value = [mock_reviews]
+        previous_snapshot = product_repository.snapshot
+        snapshot = product_repository.load(DatabaseConfig(filename="test_file.csv"))
+        assert product_repository.snapshot is snapshot
+        assert snapshot.generation == previous_snapshot.generation + 1
+        assert previous_snapshot.store.product_count == 0
+
+        mock_load_reviews_csv.return_value = [mock_reviews[:1]]
+        product_repository.load(DatabaseConfig(filename="test_file.csv"))
+        assert product_repository.generation == 2
+        assert product_repository.product_count == 1
+        assert snapshot.store.product_count == 2
+
+
+def test_reload_coalesces_concurrent_requests(product_repository, mock_reviews):
+    """Verify that reload() merges requests received while a reload is in flight."""
+    release = Event()
+
+    def blocking_load_reviews_csv(*args, **kwargs):
+        release.wait(timeout=5)
+        return [mock_reviews]
+
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv",
+        side_effect=blocking_load_reviews_csv,
+    ) as mock_load_reviews_csv:
+        db = DatabaseConfig(filename="test_file.csv")
+        first = product_repository.reload(db)
+        second = product_repository.reload(db)
+        assert first is second
+        assert product_repository.is_reloading
+        assert product_repository.product_count == 0
+
+        release.set()
+        snapshot = first.result(timeout=5)
+        assert mock_load_reviews_csv.call_count == 1
+        assert not product_repository.is_reloading
+        assert product_repository.snapshot is snapshot
+        assert product_repository.generation == 1
+
+        third = product_repository.reload(db)
+        assert third is not first
+        assert third.result(timeout=5).generation == 2
+
+
+def test_commented_products_raise_error_when_not_loaded(product_repository):
+    """Verify that rankings raise RuntimeError when no products are loaded."""
+    with raises(RuntimeError):
+        product_repository.most_commented_products(n=1)
+    with raises(RuntimeError):
+        product_repository.least_commented_products(n=1)
+
+
+def test_load_merges_sources_in_parallel(product_repository, caplog):
+    """Verify that several CSV files are merged, in parallel or not, by review id."""
+    db = DatabaseConfig(filename="data/reviews_*.csv", load_workers=2)
+    with caplog.at_level("INFO", logger="food_review_api.products.repository"):
+        product_repository.load(db)
+    parallel_products = product_repository.available_products
+    parallel_review = product_repository.get(parallel_products[0])
+    assert "Loaded 100 rows from data/reviews_1.csv" in caplog.text
+    assert "Loaded 150 rows from data/reviews_2.csv" in caplog.text
+
+    db = DatabaseConfig(
+        filename=["data/reviews_1.csv", "data/reviews_2.csv"], load_workers=1
+    )
+    product_repository.load(db)
+    assert product_repository.available_products == parallel_products
+    assert product_repository.get(parallel_products[0]) == parallel_review
+    # One review is in both files.
+    assert product_repository.review_count == 249
+
+
+def test_load_merges_appended_rows(product_repository, tmp_path, caplog):
+    """Verify that rows appended to a CSV file are merged without a full load."""
+    source = tmp_path / "reviews.csv"
+    source.write_bytes(Path("data/reviews_1.csv").read_bytes())
+    appended = Path("data/reviews_2.csv").read_bytes().split(b"\n", 1)[1]
+    db = DatabaseConfig(filename=str(source))
+    product_repository.load(db)
+
+    with source.open("ab") as file:
+        file.write(appended)
+    with caplog.at_level("INFO", logger="food_review_api.products.repository"):
+        product_repository.load(db)
+    assert "Loaded 150 appended rows" in caplog.text
+    assert "Extended search index with 149 reviews" in caplog.text
+    assert product_repository.review_count == 249
+    (state,) = product_repository.snapshot.sources
+    assert state.row_count == 250
+    assert state.offset == source.stat().st_size
+
+    full_load = ProductRepository()
+    full_load.load(db)
+    assert product_repository.available_products == full_load.available_products
+    for product_id in full_load.available_products:
+        assert product_repository.get(product_id) == full_load.get(product_id)
+    snapshot = product_repository.snapshot
+    assert snapshot.search("great coffee", limit=20) == full_load.snapshot.search(
+        "great coffee", limit=20
+    )
+    assert snapshot.reviewers.top_reviewers(5) == (
+        full_load.snapshot.reviewers.top_reviewers(5)
+    )
+
+
+@pytest.mark.parametrize("load_workers", [1, 2])
+def test_load_ingests_last_line_without_line_break(
+    product_repository, tmp_path, load_workers
+):
+    """Verify that the last review of a CSV file without trailing line break is loaded."""
+    source = tmp_path / "reviews.csv"
+    source.write_bytes(Path("data/reviews_1.csv").read_bytes().rstrip(b"\n"))
+    other = tmp_path / "other.csv"
+    other.write_bytes(Path("data/reviews_2.csv").read_bytes())
+    db = DatabaseConfig(filename=[str(source), str(other)], load_workers=load_workers)
+    product_repository.load(db)
+    assert product_repository.review_count == 249
+    state = product_repository.snapshot.sources[0]
+    assert state.row_count == 99
+
+    appended = Path("data/reviews_2.csv").read_bytes().split(b"\n", 1)[1]
+    with source.open("ab") as file:
+        file.write(b"\n" + appended)
+    product_repository.load(db)
+    assert product_repository.review_count == 249
+    state = product_repository.snapshot.sources[0]
+    assert state.row_count == 250
+    assert state.offset == source.stat().st_size
+
+
+def test_load_keeps_snapshot_when_nothing_appended(
+    product_repository, tmp_path, caplog
+):
+    """Verify that loading unchanged CSV files keeps the published snapshot."""
+    source = tmp_path / "reviews.csv"
+    source.write_bytes(Path("data/reviews_1.csv").read_bytes())
+    db = DatabaseConfig(filename=str(source), snapshot_cache=True)
+    snapshot = product_repository.load(db)
+
+    with caplog.at_level("INFO", logger="food_review_api.products.repository"):
+        assert product_repository.load(db) is snapshot
+    assert "No reviews appended" in caplog.text
+    assert product_repository.generation == snapshot.generation
+
+
+def test_load_reloads_all_when_prefix_changes(product_repository, tmp_path, caplog):
+    """Verify that a CSV file modified before the ingested offset is loaded again."""
+    source = tmp_path / "reviews.csv"
+    source.write_bytes(Path("data/reviews_2.csv").read_bytes())
+    db = DatabaseConfig(filename=str(source))
+    product_repository.load(db)
+
+    source.write_bytes(Path("data/reviews_1.csv").read_bytes())
+    with caplog.at_level("INFO", logger="food_review_api.products.repository"):
+        product_repository.load(db)
+    assert "changed, loading all" in caplog.text
+    assert product_repository.review_count == 100
+
+
+def test_load_tracks_progress(product_repository, mock_reviews, tmp_path):
+    """Verify that load() records the rows and bytes parsed, and its end."""
+    filename = tmp_path / "reviews.csv"
+    mock_reviews.to_csv(filename, index=False)
+    product_repository.load(DatabaseConfig(filename=str(filename), chunk_size=2))
+
+    progress = product_repository.progress
+    assert progress.phase == LoadPhase.READY
+    assert progress.rows_parsed == 3
+    assert progress.bytes_parsed == progress.total_bytes == filename.stat().st_size
+    assert progress.elapsed > 0
+    assert progress.eta is None
+
+
+def test_load_records_failure_in_progress(product_repository):
+    """Verify that a failed load is recorded in the load progress."""
+    with raises(FileNotFoundError):
+        product_repository.load(DatabaseConfig(filename="test_file.csv"))
+    assert product_repository.progress.phase == LoadPhase.FAILED
+    assert "FileNotFoundError" in product_repository.progress.error
+
+
+def test_load_compresses_text(product_repository, mock_reviews, tmp_path):
+    """Verify that load() compresses review texts when configured to."""
+    filename = tmp_path / "reviews.csv"
+    mock_reviews.to_csv(filename, index=False)
+    snapshot = product_repository.load(
+        DatabaseConfig(filename=str(filename), text_compression=True)
+    )
+    assert isinstance(snapshot.store.columns["text"], CompressedStringColumn)
+    reviews, total = product_repository.get_reviews("product1")
+    assert total == 2
+    assert [review.text for review in reviews] == ["text1", "text3"]
+    assert snapshot.search_index.term_count > 0
@@ -0,0 +1,57 @@
+"""Test Food Review API products load progress class definition."""
+
+from unittest.mock import patch
+
+from food_review_api.products.progress import LoadPhase, LoadProgress
+
+
+def test_load_progress_init():
+    """Verify that the progress of a load not started yet is idle."""
+    progress = LoadProgress()
+    assert progress.phase == LoadPhase.IDLE
+    assert progress.rows_parsed == 0
+    assert progress.elapsed is None
+    assert progress.eta is None
+
+
+def test_load_progress_estimates_time_left_from_parsed_bytes():
+    """Verify that the ETA extrapolates the parsing throughput to the bytes left."""
+    progress = LoadProgress()
+    with patch("food_review_api.products.progress.perf_counter", return_value=10.0):
+        progress.start(total_bytes=1000)
+    assert progress.phase == LoadPhase.PARSING
+    progress.advance(rows=10, bytes_parsed=250)
+    progress.advance(rows=10, bytes_parsed=150)
+    with patch("food_review_api.products.progress.perf_counter", return_value=14.0):
+        assert progress.elapsed == 4.0
+        assert progress.eta == 6.0
+    assert progress.rows_parsed == 20
+    assert progress.bytes_parsed == 400
+
+
+def test_load_progress_has_no_eta_when_not_parsing():
+    """Verify that no ETA is estimated once parsing is done."""
+    progress = LoadProgress()
+    progress.start(total_bytes=1000)
+    progress.advance(rows=10, bytes_parsed=1000)
+    progress.indexing()
+    assert progress.phase == LoadPhase.INDEXING
+    assert progress.eta is None
+    progress.finish()
+    assert progress.phase == LoadPhase.READY
+    assert progress.error is None
+
+
+def test_load_progress_records_failure():
+    """Verify that a failed load records its error, until the next load starts."""
+    progress = LoadProgress()
+    progress.start()
+    progress.finish(FileNotFoundError("reviews.csv"))
+    assert progress.phase == LoadPhase.FAILED
+    assert progress.error == "FileNotFoundError('reviews.csv')"
+    elapsed = progress.elapsed
+    assert progress.elapsed == elapsed
+
+    progress.start()
+    assert progress.phase == LoadPhase.PARSING
+    assert progress.error is None
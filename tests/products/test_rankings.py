@@ -0,0 +1,51 @@
+"""Test Food Review API products rankings class definition."""
+
+import numpy as np
+import pandas as pd
+from pytest import fixture, mark
+
+from food_review_api.products.rankings import ReviewCountRanking
+from food_review_api.products.store import ReviewStoreBuilder
+
+
+@fixture
+def product_ids():
+    """Return product identifiers of reviews with several tied review counts."""
+    rng = np.random.default_rng(0)
+    counts = rng.integers(1, 8, size=60)
+    return pd.Series(
+        [f"product{i:02d}" for i, count in enumerate(counts) for _ in range(count)]
+    )
+
+
+@fixture
+def ranking(product_ids, mock_reviews):
+    """Return the review count ranking of the products."""
+    reviews = mock_reviews.sample(len(product_ids), replace=True, random_state=0)
+    reviews["id"] = range(len(reviews))
+    reviews["product_id"] = product_ids.to_numpy()
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(reviews)
+    return ReviewCountRanking(builder.build())
+
+
+@mark.parametrize("n", [1, 2, 3, 7, 100])
+def test_ranking_matches_value_counts_tiers(ranking, product_ids, n):
+    """Verify that the ranking tiers match the value counts unique counts."""
+    value_counts = product_ids.value_counts()
+    most_counts = value_counts.unique()[:n]
+    least_counts = value_counts.unique()[-n:]
+    most_reviewed = dict(ranking.most_reviewed(n))
+    least_reviewed = dict(ranking.least_reviewed(n))
+
+    assert most_reviewed == value_counts[value_counts.isin(most_counts)].to_dict()
+    assert least_reviewed == value_counts[value_counts.isin(least_counts)].to_dict()
+    assert list(most_reviewed.values()) == sorted(most_reviewed.values(), reverse=True)
+    assert list(least_reviewed.values()) == sorted(
+        least_reviewed.values(), reverse=True
+    )
+
+
+def test_ranking_tier_count(ranking, product_ids):
+    """Verify that the ranking counts distinct review counts."""
+    assert ranking.tier_count == product_ids.value_counts().nunique()
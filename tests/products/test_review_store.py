@@ -0,0 +1,327 @@
+"""Test Food Review API columnar review store definition."""
+
+import numpy as np
+import pandas as pd
+from pytest import fixture, raises
+
+from food_review_api.products.schemas import Review
+from food_review_api.products.snapshot import ProductSnapshot
+from food_review_api.products.store import (
+    NULL_CODE,
+    CompressedStringColumn,
+    DictionaryColumn,
+    ReviewStore,
+    ReviewStoreBuilder,
+    StringColumn,
+)
+
+
+@fixture
+def review_store(mock_reviews):
+    """Return a review store built from the mock reviews in two chunks."""
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(mock_reviews[:2])
+    builder.add_chunk(mock_reviews[2:])
+    return builder.build()
+
+
+def test_string_column_round_trips_values():
+    """Verify that a StringColumn decodes the strings it was built from."""
+    values = ["", "café", "plain", "日本"]
+    column = StringColumn.from_strings(values)
+    assert len(column) == 4
+    assert column[1] == "café"
+    assert column.tolist() == values
+    assert column.tolist(np.array([3, 0])) == ["日本", ""]
+    assert column.tolist(slice(1, 3)) == ["café", "plain"]
+
+
+def test_string_column_concat_and_take():
+    """Verify that StringColumn concat() and take() keep values in order."""
+    column = StringColumn.concat(
+        [StringColumn.from_strings(["a", "bb"]), StringColumn.from_strings(["ccc"])]
+    )
+    assert column.tolist() == ["a", "bb", "ccc"]
+    assert column.take(np.array([2, 0, 1])).tolist() == ["ccc", "a", "bb"]
+
+
+def test_compressed_string_column_round_trips_values():
+    """Verify that a CompressedStringColumn decodes the strings it was built from."""
+    values = ["", "café", "plain", "", "日本", "tasty " * 20, "x"]
+    column = StringColumn.from_strings(values)
+    compressed = CompressedStringColumn.compress(column, block_size=8)
+    assert len(compressed.block_rows) > 2
+    assert len(compressed) == len(values)
+    assert compressed[1] == "café"
+    assert compressed.tolist() == values
+    assert compressed.tolist(slice(2, 5)) == values[2:5]
+    assert compressed.tolist(np.array([6, 0, 4, 4])) == ["x", "", "日本", "日本"]
+    assert compressed.take(np.array([5, 1])).tolist() == [values[5], "café"]
+    decompressed = compressed.decompress()
+    np.testing.assert_array_equal(decompressed.offsets, column.offsets)
+    assert decompressed.tolist() == values
+
+
+def test_compressed_string_column_handles_empty_columns():
+    """Verify that columns without values or bytes can be compressed."""
+    for values in [[], ["", ""]]:
+        compressed = CompressedStringColumn.compress(StringColumn.from_strings(values))
+        assert compressed.tolist() == values
+        assert compressed.decompress().tolist() == values
+
+
+def test_compressed_string_column_caches_recent_blocks():
+    """Verify that decompressed blocks are kept in a bounded LRU cache."""
+    values = [f"review number {index} " * 10 for index in range(100)]
+    compressed = CompressedStringColumn.compress(
+        StringColumn.from_strings(values), block_size=500, cache_blocks=2
+    )
+    compressed.tolist(slice(0, 3))
+    assert (compressed.cache_hits, compressed.cache_misses) == (0, 1)
+    compressed.tolist(slice(0, 3))
+    assert (compressed.cache_hits, compressed.cache_misses) == (1, 1)
+    assert compressed.tolist(slice(None)) == values
+    # The first block was still in cache.
+    assert compressed.cache_misses == len(compressed.block_sizes)
+    assert 0 < compressed.cache_nbytes <= 2 * 1000
+    assert compressed.decompression_time > 0
+    assert compressed.nbytes < StringColumn.from_strings(values).nbytes
+
+
+def test_dictionary_column_decodes_codes():
+    """Verify that a DictionaryColumn maps codes to their values."""
+    column = DictionaryColumn(
+        codes=np.array([1, 0, 1], dtype=np.int32),
+        values=StringColumn.from_strings(["x", "y"]),
+    )
+    assert column[0] == "y"
+    assert column.tolist() == ["y", "x", "y"]
+    assert column.take(np.array([1])).tolist() == ["x"]
+    column = DictionaryColumn(
+        codes=np.array([1, NULL_CODE, 1], dtype=np.int32),
+        values=StringColumn.from_strings(["x", "y"]),
+    )
+    assert column[1] is None
+    assert column.tolist() == ["y", None, "y"]
+
+
+def test_review_store_builds_csr_index(review_store):
+    """Verify that the store sorts rows by product and indexes them by offsets."""
+    assert review_store.product_ids.tolist() == ["product1", "product2"]
+    assert review_store.offsets.tolist() == [0, 2, 3]
+    assert review_store.review_counts.tolist() == [2, 1]
+    assert review_store.product_rows("product1") == slice(0, 2)
+    assert review_store.columns["id"].tolist() == [1, 3, 2]
+    assert review_store.has_product("product2")
+    assert not review_store.has_product("product3")
+    with raises(KeyError):
+        review_store.product_rows("product3")
+
+
+def test_review_store_sorts_product_rows_by_time(mock_reviews):
+    """Verify that the rows of each product are sorted by time, and time ranges."""
+    reviews = mock_reviews.assign(time=[30, 20, 10])
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(reviews)
+    store = builder.build()
+    assert store.columns["id"].tolist() == [3, 1, 2]
+    assert store.columns["time"].tolist() == [10, 30, 20]
+    rows = store.product_rows("product1")
+    assert store.time_range_rows(rows) == slice(0, 2)
+    assert store.time_range_rows(rows, since=11) == slice(1, 2)
+    assert store.time_range_rows(rows, until=10) == slice(0, 1)
+    assert store.time_range_rows(rows, since=10, until=30) == slice(0, 2)
+    assert store.time_range_rows(rows, since=31) == slice(2, 2)
+    assert store.time_range_rows(rows, since=30, until=10) == slice(1, 1)
+
+
+def test_review_store_builds_reviews_lazily(review_store, mock_reviews):
+    """Verify that reviews are built only for the requested rows."""
+    reviews = review_store.reviews(np.array([2, 0]))
+    assert [review.id for review in reviews] == [2, 1]
+    assert reviews[0].model_dump() == mock_reviews.iloc[1].to_dict()
+    assert list(reviews[0].model_dump()) == list(Review.model_fields)
+    assert review_store.reviews(slice(1, 2))[0].product_id == "product1"
+
+
+def test_review_store_builds_projected_reviews(review_store, mock_reviews):
+    """Verify that only the requested fields of the reviews are set."""
+    reviews = review_store.reviews(np.array([2, 0]), fields=("score", "product_id"))
+    expected = mock_reviews.iloc[1]
+    assert reviews[0].model_dump() == {
+        "product_id": expected["product_id"],
+        "score": expected["score"],
+    }
+    assert reviews[0].model_fields_set == {"product_id", "score"}
+    assert list(reviews[0].model_dump(exclude_unset=True)) == ["product_id", "score"]
+    assert [
+        review.model_dump() for review in review_store.reviews(slice(0, 2), ())
+    ] == [
+        {},
+        {},
+    ]
+
+
+def test_review_store_empty():
+    """Verify that an empty store has no products nor reviews."""
+    store = ReviewStore.empty()
+    assert store.product_count == 0
+    assert store.review_count == 0
+    assert store.reviews(slice(0, 0)) == []
+
+
+def test_positions_rows_gathers_product_rows(review_store):
+    """Verify that the rows of several products are concatenated in order."""
+    product_ids = review_store.product_ids.tolist()[::-1]
+    positions = review_store.product_positions(product_ids + ["unknown"])
+    assert positions[-1] == -1
+
+    rows, lengths = review_store.positions_rows(positions[:-1], limit=2)
+    expected = [
+        row
+        for product_id in product_ids
+        for row in range(
+            *review_store.product_rows(product_id).indices(review_store.review_count)
+        )
+    ]
+    assert lengths.tolist() == [
+        min(count, 2) for count in review_store.review_counts[::-1]
+    ]
+    assert len(rows) == lengths.sum()
+    all_rows, _ = review_store.positions_rows(positions[:-1])
+    assert all_rows.tolist() == expected
+
+
+def test_builder_drops_products_left_without_reviews(mock_reviews):
+    """Verify that products whose only reviews are duplicates are not stored."""
+    first = ReviewStoreBuilder()
+    first.add_chunk(mock_reviews)
+    # The second source repeats review 3 under products sorting after and between
+    # the products of the first source.
+    second = ReviewStoreBuilder()
+    second.add_chunk(
+        mock_reviews.iloc[[2, 2]].assign(product_id=["product0", "product9"])
+    )
+
+    builder = ReviewStoreBuilder()
+    builder.add_store(first.build())
+    builder.add_store(second.build())
+    store = builder.build()
+
+    assert store.product_ids.tolist() == ["product1", "product2"]
+    assert store.review_counts.tolist() == [2, 1]
+    snapshot = ProductSnapshot.build(store)
+    assert snapshot.get_stats("product2")["last_review_time"] == 2
+    assert snapshot.get_stats("product1")["number_of_reviews"] == 2
+
+
+def test_builder_merges_stores_and_drops_duplicate_ids(mock_reviews):
+    """Verify that added stores are merged, keeping the first review of each id."""
+    first = ReviewStoreBuilder()
+    first.add_chunk(mock_reviews)
+    duplicated = mock_reviews.assign(summary="duplicate")
+    second = ReviewStoreBuilder()
+    second.add_chunk(pd.concat([duplicated, duplicated.assign(id=[4, 5, 6])]))
+
+    builder = ReviewStoreBuilder()
+    builder.add_store(first.build())
+    builder.add_store(second.build())
+    store = builder.build()
+
+    assert store.review_count == 6
+    reviews = store.reviews(slice(None))
+    summaries = {review.id: review.summary for review in reviews}
+    assert summaries == {
+        1: "summary1",
+        2: "summary2",
+        3: "summary3",
+        4: "duplicate",
+        5: "duplicate",
+        6: "duplicate",
+    }
+    assert store.columns["user_id"].values.tolist() == ["user1", "user2"]
+    assert [review.user_id for review in reviews] == [
+        "user1",
+        "user1",
+        "user1",
+        "user1",
+        "user2",
+        "user2",
+    ]
+
+
+def test_review_store_merges_store_like_builder(make_reviews):
+    """Verify that merging a store gives the store built from both, and its rows."""
+    reviews = make_reviews(40, 6, time=lambda rng: rng.integers(0, 5, 40))
+    added = make_reviews(
+        15,
+        8,
+        id=[*range(30, 45)],
+        user_id=[None, *(f"new{i % 4}" for i in range(14))],
+        time=lambda rng: rng.integers(0, 5, 15),
+    )
+    first, second, both = (
+        ReviewStoreBuilder(),
+        ReviewStoreBuilder(),
+        ReviewStoreBuilder(),
+    )
+    first.add_chunk(reviews)
+    second.add_chunk(added)
+    both.add_chunk(reviews)
+    both.add_chunk(added)
+    expected = both.build()
+
+    store, added_rows = first.build().merge(second.build())
+
+    arrays = store.to_arrays()
+    for name, array in expected.to_arrays().items():
+        np.testing.assert_array_equal(arrays[name], array, err_msg=name)
+    # Reviews 30 to 39 are dropped, as their ids are already in the store.
+    assert sorted(store.columns["id"][added_rows]) == [*range(40, 45)]
+
+
+def test_string_column_inserts_values():
+    """Verify that StringColumn insert() inserts values like np.insert()."""
+    column = StringColumn.from_strings(["a", "bb", "ccc"])
+    inserted = column.insert(
+        np.array([0, 2, 2, 3]), StringColumn.from_strings(["w", "", "yy", "z"])
+    )
+    assert inserted.tolist() == ["w", "a", "bb", "", "yy", "ccc", "z"]
+
+
+def test_builder_keeps_missing_dictionary_values(mock_reviews):
+    """Verify that missing users and profile names are decoded as None."""
+    reviews = mock_reviews.astype({"user_id": "string", "profile_name": "string"})
+    reviews.loc[1, ["user_id", "profile_name"]] = pd.NA
+    reviews.loc[2, "profile_name"] = pd.NA
+    first = ReviewStoreBuilder()
+    first.add_chunk(reviews)
+    builder = ReviewStoreBuilder()
+    builder.add_store(first.build())
+    store = builder.build()
+
+    reviews = {review.id: review for review in store.reviews(slice(None))}
+    assert [reviews[i].user_id for i in (1, 2, 3)] == ["user1", None, "user1"]
+    assert [reviews[i].profile_name for i in (1, 2, 3)] == ["profile1", None, None]
+    assert store.columns["user_id"].values.tolist() == ["user1"]
+    assert store.columns["profile_name"][1] is None
+
+    snapshot = ProductSnapshot.build(store)
+    assert snapshot.reviewers.top_reviewers(5) == [("user1", None, 2)]
+    assert snapshot.get_stats("product2")["distinct_reviewers"] == 0
+
+
+def test_review_store_compresses_text(review_store):
+    """Verify that a store with compressed text builds the same reviews."""
+    compressed = review_store.compress_text(block_size=8)
+    assert isinstance(compressed.columns["text"], CompressedStringColumn)
+    assert isinstance(compressed.columns["summary"], CompressedStringColumn)
+    assert compressed.columns["score"] is review_store.columns["score"]
+    assert compressed.reviews(slice(0, 3)) == review_store.reviews(slice(0, 3))
+    rebuilt = ReviewStore.from_arrays(compressed.to_arrays())
+    assert rebuilt.reviews(slice(0, 3)) == review_store.reviews(slice(0, 3))
+
+    builder = ReviewStoreBuilder()
+    builder.add_store(compressed)
+    merged = builder.build()
+    assert merged.reviews(slice(0, 3)) == review_store.reviews(slice(0, 3))
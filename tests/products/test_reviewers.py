@@ -0,0 +1,62 @@
+"""Test Food Review API reviewers index class definition."""
+
+import pandas as pd
+from pytest import fixture, raises
+
+from food_review_api.products.reviewers import ReviewerIndex
+from food_review_api.products.store import ReviewStoreBuilder
+
+
+@fixture
+def reviews(make_reviews):
+    """Return random reviews of a few users with distinct times."""
+    return make_reviews(
+        60,
+        9,
+        user_id=lambda rng: rng.choice([f"user{i}" for i in range(6)], 60),
+        profile_name=[f"profile{i}" for i in range(60)],
+    )
+
+
+def test_user_rows_are_user_reviews_by_time(reviews, store):
+    """Verify that the rows of a user are their reviews by ascending time."""
+    index = ReviewerIndex(store)
+    for user_id, group in reviews.groupby("user_id"):
+        rows = index.user_rows(user_id)
+        assert (
+            store.columns["id"][rows].tolist()
+            == group.sort_values("time")["id"].tolist()
+        )
+        assert (
+            index.profile_name(user_id)
+            == group.loc[group["time"].idxmax(), "profile_name"]
+        )
+
+
+def test_top_reviewers_by_review_count(reviews, store):
+    """Verify that the top reviewers are the users with most reviews."""
+    top_reviewers = ReviewerIndex(store).top_reviewers(3)
+    value_counts = reviews["user_id"].value_counts()
+    assert [count for _, _, count in top_reviewers] == value_counts[:3].tolist()
+    assert {user_id for user_id, _, _ in top_reviewers} <= set(value_counts.index)
+
+
+def test_unknown_user(store):
+    """Verify that users without reviews are not in the index."""
+    index = ReviewerIndex(store)
+    assert not index.has_user("unknown")
+    with raises(KeyError):
+        index.user_rows("unknown")
+
+
+def test_top_reviewers_skip_users_of_duplicate_reviews(mock_reviews):
+    """Verify that users whose reviews were all dropped as duplicates are not ranked."""
+    duplicate = mock_reviews.iloc[[0]].assign(user_id="user3", profile_name="p3")
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(pd.concat([mock_reviews, duplicate], ignore_index=True))
+    index = ReviewerIndex(builder.build())
+    assert not index.has_user("user3")
+    assert [user_id for user_id, _, _ in index.top_reviewers(10)] == [
+        "user1",
+        "user2",
+    ]
@@ -0,0 +1,106 @@
+"""Test Food Review API reviews full-text search index definition."""
+
+import numpy as np
+from pytest import fixture
+
+from food_review_api.products.search import SearchIndex, tokenize
+from food_review_api.products.store import ReviewStoreBuilder
+
+
+@fixture
+def reviews(make_reviews):
+    """Return reviews with known summaries and texts."""
+    return make_reviews(
+        5,
+        3,
+        product_id=["product1", "product1", "product2", "product2", "product3"],
+        summary=["Stale", "Great taste", "Gluten free", "Tasty", "OK"],
+        text=[
+            "The crackers were stale.<br />Stale, stale, stale.",
+            "Fresh and tasty crackers, would buy again.",
+            "Gluten free and still great, not stale at all.",
+            "My dog loves these treats.",
+            "Tasty but a bit stale after a week.",
+        ],
+    )
+
+
+@fixture
+def index(store):
+    """Return the search index of the store."""
+    return SearchIndex(store)
+
+
+def test_tokenize_lowercases_and_ignores_markup():
+    """Verify that tokens are lowercase words, without HTML tags."""
+    assert tokenize("Stale!<br />Gluten-free, 100%") == [
+        "stale",
+        "gluten",
+        "free",
+        "100",
+    ]
+
+
+def test_search_ranks_by_term_frequency(index, store):
+    """Verify that the review repeating the query term most ranks first."""
+    rows, scores, total = index.search("stale", limit=10)
+    ids = store.columns["id"][rows].tolist()
+    assert total == 3
+    assert ids[0] == 0
+    assert set(ids) == {0, 2, 4}
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_search_matches_any_query_term(index):
+    """Verify that reviews matching any term are returned, best matching all."""
+    rows, _, total = index.search("Gluten FREE dog", limit=10)
+    assert total == 2
+    assert len(rows) == 2
+
+
+def test_search_paginates_in_stable_order(index):
+    """Verify that pages concatenate to the unpaginated results."""
+    all_rows, _, _ = index.search("stale tasty", limit=10)
+    pages = [index.search("stale tasty", limit=2, offset=o)[0] for o in (0, 2, 4)]
+    assert [row for page in pages for row in page] == all_rows.tolist()
+
+
+def test_search_filters_rows(index, store):
+    """Verify that only matches within the given rows are returned."""
+    rows = store.product_rows("product2")
+    matches, _, total = index.search("stale tasty", limit=10, rows=rows)
+    assert total == 2
+    assert all(rows.start <= row < rows.stop for row in matches)
+
+
+def test_search_without_matches(index):
+    """Verify that unknown terms and empty queries do not match."""
+    assert index.search("caviar", limit=10)[2] == 0
+    assert index.search("!!!", limit=10)[2] == 0
+
+
+def test_extended_index_equals_index_of_merged_store(index, store, make_reviews):
+    """Verify that extending an index with added rows gives the full index."""
+    added = make_reviews(
+        3,
+        2,
+        id=[10, 11, 12],
+        summary=["Stale again", "New flavor", "Tasty"],
+        text=["Still stale.", "Spicy crackers.", "Crunchy <b>treats</b>."],
+    )
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(added)
+    merged, added_rows = store.merge(builder.build())
+
+    extended = index.extend(merged, added_rows)
+    full = SearchIndex(merged)
+
+    assert extended.terms.keys() == full.terms.keys()
+    assert "spicy" not in index.terms
+    np.testing.assert_array_equal(extended.doc_lengths, full.doc_lengths)
+    for query in ["stale", "tasty crackers", "spicy", "treats"]:
+        docs, scores, total = extended.search(query, limit=10)
+        expected_docs, expected_scores, expected_total = full.search(query, limit=10)
+        np.testing.assert_array_equal(docs, expected_docs)
+        np.testing.assert_allclose(scores, expected_scores)
+        assert total == expected_total
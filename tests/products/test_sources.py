@@ -0,0 +1,46 @@
+"""Test Food Review API reviews source files definitions."""
+
+from pathlib import Path
+
+from pytest import fixture
+
+from food_review_api.products.sources import SourceState, ingestible_size
+
+
+@fixture
+def source(tmp_path: Path) -> Path:
+    """Return a small CSV file."""
+    source = tmp_path / "reviews.csv"
+    source.write_bytes(b"id,text\n1,first\n2,second\n")
+    return source
+
+
+def test_ingestible_size_ignores_partial_last_line(source: Path):
+    """Verify that a line being appended is not ingestible yet."""
+    size = source.stat().st_size
+    assert ingestible_size(str(source)) == size
+    with source.open("ab") as file:
+        file.write(b"3,thi")
+    assert ingestible_size(str(source)) == size
+    assert ingestible_size(str(source.with_name("missing.csv"))) is None
+
+
+def test_appended_range_covers_appended_lines(source: Path):
+    """Verify that the appended range starts where the ingested part ends."""
+    size = source.stat().st_size
+    state = SourceState.of(str(source), size, row_count=2)
+    assert state.appended_range() == (size, size)
+
+    with source.open("ab") as file:
+        file.write(b"3,third\n")
+    assert state.appended_range() == (size, source.stat().st_size)
+
+
+def test_appended_range_detects_modified_prefix(source: Path):
+    """Verify that there is no appended range when ingested bytes changed."""
+    state = SourceState.of(str(source), source.stat().st_size, row_count=2)
+    source.write_bytes(b"id,text\n1,first\n2,SECOND\n3,third\n")
+    assert state.appended_range() is None
+
+    source.write_bytes(b"id,text\n1,first\n")
+    assert state.appended_range() is None
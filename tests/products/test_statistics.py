@@ -0,0 +1,77 @@
+"""Test Food Review API products statistics class definition."""
+
+import numpy as np
+from pytest import fixture
+
+from food_review_api.products.statistics import ProductStatistics
+from food_review_api.products.store import ReviewStore, ReviewStoreBuilder, StringColumn
+
+
+@fixture
+def reviews(make_reviews):
+    """Return random reviews of a few products."""
+    reviews = make_reviews(
+        200,
+        7,
+        user_id=lambda rng: rng.choice([f"user{i}" for i in range(20)], 200),
+        score=lambda rng: rng.integers(1, 6, 200),
+        helpfulness_denominator=lambda rng: rng.integers(0, 4, 200),
+        helpfulness_numerator=lambda rng: rng.integers(0, 4, 200),
+        time=lambda rng: rng.integers(0, 10**9, 200),
+    )
+    reviews["helpfulness_numerator"] %= reviews["helpfulness_denominator"] + 1
+    return reviews
+
+
+def test_statistics_match_pandas_aggregates(reviews, store):
+    """Verify that the statistics of every product match pandas aggregates."""
+    product_statistics = ProductStatistics(store)
+    for product_id, group in reviews.groupby("product_id"):
+        stats = product_statistics.get(store.product_position(product_id))
+        votes = group["helpfulness_denominator"].sum()
+        histogram = group["score"].value_counts().reindex(range(1, 6), fill_value=0)
+        assert stats == {
+            "number_of_reviews": len(group),
+            "mean_score": group["score"].mean(),
+            "median_score": group["score"].median(),
+            "score_histogram": histogram.tolist(),
+            "helpfulness_ratio": group["helpfulness_numerator"].sum() / votes,
+            "distinct_reviewers": group["user_id"].nunique(),
+            "first_review_time": group["time"].min(),
+            "last_review_time": group["time"].max(),
+        }
+
+
+def test_statistics_without_votes(mock_reviews):
+    """Verify that the helpfulness ratio is None for products without votes."""
+    mock_reviews["helpfulness_denominator"] = 0
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(mock_reviews)
+    store = builder.build()
+    stats = ProductStatistics(store).get(store.product_position("product1"))
+    assert stats["helpfulness_ratio"] is None
+    assert stats["score_histogram"] == [1, 0, 1, 0, 0]
+    assert stats["median_score"] == 2.0
+
+
+def test_statistics_of_products_without_reviews(mock_reviews):
+    """Verify that products without rows get zero aggregates, wherever they are."""
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(mock_reviews)
+    store = builder.build()
+    # Empty products before, between and after the products with reviews.
+    store = ReviewStore(
+        product_ids=StringColumn.from_strings(["a", "product1", "b", "product2", "c"]),
+        offsets=np.array([0, 0, 2, 2, 3, 3]),
+        columns=store.columns,
+    )
+    statistics = ProductStatistics(store)
+    empty = statistics.get_many(np.array([0, 2, 4]))
+    assert [stats["number_of_reviews"] for stats in empty] == [0, 0, 0]
+    assert [stats["last_review_time"] for stats in empty] == [0, 0, 0]
+    assert [stats["helpfulness_ratio"] for stats in empty] == [None, None, None]
+    product1, product2 = statistics.get_many(np.array([1, 3]))
+    assert product1["first_review_time"] == 1
+    assert product1["last_review_time"] == 3
+    assert product1["mean_score"] == 2.0
+    assert product2["first_review_time"] == product2["last_review_time"] == 2
@@ -0,0 +1,126 @@
+"""Test Food Review API review store snapshot files definitions."""
+
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from pytest import fixture
+
+from food_review_api.core.config.database import DatabaseConfig
+from food_review_api.products.repository import ProductRepository
+from food_review_api.products.snapshot import ProductSnapshot
+from food_review_api.products.storage import (
+    read_index_snapshot,
+    read_store_snapshot,
+    store_snapshot_path,
+    write_index_snapshot,
+    write_store_snapshot,
+)
+from food_review_api.products.store import ReviewStoreBuilder
+
+
+@fixture
+def reviews_file(tmp_path: Path) -> Path:
+    """Return a copy of a reviews CSV file in a temporary directory."""
+    return Path(shutil.copy("data/reviews_1.csv", tmp_path / "reviews.csv"))
+
+
+def test_store_snapshot_round_trip(tmp_path: Path, mock_reviews):
+    """Verify that a store read from its snapshot holds the same reviews."""
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(mock_reviews)
+    store = builder.build()
+    path = tmp_path / ".reviews.csv.key.snapshot"
+
+    write_store_snapshot(path, store)
+    loaded_store = read_store_snapshot(path)
+
+    assert isinstance(loaded_store.offsets, np.memmap)
+    assert loaded_store.product_ids.tolist() == store.product_ids.tolist()
+    assert loaded_store.reviews(slice(0, 3)) == store.reviews(slice(0, 3))
+
+
+def test_index_snapshot_round_trip(tmp_path: Path, mock_reviews):
+    """Verify that indexes read from a snapshot give the same results."""
+    builder = ReviewStoreBuilder()
+    builder.add_chunk(mock_reviews)
+    store = builder.build()
+    snapshot = ProductSnapshot.build(store)
+    path = tmp_path / ".reviews.csv.key.snapshot"
+    write_store_snapshot(path, store)
+    assert read_index_snapshot(path, store) is None
+
+    write_index_snapshot(path, store, snapshot.to_arrays())
+    loaded_store = read_store_snapshot(path)
+    loaded = ProductSnapshot.from_arrays(
+        loaded_store, read_index_snapshot(path, loaded_store)
+    )
+
+    assert isinstance(loaded.search_index.docs, np.memmap)
+    assert loaded.search("Summary1 text3", limit=5) == snapshot.search(
+        "Summary1 text3", limit=5
+    )
+    assert loaded.ranking.most_reviewed(2) == snapshot.ranking.most_reviewed(2)
+    assert loaded.get_stats("product1") == snapshot.get_stats("product1")
+    assert loaded.reviewers.top_reviewers(2) == snapshot.reviewers.top_reviewers(2)
+    assert loaded.get_user_reviews("user1") == snapshot.get_user_reviews("user1")
+    assert loaded.get_latest_reviews(2) == snapshot.get_latest_reviews(2)
+    assert loaded.get_reviews("product1", sort="-helpfulness") == (
+        snapshot.get_reviews("product1", sort="-helpfulness")
+    )
+
+
+def test_store_snapshot_path_changes_with_source(reviews_file: Path):
+    """Verify that the snapshot path depends on the source file and rows."""
+    db = DatabaseConfig(filename=str(reviews_file))
+    path = store_snapshot_path(db)
+    assert path.parent == reviews_file.parent
+    assert path.name.startswith(".reviews.csv.")
+    assert store_snapshot_path(db) == path
+    assert store_snapshot_path(db.model_copy(update={"max_rows": 10})) != path
+
+    with reviews_file.open("a") as file:
+        file.write("\n")
+    assert store_snapshot_path(db) != path
+
+
+def test_load_uses_up_to_date_snapshot(product_repository, reviews_file: Path):
+    """Verify that load() writes a snapshot, then loads it instead of the CSV."""
+    db = DatabaseConfig(filename=str(reviews_file), snapshot_cache=True)
+    product_repository.load(db)
+    expected = product_repository.get("B001LG945O")
+    assert store_snapshot_path(db).exists()
+
+    with patch(
+        "food_review_api.products.repository.ProductRepository._load_reviews_csv"
+    ) as mock_load_reviews_csv:
+        product_repository.load(db)
+        mock_load_reviews_csv.assert_not_called()
+    assert product_repository.get("B001LG945O") == expected
+
+    # A new process maps the indexes written with the store snapshot.
+    repository = ProductRepository()
+    repository.load(db)
+    assert isinstance(repository.snapshot.search_index.docs, np.memmap)
+    assert repository.get("B001LG945O") == expected
+
+    stat = reviews_file.stat()
+    os.utime(reviews_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    product_repository.load(db)
+    snapshots = list(reviews_file.parent.glob(".reviews.csv.*.snapshot"))
+    assert snapshots == [store_snapshot_path(db)]
+
+
+def test_store_snapshot_path_of_several_sources(reviews_file: Path):
+    """Verify that the snapshot path of several sources depends on all of them."""
+    other_file = Path(shutil.copy("data/reviews_2.csv", reviews_file.parent))
+    db = DatabaseConfig(filename=[str(reviews_file), str(other_file)])
+    path = store_snapshot_path(db)
+    assert path.parent == reviews_file.parent
+    assert path.name.startswith(".reviews.csv+1.")
+
+    with other_file.open("a") as file:
+        file.write("\n")
+    assert store_snapshot_path(db) != path
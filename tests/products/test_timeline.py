@@ -0,0 +1,36 @@
+"""Test Food Review API reviews timeline index class definition."""
+
+from pytest import fixture
+
+from food_review_api.products.timeline import ReviewTimeline
+
+
+@fixture
+def reviews(make_reviews):
+    """Return random reviews of a few products with distinct times."""
+    return make_reviews(40, 5, time=lambda rng: rng.permutation(40) * 10)
+
+
+def test_latest_reviews_by_descending_time(reviews, store):
+    """Verify that the latest reviews are pages of the reviews by time."""
+    timeline = ReviewTimeline(store)
+    expected = reviews.sort_values("time", ascending=False)["id"].tolist()
+    rows, total = timeline.latest(5)
+    assert total == 40
+    assert store.columns["id"][rows].tolist() == expected[:5]
+    rows, _ = timeline.latest(5, offset=37)
+    assert store.columns["id"][rows].tolist() == expected[37:]
+
+
+def test_latest_reviews_in_time_range(reviews, store):
+    """Verify that time range bounds are inclusive."""
+    timeline = ReviewTimeline(store)
+    in_range = reviews[reviews["time"].between(100, 200)]
+    rows, total = timeline.latest(100, since=100, until=200)
+    assert total == len(in_range) == 11
+    assert store.columns["id"][rows].tolist() == (
+        in_range.sort_values("time", ascending=False)["id"].tolist()
+    )
+    rows, total = timeline.latest(10, since=300, until=200)
+    assert total == 0
+    assert len(rows) == 0
@@ -0,0 +1,82 @@
+"""Test Food Review API main module entrypoint definition."""
+
+import socket
+import time
+from http import HTTPStatus
+from importlib import import_module
+from unittest.mock import patch
+
+import httpx
+
+from food_review_api.api.server import create_server_socket
+from food_review_api.core.config import ServerConfig
+from food_review_api.main import main, serve_while_loading
+from food_review_api.products import product_repository
+
+main_module = import_module("food_review_api.main")
+
+
+def test_main_snapshot_command_builds_snapshot(config):
+    """Verify that the `snapshot` command loads the database with snapshots on."""
+    with patch.object(main_module, "product_repository") as mock_product_repository:
+        main(["snapshot"])
+    (db,), _ = mock_product_repository.load.call_args
+    assert db.snapshot_cache
+    assert db.filename == config.database.filename
+
+
+def test_main_without_command_serves(config):
+    """Verify that running without command serves the API with the config."""
+    with patch.object(main_module, "serve") as mock_serve:
+        main([])
+    (served_config,), _ = mock_serve.call_args
+    assert served_config.server == config.server
+
+
+def test_main_serve_command_overrides_server_config():
+    """Verify that the `serve` command options override the server config."""
+    with patch.object(main_module, "serve") as mock_serve:
+        main(["serve", "--workers", "3", "--port", "9000"])
+    (served_config,), _ = mock_serve.call_args
+    assert served_config.server.workers == 3
+    assert served_config.server.port == 9000
+
+
+def test_serve_while_loading_answers_until_reviews_are_loaded(config):
+    """Verify that the API answers during the load, and the socket stays open."""
+    sock = create_server_socket(ServerConfig(host="127.0.0.1", port=0))
+    url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+    responses = {}
+
+    def load_reviews(config):
+        for path in ["/health", "/ready", "/api/v1/reviews?product_id=B001LG945O"]:
+            responses[path] = _get(f"{url}{path}").status_code
+        product_repository.load(config.database)
+
+    try:
+        with patch.object(main_module, "load_reviews", load_reviews):
+            assert serve_while_loading(config, sock)
+        assert responses == {
+            "/health": HTTPStatus.OK,
+            "/ready": HTTPStatus.SERVICE_UNAVAILABLE,
+            "/api/v1/reviews?product_id=B001LG945O": HTTPStatus.SERVICE_UNAVAILABLE,
+        }
+        assert product_repository.snapshot.metadata is not None
+        # The socket still listens, for the workers to be forked.
+        client = socket.create_connection(sock.getsockname(), timeout=1)
+        client.close()
+    finally:
+        sock.close()
+        product_repository.clear()
+
+
+def _get(url: str, timeout: float = 10) -> httpx.Response:
+    """Send a GET request, waiting for the server to be up."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return httpx.get(url)
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)